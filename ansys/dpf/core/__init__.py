@@ -51,7 +51,6 @@ from ansys.dpf.core.collection import Collection
 from ansys.dpf.core.workflow import Workflow
 from ansys.dpf.core.cyclic_support import CyclicSupport
 from ansys.dpf.core.element_descriptor import ElementDescriptor
-from ansys.dpf.core import operators
 from ansys.dpf.core.fields_factory import field_from_array
 from ansys.dpf.core import (
     fields_container_factory,
@@ -62,6 +61,7 @@ from ansys.dpf.core import (
 from ansys.dpf.core import server
 from ansys.dpf.core import check_version
 from ansys.dpf.core import settings
+from ansys.dpf.core.instrumentation import profiling, trace
 
 # for matplotlib
 # solves "QApplication: invalid style override passed, ignoring it."
@@ -96,4 +96,17 @@ SERVER = None
 
 _server_instances = []
 
-settings.set_default_pyvista_config()
\ No newline at end of file
+# these modules are slow to import and only imported on first access
+_LAZY_MODULES = ("operators", "examples", "plotter")
+
+
+def __getattr__(name):
+    if name in _LAZY_MODULES:
+        import importlib
+
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_MODULES))
@@ -1,3 +1,4 @@
+import functools
 from typing import NamedTuple
 
 
@@ -59,6 +60,8 @@ class CacheHandler:
     with the same parameters, the data is directly recovered instead of reevaluated.
     When the setters associated to getters in the input dictionary are called,
     their associated getters' caches are cleared.
+    The number of calls recovered from the cache and of calls evaluated
+    are counted in ``hits`` and ``misses``.
 
     Parameters
     ----------
@@ -81,23 +84,32 @@ class CacheHandler:
         self.setter_to_getter_names = {}
         for getter, setters in self.getter_to_setters_name.items():
             for setter in setters:
-                self.setter_to_getter_names[setter] = getter
+                self.setter_to_getter_names.setdefault(setter, []).append(getter)
 
         self.cached = {}
+        self.hits = 0
+        self.misses = 0
 
     def handle(self, object, func, *args, **kwargs):
-        identifier = MethodIdentifier(func.__name__, args, kwargs)
-        if identifier in self.cached:
-            return self.cached[identifier]
-        elif func.__name__ in self.getter_to_setters_name:
+        if func.__name__ in self.getter_to_setters_name:
+            # only the getters' arguments are hashed, the setters can take arrays
+            identifier = MethodIdentifier(func.__name__, args, kwargs)
+            if identifier in self.cached:
+                self.hits += 1
+                return self.cached[identifier]
+            self.misses += 1
             self.cached[identifier] = func(object, *args, **kwargs)
             setattr(func, "under_cache", False)
             return self.cached[identifier]
         else:
-            if func.__name__ in self.setter_to_getter_names \
-                    and self.setter_to_getter_names[func.__name__] in self.cached:
-                del self.cached[self.setter_to_getter_names[func.__name__]]
-            return func(object, *args, **kwargs)
+            try:
+                return func(object, *args, **kwargs)
+            finally:
+                # cleared after the call, the setter may have called the getters
+                if func.__name__ in self.setter_to_getter_names:
+                    for getter_name in self.setter_to_getter_names[func.__name__]:
+                        if getter_name in self.cached:
+                            del self.cached[getter_name]
 
     def clear(self):
         self.cached = {}
@@ -111,11 +123,55 @@ def _handle_cache(func):
        The method must be used as a decorator.
     """
 
+    @functools.wraps(func)
     def wrapper(self, *args, **kwargs):
         """Call the original function"""
         if hasattr(self, "_cache"):
             return self._cache.handle(self, func, *args, **kwargs)
         else:
-            func(self, *args, **kwargs)
+            return func(self, *args, **kwargs)
 
     return wrapper
+
+
+class OutputCache:
+    """Cache of the outputs of an operator.
+
+    The outputs are stored by key (output pin and requested type) with the
+    state of the graph of operators computing them. A cached output is only
+    returned while this state is unchanged, which means that no connection
+    was made on the operator or on any operator upstream of it since the
+    output was evaluated.
+
+    The number of outputs recovered from the cache and of outputs evaluated
+    are counted in ``hits`` and ``misses``.
+    """
+
+    def __init__(self):
+        self.cached = {}
+        self.hits = 0
+        self.misses = 0
+
+    def handle(self, key, state, evaluate):
+        """Return the cached output for a key and a state, or evaluate it.
+
+        Parameters
+        ----------
+        key : hashable
+            Identifier of the output.
+        state : hashable
+            State of the graph computing the output.
+        evaluate : callable
+            Function evaluating the output when it is not cached.
+        """
+        entry = self.cached.get(key)
+        if entry is not None and entry[0] == state:
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        output = evaluate()
+        self.cached[key] = (state, output)
+        return output
+
+    def clear(self):
+        self.cached = {}
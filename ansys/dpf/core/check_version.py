@@ -5,7 +5,6 @@ Used to verify if the server version is a minimum value.
 """
 
 from ansys.dpf.core import errors as dpf_errors
-import sys
 
 
 def server_meet_version(required_version, server):
@@ -22,10 +21,17 @@ def server_meet_version(required_version, server):
     -------
     bool
         ``True`` when successful, ``False`` when failed.
+
+    Notes
+    -----
+    The server version is read from the capabilities cached on the server,
+    so no request is sent to the server once they are known.
     """
-    version = get_server_version(server)
-    meets = version_tuple(required_version)
-    return meets_version(version, meets)
+    if server is None:
+        from ansys.dpf import core
+
+        server = core.SERVER
+    return server.capabilities.meets_version(required_version)
 
 
 def server_meet_version_and_raise(required_version, server, msg=None):
@@ -180,8 +186,10 @@ def version_requires(min_version):
             if func_name == "_set_ids" and isinstance(self, scoping.Scoping):
                 ids = args[0]
                 size = len(ids)
-                if size != 0:
-                    max_size = 8.0e6 // sys.getsizeof(ids[0])
+                capabilities = server.capabilities
+                if size != 0 and not capabilities.meets_version(min_version):
+                    # the ids are sent as int32
+                    max_size = capabilities.max_message_size // 4
                     if size > max_size:
                         server.check_version(min_version)
             # default case, just check the compatibility
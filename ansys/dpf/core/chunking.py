@@ -0,0 +1,182 @@
+"""
+.. _ref_chunking:
+
+Chunking
+========
+Sizes the chunks of the arrays and files streamed to the DPF servers.
+
+Each server has a chunk size for the arrays (field data, scoping IDs) and one
+for the files. A chunk holds a whole number of values of the array's type.
+When the adaptive chunking is enabled, the throughput of each large upload
+is measured and the chunk size is doubled or halved for the next one: it
+keeps moving in the same direction while the throughput improves, and turns
+back when it drops. The chunk size stays between the minimum and maximum
+tunables, and below the maximum message size of the server.
+
+The tunables are set with :func:`ansys.dpf.core.settings.set_chunk_sizes`
+and the statistics of the uploads are returned by
+:func:`ansys.dpf.core.settings.get_chunk_size_stats`.
+"""
+import threading
+
+from ansys.dpf.core import misc
+
+# relative drop of throughput from which the chunk size adaptation turns back
+_TOLERANCE = 0.1
+# minimum number of chunks of an upload for its throughput to be considered
+_MIN_CHUNKS = 4
+
+KINDS = ("arrays", "files")
+
+
+class ChunkSizePolicy:
+    """Size in bytes of the chunks of one kind of upload to a server.
+
+    Parameters
+    ----------
+    kind : str
+        ``"arrays"`` or ``"files"``.
+    max_message_size : int, optional
+        Maximum size in bytes of a message accepted by the server. The
+        default is ``None``, in which case only the tunables bound the size.
+    """
+
+    def __init__(self, kind, max_message_size=None):
+        if kind not in KINDS:
+            raise ValueError(f"kind must be one of {KINDS}, not {kind!r}")
+        self.kind = kind
+        self.max_message_size = max_message_size
+        self._lock = threading.Lock()
+        self.transfers = 0
+        self.bytes = 0
+        self.seconds = 0.0
+        self.adaptations = 0
+        self._reset(self._tunables())
+
+    def _tunables(self):
+        if self.kind == "arrays":
+            initial = misc.DEFAULT_ARRAY_CHUNK_SIZE
+        else:
+            initial = misc.DEFAULT_FILE_CHUNK_SIZE
+        return (
+            int(initial),
+            int(misc.MIN_CHUNK_SIZE),
+            int(misc.MAX_CHUNK_SIZE),
+            bool(misc.ADAPTIVE_CHUNK_SIZE),
+        )
+
+    def _reset(self, tunables):
+        self._settings = tunables
+        initial, minimum, maximum, _ = tunables
+        # an initial size set out of the bounds widens them
+        self.minimum = max(min(minimum, initial), 1)
+        self.maximum = max(maximum, initial)
+        if self.max_message_size:
+            self.maximum = min(self.maximum, self.max_message_size)
+            self.minimum = min(self.minimum, self.maximum)
+        self.size = min(max(initial, self.minimum), self.maximum)
+        self._direction = 1
+        self._last_throughput = None
+
+    def chunk_size(self):
+        """Current size in bytes of the chunks."""
+        tunables = self._tunables()
+        if tunables != self._settings:
+            with self._lock:
+                self._reset(tunables)
+        return self.size
+
+    def n_items(self, itemsize):
+        """Number of values of ``itemsize`` bytes in a chunk."""
+        return max(self.chunk_size() // itemsize, 1)
+
+    def record(self, n_bytes, seconds):
+        """Record an upload and adapt the chunk size to its throughput.
+
+        Parameters
+        ----------
+        n_bytes : int
+            Number of bytes sent.
+        seconds : float
+            Duration of the upload.
+        """
+        with self._lock:
+            self.transfers += 1
+            self.bytes += n_bytes
+            self.seconds += seconds
+            adaptive = self._settings[3]
+            if not adaptive or seconds <= 0 or n_bytes < _MIN_CHUNKS * self.size:
+                return
+            throughput = n_bytes / seconds
+            if (
+                self._last_throughput is not None
+                and throughput < (1.0 - _TOLERANCE) * self._last_throughput
+            ):
+                self._direction = -self._direction
+            self._last_throughput = throughput
+            if self._direction > 0:
+                size = min(2 * self.size, self.maximum)
+            else:
+                size = max(self.size // 2, self.minimum)
+            if size != self.size:
+                self.size = size
+                self.adaptations += 1
+
+    def stats(self):
+        """Statistics of the uploads and state of the policy.
+
+        Returns
+        -------
+        dict
+        """
+        return {
+            "chunk_size": self.size,
+            "min_chunk_size": self.minimum,
+            "max_chunk_size": self.maximum,
+            "adaptive": self._settings[3],
+            "transfers": self.transfers,
+            "bytes": self.bytes,
+            "seconds": self.seconds,
+            "throughput": self.bytes / self.seconds if self.seconds else None,
+            "adaptations": self.adaptations,
+        }
+
+    def __repr__(self):
+        return (
+            f"ChunkSizePolicy({self.kind!r}, chunk_size={self.size}, "
+            f"transfers={self.transfers})"
+        )
+
+
+# policies of the uploads made without a server, which is not expected
+_DEFAULT_POLICIES = {}
+
+
+def policy(server, kind):
+    """Chunk size policy of a kind of upload to a server.
+
+    Parameters
+    ----------
+    server : ansys.dpf.core.server.DpfServer
+        Server receiving the uploads. ``None`` is accepted, in which case the
+        message size of the server is not considered.
+    kind : str
+        ``"arrays"`` or ``"files"``.
+
+    Returns
+    -------
+    ChunkSizePolicy
+    """
+    if server is None:
+        policies = _DEFAULT_POLICIES
+        max_message_size = None
+    else:
+        policies = getattr(server, "_chunk_size_policies", None)
+        if policies is None:
+            policies = {}
+            server._chunk_size_policies = policies
+        max_message_size = server.capabilities.max_message_size
+    chunk_policy = policies.get(kind)
+    if chunk_policy is None:
+        chunk_policy = policies.setdefault(kind, ChunkSizePolicy(kind, max_message_size))
+    return chunk_policy
@@ -284,7 +284,7 @@ class Collection:
         request.collection.CopyFrom(self._message)
         request.label = label
         scoping_message = self._stub.GetLabelScoping(request)
-        scoping = Scoping(scoping_message.label_scoping)
+        scoping = Scoping(scoping_message.label_scoping, server=self._server)
         return scoping
 
     def __getitem__(self, index):
@@ -3,17 +3,22 @@ Core
 ====
 """
 import os
+import hashlib
 import logging
+import mmap
+import queue
+import threading
 import time
 import weakref
 import pathlib
+from concurrent.futures import ThreadPoolExecutor
 
 import grpc
 
 from ansys.grpc.dpf import base_pb2, base_pb2_grpc
 from ansys.dpf.core.errors import protect_grpc
 from ansys.dpf.core import server as serverlib
-from ansys.dpf.core import misc
+from ansys.dpf.core import chunking, instrumentation, misc
 from ansys.dpf.core.common import _common_progress_bar
 
 LOG = logging.getLogger(__name__)
@@ -259,7 +264,258 @@ def _description(dpf_entity_message, server=None):
     -------
        description : str
     """
-    return BaseService(server, load_operators=False)._description(dpf_entity_message)
+    if server is None:
+        server = serverlib._global_server()
+    return server._base_service._description(dpf_entity_message)
+
+
+class _ReadAhead:
+    """Chunks of a file read by a background thread ahead of their use.
+
+    Parameters
+    ----------
+    file_path : str
+        File to read.
+    chunk_size : int
+        Size of the chunks in bytes.
+    depth : int
+        Maximum number of chunks read in advance.
+    """
+
+    def __init__(self, file_path, chunk_size, depth):
+        self._queue = queue.Queue(max(depth, 1))
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._read, args=(file_path, chunk_size), daemon=True
+        )
+        self._thread.start()
+
+    def _put(self, item):
+        # gives up when the iteration stopped before the end of the file
+        while not self._stopped.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _read(self, file_path, chunk_size):
+        try:
+            with open(file_path, "rb") as f:
+                while True:
+                    piece = f.read(chunk_size)
+                    if not self._put(piece) or not piece:
+                        return
+        except Exception as e:
+            self._put(e)
+
+    def __iter__(self):
+        try:
+            while True:
+                piece = self._queue.get()
+                if isinstance(piece, Exception):
+                    raise piece
+                if not piece:
+                    return
+                yield piece
+        finally:
+            self._stopped.set()
+
+
+class _WriteBehind:
+    """Writes chunks in files on a background thread while the next ones are received.
+
+    Parameters
+    ----------
+    depth : int
+        Maximum number of chunks waiting to be written.
+    """
+
+    def __init__(self, depth):
+        self._queue = queue.Queue(max(depth, 1))
+        self._error = None
+        self._thread = threading.Thread(target=self._write, daemon=True)
+        self._thread.start()
+
+    def _write(self):
+        f = None
+        while True:
+            action, value = self._queue.get()
+            if self._error is None:
+                try:
+                    if action == "write":
+                        f.write(value)
+                    else:
+                        if f is not None:
+                            f.close()
+                            f = None
+                        if action == "open":
+                            f = open(value, "wb")
+                except Exception as e:
+                    self._error = e
+            if action == "finish":
+                if f is not None:
+                    f.close()
+                return
+
+    def _check(self):
+        if self._error is not None:
+            raise self._error
+
+    def open(self, path):
+        """Write the next chunks in a new file."""
+        self._check()
+        self._queue.put(("open", path))
+
+    def write(self, data):
+        self._check()
+        self._queue.put(("write", data))
+
+    def close(self):
+        """Close the current file."""
+        self._queue.put(("close", None))
+
+    def finish(self):
+        """Wait for the chunks to be written."""
+        self._queue.put(("finish", None))
+        self._thread.join()
+        self._check()
+
+
+class _Progress:
+    """Progress bar of transfers, updated from several threads."""
+
+    def __init__(self, text, tot_size):
+        self._lock = threading.Lock()
+        self._value = 0
+        self._bar = None
+        # the bar is only shown for transfers of more than 10 MB
+        if tot_size > 10000:
+            self._bar = _common_progress_bar(text, "KB", tot_size)
+            self._bar.start()
+        self._tot_size = tot_size
+
+    def update(self, n_bytes):
+        with self._lock:
+            self._value += n_bytes * 1e-3
+            if self._bar is not None:
+                try:
+                    self._bar.update(min(self._value, self._tot_size))
+                except:
+                    pass
+
+    def finish(self):
+        if self._bar is not None:
+            try:
+                self._bar.finish()
+            except:
+                pass
+
+
+# digests of the files already hashed, by path, size and modification time
+_DIGESTS = {}
+_DIGESTS_LOCK = threading.Lock()
+# size of the blocks hashed at a time, and of the blocks of a sampled file
+_HASH_BLOCK_SIZE = 8 * 2**20
+_SAMPLE_SIZE = 2**20
+_N_SAMPLES = 64
+
+
+def _file_digest(file_path):
+    """Hash the content of a file.
+
+    The file is memory-mapped and hashed block by block. The files larger
+    than ``misc.UPLOAD_CACHE_SAMPLING`` bytes are only hashed on their size
+    and on evenly spaced blocks, including the first and last ones. The
+    digest of an unmodified file is not computed again.
+
+    Parameters
+    ----------
+    file_path : str
+        Path of a non empty file.
+
+    Returns
+    -------
+    str
+    """
+    stat = os.stat(file_path)
+    size = stat.st_size
+    sampling = misc.UPLOAD_CACHE_SAMPLING
+    sampled = sampling is not None and size > max(sampling, _N_SAMPLES * _SAMPLE_SIZE)
+    key = (os.path.abspath(file_path), size, stat.st_mtime_ns, sampled)
+    digest = _DIGESTS.get(key)
+    if digest is not None:
+        return digest
+    hasher = hashlib.blake2b(size.to_bytes(8, "little"))
+    with open(file_path, "rb") as f, mmap.mmap(
+        f.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mapped:
+        if sampled:
+            step = (size - _SAMPLE_SIZE) / (_N_SAMPLES - 1)
+            offsets = [int(i * step) for i in range(_N_SAMPLES)]
+            blocks = [(offset, _SAMPLE_SIZE) for offset in offsets]
+        else:
+            blocks = [
+                (offset, _HASH_BLOCK_SIZE) for offset in range(0, size, _HASH_BLOCK_SIZE)
+            ]
+        view = memoryview(mapped)
+        try:
+            for offset, length in blocks:
+                hasher.update(view[offset : offset + length])
+        finally:
+            view.release()
+    digest = hasher.hexdigest()
+    with _DIGESTS_LOCK:
+        _DIGESTS[key] = digest
+    return digest
+
+
+class _UploadCache:
+    """Server paths of the files uploaded to a server, by content.
+
+    The cache of a server is dropped when the process of the server
+    changes, which is when the server was restarted.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._process_id = None
+        self._paths = {}
+
+    @staticmethod
+    def of(server):
+        """Upload cache of a server."""
+        cache = getattr(server, "_upload_cache", None)
+        if cache is None:
+            cache = _UploadCache()
+            server._upload_cache = cache
+        return cache
+
+    def check_process(self, process_id):
+        """Drop the paths uploaded to a previous process of the server."""
+        with self._lock:
+            if process_id != self._process_id:
+                self._paths.clear()
+                self._process_id = process_id
+
+    def get(self, key):
+        with self._lock:
+            return self._paths.get(key)
+
+    def add(self, key, server_file_path):
+        with self._lock:
+            # an upload to the same server path replaces the previous file
+            self._paths = {
+                other_key: path
+                for other_key, path in self._paths.items()
+                if path != server_file_path
+            }
+            self._paths[key] = server_file_path
+
+    def remove(self, key):
+        with self._lock:
+            self._paths.pop(key, None)
 
 
 class BaseService:
@@ -445,6 +701,7 @@ class BaseService:
         return separator
 
     @protect_grpc
+    @instrumentation.traced
     def download_file(self, server_file_path, to_client_file_path):
         """Download a file from the server to the target client file path
 
@@ -466,14 +723,20 @@ class BaseService:
         bar = _common_progress_bar("Downloading...", unit="KB")
         bar.start()
         i = 0
-        with open(to_client_file_path, "wb") as f:
+        # the chunks are written while the next ones are received
+        writer = _WriteBehind(misc.FILE_TRANSFER_READ_AHEAD)
+        try:
+            writer.open(to_client_file_path)
             for chunk in chunks:
-                f.write(chunk.data.data)
+                writer.write(chunk.data.data)
                 i += len(chunk.data.data) * 1e-3
                 bar.update(i)
+        finally:
+            writer.finish()
         bar.finish()
 
     @protect_grpc
+    @instrumentation.traced
     def download_files_in_folder(
         self, server_folder_path, to_client_folder_path, specific_extension=None
     ):
@@ -512,12 +775,41 @@ class BaseService:
         bar = _common_progress_bar("Downloading...", unit="files", tot_size=num_files)
         bar.start()
 
-        server_path = ""
+        client_paths = []
+        # the chunks are written while the next ones are received
+        writer = _WriteBehind(misc.FILE_TRANSFER_READ_AHEAD)
+        try:
+            self._write_folder_chunks(
+                chunks,
+                writer,
+                server_folder_path,
+                to_client_folder_path,
+                specific_extension,
+                client_paths,
+                bar,
+            )
+        finally:
+            writer.finish()
+        try:
+            bar.finish()
+        except:
+            pass
+        return client_paths
 
+    def _write_folder_chunks(
+        self,
+        chunks,
+        writer,
+        server_folder_path,
+        to_client_folder_path,
+        specific_extension,
+        client_paths,
+        bar,
+    ):
         import ntpath
 
-        client_paths = []
-        f = None
+        server_path = ""
+        writing = False
         for chunk in chunks:
             if chunk.data.server_file_path != server_path:
                 server_path = chunk.data.server_file_path
@@ -548,22 +840,20 @@ class BaseService:
                         to_client_folder_path_copy, ntpath.basename(server_path)
                     )
                     client_paths.append(cient_path)
-                    f = open(cient_path, "wb")
+                    writer.open(cient_path)
+                    writing = True
                     try:
                         bar.update(len(client_paths))
                     except:
                         pass
                 else:
-                    f = None
-            if f is not None:
-                f.write(chunk.data.data)
-        try:
-            bar.finish()
-        except:
-            pass
-        return client_paths
+                    writer.close()
+                    writing = False
+            if writing:
+                writer.write(chunk.data.data)
 
     @protect_grpc
+    @instrumentation.traced
     def upload_files_in_folder(
         self, to_server_folder_path, client_folder_path, specific_extension=None
     ):
@@ -582,39 +872,46 @@ class BaseService:
         specific_extension (optional) : str
             copies only the files with the given extension
 
+        Notes
+        -----
+        The files are uploaded concurrently, see
+        :func:`ansys.dpf.core.settings.set_file_transfers`, and a single
+        progress bar is printed for all of them. When the upload of a file
+        fails, the other files are still uploaded before the error is raised.
+
         Returns
         -------
         paths : list of str
             new file paths server side
         """
-        server_paths = []
+        uploads = []
         for root, subdirectories, files in os.walk(client_folder_path):
             for subdirectory in subdirectories:
                 subdir = os.path.join(root, subdirectory)
                 for filename in os.listdir(subdir):
                     f = os.path.join(subdir, filename)
-                    server_paths = self._upload_and_get_server_path(
+                    self._add_upload(
+                        uploads,
                         specific_extension,
                         f,
                         filename,
-                        server_paths,
                         to_server_folder_path,
                         subdirectory,
                     )
             for file in files:
                 f = os.path.join(root, file)
-                server_paths = self._upload_and_get_server_path(
-                    specific_extension, f, file, server_paths, to_server_folder_path
+                self._add_upload(
+                    uploads, specific_extension, f, file, to_server_folder_path
                 )
             break
-        return server_paths
+        return self._upload_files(uploads)
 
-    def _upload_and_get_server_path(
+    def _add_upload(
         self,
+        uploads,
         specific_extension,
         f,
         filename,
-        server_paths,
         to_server_folder_path,
         subdirectory=None,
     ):
@@ -629,15 +926,40 @@ class BaseService:
         if ((specific_extension is not None) and (f.endswith(specific_extension))) or (
             specific_extension is None
         ):
-            server_path = self._stub.UploadFile(
+            uploads.append((f, to_server_file_path))
+
+    def _upload_files(self, uploads):
+        """Upload files concurrently and return their server paths in order.
+
+        Parameters
+        ----------
+        uploads : list of tuple
+            Client file path and target server file path of each file.
+        """
+        if not uploads:
+            return []
+        progress = _Progress(
+            "Uploading...", sum(os.path.getsize(f) for f, _ in uploads) * 1e-3
+        )
+
+        def upload(file_path, to_server_file_path):
+            return self._stub.UploadFile(
                 self.__file_chunk_yielder(
-                    file_path=f, to_server_file_path=to_server_file_path
+                    file_path=file_path,
+                    to_server_file_path=to_server_file_path,
+                    progress=progress,
                 )
             ).server_file_path
-            server_paths.append(server_path)
-        return server_paths
+
+        n_workers = min(max(misc.FILE_TRANSFER_WORKERS, 1), len(uploads))
+        # the pool waits for all the uploads, even when one of them fails
+        with ThreadPoolExecutor(n_workers, thread_name_prefix="dpf-upload") as pool:
+            futures = [pool.submit(upload, *paths) for paths in uploads]
+        progress.finish()
+        return [future.result() for future in futures]
 
     @protect_grpc
+    @instrumentation.traced
     def upload_file(self, file_path, to_server_file_path):
         """Upload a file from the client to the target server file path
 
@@ -665,6 +987,7 @@ class BaseService:
         ).server_file_path
 
     @protect_grpc
+    @instrumentation.traced
     def upload_file_in_tmp_folder(self, file_path, new_file_name=None):
         """Upload a file from the client to the server in a temporary folder
         deleted when the server is shutdown
@@ -680,7 +1003,12 @@ class BaseService:
 
         Notes
         -----
-        Print a progress bar
+        Print a progress bar.
+
+        When the upload cache is enabled, see
+        :func:`ansys.dpf.core.settings.set_upload_cache`, a file already
+        uploaded with the same content and name to the running server is not
+        uploaded again, and its server path is returned.
 
         Returns
         -------
@@ -693,43 +1021,69 @@ class BaseService:
             file_name = os.path.basename(file_path)
         if os.stat(file_path).st_size == 0:
             raise ValueError(file_path + " is empty")
-        return self._stub.UploadFile(
+        cache = None
+        if misc.UPLOAD_CACHE:
+            cache = _UploadCache.of(self._server())
+            cache.check_process(self.server_info["server_process_id"])
+            key = (_file_digest(file_path), file_name)
+            server_file_path = cache.get(key)
+            if server_file_path is not None:
+                if self._is_uploaded(file_path, server_file_path):
+                    return server_file_path
+                cache.remove(key)
+        server_file_path = self._stub.UploadFile(
             self.__file_chunk_yielder(
                 file_path=file_path, to_server_file_path=file_name, use_tmp_dir=True
             )
         ).server_file_path
+        if cache is not None:
+            cache.add(key, server_file_path)
+        return server_file_path
+
+    def _is_uploaded(self, file_path, server_file_path):
+        """Check that a server file is still there and starts like a client file.
+
+        The content of the client file is identified by its digest, and the
+        cache is dropped when the server restarts, so only the first chunk of
+        the server file is downloaded before the stream is cancelled.
+        """
+        request = base_pb2.DownloadFileRequest()
+        request.server_file_path = server_file_path
+        chunks = self._stub.DownloadFile(request)
+        try:
+            data = next(chunks).data.data
+        except (StopIteration, grpc.RpcError):
+            return False
+        finally:
+            chunks.cancel()
+        if not data:
+            return False
+        with open(file_path, "rb") as f:
+            return f.read(len(data)) == data
 
     def _prepare_shutdown(self):
         self._stub.PrepareShutdown(base_pb2.Empty())
 
-    def __file_chunk_yielder(self, file_path, to_server_file_path, use_tmp_dir=False):
+    def __file_chunk_yielder(
+        self, file_path, to_server_file_path, use_tmp_dir=False, progress=None
+    ):
         request = base_pb2.UploadFileRequest()
         request.server_file_path = to_server_file_path
         request.use_temp_dir = use_tmp_dir
 
-        tot_size = os.path.getsize(file_path) * 1e-3
-
-        need_progress_bar = tot_size > 10000
-        if need_progress_bar:
-            bar = _common_progress_bar("Uploading...", "KB", tot_size)
-            bar.start()
-        i = 0
-        with open(file_path, "rb") as f:
-            while True:
-                piece = f.read(misc.DEFAULT_FILE_CHUNK_SIZE)
-                if len(piece) == 0:
-                    break
-                request.data.data = piece
-                yield request
-                i += len(piece) * 1e-3
-                if need_progress_bar:
-                    try:
-                        bar.update(min(i, tot_size))
-                    except:
-                        pass
-
-        if need_progress_bar:
-            try:
-                bar.finish()
-            except:
-                pass
+        own_progress = progress is None
+        if own_progress:
+            progress = _Progress("Uploading...", os.path.getsize(file_path) * 1e-3)
+        chunk_policy = chunking.policy(self._server(), "files")
+        chunk_size = chunk_policy.chunk_size()
+        start = time.perf_counter()
+        # the next chunks are read from the disk while one is sent
+        for piece in _ReadAhead(file_path, chunk_size, misc.FILE_TRANSFER_READ_AHEAD):
+            request.data.data = piece
+            yield request
+            progress.update(len(piece))
+        # the chunks are consumed as gRPC sends them
+        chunk_policy.record(os.path.getsize(file_path), time.perf_counter() - start)
+
+        if own_progress:
+            progress.finish()
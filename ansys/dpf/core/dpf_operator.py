@@ -9,11 +9,14 @@ Provides an interface to the underlying gRPC operator.
 import functools
 import logging
 
+from ansys.dpf.core import instrumentation, misc
+from ansys.dpf.core.cache import OutputCache
 from ansys.dpf.core import server as serverlib
 from ansys.dpf.core.config import Config
 from ansys.dpf.core.errors import protect_grpc
 from ansys.dpf.core.inputs import Inputs
 from ansys.dpf.core.mapping_types import types
+from ansys.dpf.core.operator_specification import get_specification
 from ansys.dpf.core.outputs import Output, Outputs, _Outputs
 from ansys.grpc.dpf import base_pb2, operator_pb2, operator_pb2_grpc
 
@@ -71,16 +74,21 @@ class Operator:
         self._description = None
         self._inputs = None
         self._outputs = None
+        # connections recorded in deferred mode and operators connected in input
+        self._pending_connections = {}
+        self._input_operators = {}
+        # incremented on each change of the inputs, to invalidate the cached outputs
+        self._inputs_version = 0
+        self._output_cache = None
 
         self.__send_init_request(config)
 
-        # add dynamic inputs
-        if len(self._message.spec.map_input_pin_spec) > 0 and self._inputs == None:
-            self._inputs = Inputs(self._message.spec.map_input_pin_spec, self)
-        if len(self._message.spec.map_output_pin_spec) != 0 and self._outputs == None:
-            self._outputs = Outputs(self._message.spec.map_output_pin_spec, self)
-
-        self._description = self._message.spec.description
+        # the parsed specification is shared by all the operators with this name,
+        # the dynamic inputs and outputs are created from it on first access
+        self._specification = get_specification(
+            name, self._server, config, self._message.spec
+        )
+        self._description = self._specification.description
 
     def _add_sub_res_operators(self, sub_results):
         """Dynamically add operators for instantiating subresults.
@@ -147,7 +155,18 @@ class Operator:
         _fillConnectionRequestMessage(request, inpt, pin_out)
         if inpt is self:
             raise ValueError("Cannot connect to itself.")
-        self._stub.Update(request)
+        if misc.DEFERRED_CONNECTIONS:
+            # a new connection on a pin replaces the previous one, the input
+            # is kept so that its server entity lives until the request is sent
+            self._pending_connections[pin] = (request, inpt)
+        else:
+            self._stub.Update(request)
+        self._inputs_version += 1
+        input_operator = _input_operator(inpt)
+        if input_operator is not None:
+            self._input_operators[pin] = input_operator
+        else:
+            self._input_operators.pop(pin, None)
 
     @protect_grpc
     def get_output(self, pin=0, output_type=None):
@@ -165,7 +184,18 @@ class Operator:
         type
             Output of the operator.
         """
-
+        with instrumentation.span("Operator.get_output", operator=self.name, pin=pin):
+            if output_type is not None and self._output_cache is not None:
+                key = (pin, tuple(output_type) if isinstance(output_type, list) else output_type)
+                return self._output_cache.handle(
+                    key,
+                    _graph_state(self),
+                    lambda: self._evaluate_output(pin, output_type),
+                )
+            return self._evaluate_output(pin, output_type)
+
+    def _evaluate_output(self, pin, output_type):
+        _submit_pending_connections([self])
         request = operator_pb2.OperatorEvaluationRequest()
         request.op.CopyFrom(self._message)
         request.pin = pin
@@ -210,6 +240,55 @@ class Operator:
         request.op.CopyFrom(self._message)
         request.config.CopyFrom(value._message)
         self._stub.UpdateConfig(request)
+        self._inputs_version += 1
+
+    def enable_output_cache(self, enabled=True):
+        """Enable or disable the cache of the outputs of this operator.
+
+        When enabled, the outputs retrieved with a requested type, for example
+        with ``operator.outputs.fields_container()``, are kept and returned
+        again without evaluating the operator until an input of this operator
+        or of an operator upstream of it is connected again. The same Python
+        object is then returned by each call.
+
+        Changes made in place on the entities connected in input, for example
+        on a field's data, are not detected: connect the input again
+        or clear the cache with ``operator.output_cache.clear()``.
+
+        Parameters
+        ----------
+        enabled : bool, optional
+            Whether to cache the outputs. The default is ``True``.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.simple_bar)
+        >>> disp_op = model.results.displacement()
+        >>> disp_op.enable_output_cache()
+        >>> fc = disp_op.outputs.fields_container()
+        >>> fc is disp_op.outputs.fields_container()
+        True
+        >>> disp_op.output_cache.hits
+        1
+
+        """
+        if not enabled:
+            self._output_cache = None
+        elif self._output_cache is None:
+            self._output_cache = OutputCache()
+
+    @property
+    def output_cache(self):
+        """Cache of the outputs with its ``hits`` and ``misses`` counts.
+
+        Returns
+        -------
+        :class:`ansys.dpf.core.cache.OutputCache`
+            ``None`` when the outputs are not cached.
+        """
+        return self._output_cache
 
     @property
     def inputs(self):
@@ -231,7 +310,8 @@ class Operator:
         >>> disp_op.inputs.data_sources(data_src)
 
         """
-
+        if self._inputs is None and len(self._specification.inputs) > 0:
+            self._inputs = Inputs(self._specification.inputs, self)
         return self._inputs
 
     @property
@@ -255,6 +335,12 @@ class Operator:
         >>> disp_fc = disp_op.outputs.fields_container()
 
         """
+        if self._outputs is None and len(self._specification.outputs) > 0:
+            self._outputs = Outputs(
+                self._specification.outputs,
+                self,
+                self._specification.outputs_by_type,
+            )
         return self._outputs
 
     @staticmethod
@@ -335,16 +421,16 @@ class Operator:
         >>> normfc = math.norm_fc(disp_op).eval()
 
         """
-
-        if not pin:
-            if self.outputs != None and len(self.outputs._outputs) > 0:
-                return self.outputs._outputs[0]()
+        with instrumentation.span("Operator.eval", operator=self.name):
+            if not pin:
+                if self.outputs != None and len(self.outputs._outputs) > 0:
+                    return self.outputs._outputs[0]()
+                else:
+                    self.run()
             else:
-                self.run()
-        else:
-            for output in self.outputs._outputs:
-                if output._pin == pin:
-                    return output()
+                for output in self.outputs._outputs:
+                    if output._pin == pin:
+                        return output()
 
     def _find_outputs_corresponding_pins(
         self, type_names, inpt, pin, corresponding_pins
@@ -478,6 +564,57 @@ class Operator:
         return op
 
 
+def _input_operator(inpt):
+    """Return the operator evaluated to compute an input, if any."""
+    if isinstance(inpt, Operator):
+        return inpt
+    elif isinstance(inpt, Output):
+        return inpt._operator
+    return None
+
+
+def _upstream_operators(operator):
+    """Iterate over an operator and all the operators upstream of it."""
+    visited = set()
+    stack = [operator]
+    while stack:
+        op = stack.pop()
+        if id(op) in visited:
+            continue
+        visited.add(id(op))
+        yield op
+        stack.extend(op._input_operators.values())
+
+
+def _graph_state(operator):
+    """Return the state of the inputs of an operator and of its upstream operators."""
+    return frozenset((id(op), op._inputs_version) for op in _upstream_operators(operator))
+
+
+@protect_grpc
+def _submit_pending_connections(operators):
+    """Send the connections recorded in deferred mode.
+
+    The connections of the operators and of all the operators upstream of
+    them are sent as concurrent requests, so that a whole graph costs about
+    one round trip to the server.
+    """
+    requests = []
+    visited = set()
+    for operator in operators:
+        for op in _upstream_operators(operator):
+            if id(op) in visited:
+                continue
+            visited.add(id(op))
+            for request, inpt in op._pending_connections.values():
+                requests.append((op._stub, request, inpt))
+            op._pending_connections = {}
+    # the inputs are referenced by ``requests`` until the connections are done
+    futures = [stub.Update.future(request) for stub, request, _ in requests]
+    for future in futures:
+        future.result()
+
+
 def _write_output_type_to_proto_style(output_type, request):
     subtype = ""
     stype = ""
@@ -6,7 +6,7 @@ Elements
 from enum import Enum
 
 import numpy as np
-from ansys.dpf.core import field, nodes, property_field, scoping
+from ansys.dpf.core import field, misc, nodes, property_field, scoping
 from ansys.dpf.core.common import __write_enum_doc__, locations
 from ansys.dpf.core.element_descriptor import ElementDescriptor
 from ansys.dpf.core.errors import protect_grpc
@@ -273,6 +273,10 @@ class Elements:
             Element object.
 
         """
+        if self._mapping_id_to_index is not None:
+            index = self._mapping_id_to_index.get(id)
+            if index is not None:
+                return self.__get_element(elementindex=index)
         return self.__get_element(elementid=id)
 
     def element_by_index(self, index) -> Element:
@@ -406,13 +410,104 @@ class Elements:
         connectivity : list
             List of the node indices to connect to the new element.
 
+        Notes
+        -----
+        Nodes and elements added one at a time are sent to the server
+        together, before the next request is made on the mesh.
+
         """
-        request = meshed_region_pb2.AddRequest(mesh=self._mesh._message)
-        element_request = meshed_region_pb2.ElementRequest(id=id)
-        element_request.connectivity.extend(connectivity)
-        element_request.shape = meshed_region_pb2.ElementShape.Value(shape.upper())
-        request.elements.extend([element_request])
-        self._mesh._stub.Add(request)
+        if isinstance(connectivity, (np.ndarray, np.generic)):
+            connectivity = connectivity.reshape(-1).tolist()
+        self._mesh._add_request().elements.add(
+            id=id,
+            shape=meshed_region_pb2.ElementShape.Value(shape.upper()),
+            connectivity=connectivity,
+        )
+        self._mesh._flush_add_request(nodes._MAX_PENDING_ENTITIES)
+
+    def add_elements_from_arrays(self, ids, types, connectivity, offsets):
+        """Add elements in the mesh from arrays.
+
+        The elements are sent to the server in a few large requests.
+
+        Parameters
+        ----------
+        ids : list of int, numpy.ndarray
+            IDs of the new elements.
+        types : list of int or element_types, numpy.ndarray
+            Types of the new elements, see :class:`element_types`.
+        connectivity : list of int, numpy.ndarray
+            Concatenated node indices of all the new elements.
+        offsets : list of int, numpy.ndarray
+            Index of the first node of each element in ``connectivity``,
+            optionally followed by the size of ``connectivity``.
+
+        Examples
+        --------
+        >>> import ansys.dpf.core as dpf
+        >>> meshed_region = dpf.MeshedRegion(num_nodes=3, num_elements=2)
+        >>> for i, node in enumerate(meshed_region.nodes.add_nodes(3)):
+        ...     node.id = i+1
+        ...     node.coordinates = [float(i), 0.0, 0.0]
+        >>> meshed_region.elements.add_elements_from_arrays(
+        ...     ids=[1, 2],
+        ...     types=[dpf.element_types.Line2, dpf.element_types.Line2],
+        ...     connectivity=[0, 1, 1, 2],
+        ...     offsets=[0, 2],
+        ... )
+        >>> meshed_region.elements.n_elements
+        2
+
+        """
+        ids = np.asarray(ids, dtype=np.int32).reshape(-1)
+        connectivity = np.asarray(connectivity, dtype=np.int32).reshape(-1)
+        offsets = np.asarray(offsets, dtype=np.int64).reshape(-1)
+        if offsets.size == ids.size:
+            offsets = np.append(offsets, connectivity.size)
+        if offsets.size != ids.size + 1 or offsets[-1] != connectivity.size:
+            raise ValueError(
+                "offsets must hold the first connectivity index of each element."
+            )
+        types = np.asarray(
+            [t.value if isinstance(t, element_types) else t for t in types]
+            if np.asarray(types).dtype == object
+            else types,
+            dtype=np.int32,
+        ).reshape(-1)
+        if types.size != ids.size:
+            raise ValueError(f"{types.size} types are given for {ids.size} elements.")
+
+        # one shape request value per distinct element type
+        unique_types, inverse = np.unique(types, return_inverse=True)
+        unique_shapes = [
+            meshed_region_pb2.ElementShape.Value(_shape_of_type(t).upper())
+            for t in unique_types.tolist()
+        ]
+        shapes = np.array(unique_shapes, dtype=np.int32)[inverse].tolist()
+
+        # an element takes an int32 id, a shape and its connectivity
+        values = offsets[1:] + 2 * np.arange(1, ids.size + 1)
+        max_values = max(misc.DEFAULT_ARRAY_CHUNK_SIZE // 4, 1)
+        ids = ids.tolist()
+        offsets = offsets.tolist()
+        connectivity = connectivity.tolist()
+        mesh_message = self._mesh._message
+        stub = self._mesh._stub
+        start = 0
+        while start < len(ids):
+            sent = values[start - 1] if start else 0
+            stop = int(np.searchsorted(values, sent + max_values, side="right"))
+            stop = max(stop, start + 1)
+            request = meshed_region_pb2.AddRequest(mesh=mesh_message)
+            add = request.elements.add
+            for i in range(start, stop):
+                add(
+                    id=ids[i],
+                    shape=shapes[i],
+                    connectivity=connectivity[offsets[i]: offsets[i + 1]],
+                )
+            stub.Add(request)
+            start = stop
 
     @protect_grpc
     def __get_element(self, elementindex=None, elementid=None):
@@ -559,15 +654,23 @@ class Elements:
         """Number of elements"""
         return self._mesh._stub.List(self._mesh._message).num_element
 
+    def _get_ids(self):
+        """Element IDs as an array, read from the mesh topology cache when enabled."""
+        return self._mesh._topology_array(
+            "element_ids", lambda: self.scoping._get_ids(np_array=True)
+        )
+
     def _build_mapping_id_to_index(self):
         """Retrieve the mapping between the IDs and indices of the entity."""
-        return {eid: i for i, eid in enumerate(self.scoping.ids)}
+        return scoping._IdToIndexMap(self._get_ids())
 
     @property
-    def mapping_id_to_index(self) -> dict:
+    def mapping_id_to_index(self):
         """Mapping between the IDs and indices of the entity.
 
         This proprty is useful for mapping scalar results from a field to the meshed region.
+        The mapping is built once from the element scoping and is also used
+        by :func:`map_scoping` and :func:`element_by_id`.
 
         Examples
         --------
@@ -611,15 +714,12 @@ class Elements:
         >>> field = vol.outputs.fields_container()[0]
         >>> ind, mask = elements.map_scoping(field.scoping)
         >>> ind
-        array([0, 1, 2, 3, 4, 5, 6, 7])
+        array([0, 1, 2, 3, 4, 5, 6, 7], dtype=int32)
 
         """
         if external_scope.location in ["Nodal", "NodalElemental"]:
             raise ValueError('Input scope location must be "Nodal"')
-        arr = np.array(list(map(self.mapping_id_to_index.get, external_scope.ids)))
-        mask = arr != None
-        ind = arr[mask].astype(np.int)
-        return ind, mask
+        return self.mapping_id_to_index.map(external_scope._get_ids(np_array=True))
 
     @property
     def has_shell_elements(self) -> bool:
@@ -1254,3 +1354,11 @@ class element_types(Enum):
 element_types.__doc__ = __write_enum_doc__(
     element_types, "Types of elements available in a dpf's mesh."
 )
+
+
+def _shape_of_type(element_type):
+    """Shape, as expected by the mesh creation requests, of an element type."""
+    shape = element_types.shape(element_types(element_type))
+    if shape in ["solid", "shell", "beam"]:
+        return shape
+    return "unknown_shape"
@@ -5,15 +5,22 @@ Field
 =====
 """
 
+import numpy as np
+
 from ansys import dpf
 from ansys.dpf.core import errors, meshed_region, time_freq_support
+from ansys.dpf.core.cache import class_handling_cache
 from ansys.dpf.core.common import locations, natures, types
 from ansys.dpf.core.field_base import _FieldBase, _LocalFieldBase
 from ansys.dpf.core.field_definition import FieldDefinition
 from ansys.dpf.core.plotter import Plotter
 from ansys.grpc.dpf import base_pb2, field_pb2
 
+# natures of the fields read from files by their number of components
+_NATURES_BY_COMPONENT_COUNT = {3: natures.vector, 6: natures.symmatrix}
+
 
+@class_handling_cache
 class Field(_FieldBase):
     """Represents the main simulation data container.
 
@@ -104,7 +111,6 @@ class Field(_FieldBase):
         by connecting to a stub.
         """
         super().__init__(nentities, nature, location, False, field, server)
-        self._field_definition = self._load_field_definition()
 
     def as_local_field(self):
         """Create a deep copy of the field that can be accessed and modified locally.
@@ -392,7 +398,7 @@ class Field(_FieldBase):
         :class:`ansys.dpf.core.field_definition.FieldDefinition`
 
         """
-        return self._field_definition
+        return self._load_field_definition()
 
     @field_definition.setter
     def field_definition(self, value):
@@ -571,6 +577,57 @@ class Field(_FieldBase):
         """
         return self._min_max().get_output(1, types.field)
 
+    @staticmethod
+    def from_file(path, location=locations.nodal, server=None):
+        """Create a field from the data written in a file.
+
+        The file is memory-mapped and its data is sent to the server chunk
+        by chunk, so that it is never held in memory entirely. The scoping
+        IDs of the field are ``1`` to the number of entities.
+
+        Parameters
+        ----------
+        path : str
+            Path of a ``.npy`` file, as written by :func:`Field.to_file`
+            or ``numpy.save``, of an array of one dimension or of two
+            dimensions with one, three or six components.
+        location : str, optional
+            Location of the field. The default is ``"Nodal"``.
+        server : :class:`ansys.dpf.core.server`, optional
+            Server with the channel connected to the remote or local instance.
+            The default is ``None``, in which case an attempt is made to use
+            the global server.
+
+        Returns
+        -------
+        field : Field
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> field = dpf.Field.from_file("displacement.npy")  # doctest: +SKIP
+
+        """
+        data = np.load(path, mmap_mode="r")
+        if data.ndim == 2 and data.shape[1] == 1:
+            data = data.reshape(-1)
+        if data.ndim == 1:
+            nature = natures.scalar
+        elif data.ndim == 2 and data.shape[1] in _NATURES_BY_COMPONENT_COUNT:
+            nature = _NATURES_BY_COMPONENT_COUNT[data.shape[1]]
+        else:
+            raise ValueError(
+                "The array must have 1 dimension or 2 dimensions with 1, 3 or 6 "
+                f"components, not the shape {data.shape}."
+            )
+        n_entities = data.shape[0]
+        field = Field(
+            nentities=n_entities, nature=nature, location=location, server=server
+        )
+        field.data = data
+        field.scoping.ids = np.arange(1, n_entities + 1)
+        return field
+
     def deep_copy(self, server=None):
         """Create a deep copy of the field's data on a given server.
 
@@ -608,7 +665,8 @@ class Field(_FieldBase):
             server=server,
         )
         f.scoping = self.scoping.deep_copy(server)
-        f.data = self.data
+        # copied in double precision whatever the transfer precision
+        f._set_data(self.get_data(dtype=np.float64), dtype=np.float64)
         f.unit = self.unit
         f.location = self.location
         f.field_definition = self.field_definition.deep_copy(server)
@@ -627,6 +685,31 @@ class Field(_FieldBase):
 
         return f
 
+    _to_cache = {
+        _FieldBase._get_component_count: [
+            _FieldBase._set_data,
+            _FieldBase._set_scoping,
+            _FieldBase.append,
+            resize,
+            _set_field_definition,
+        ],
+        _FieldBase._get_elementary_data_count: [
+            _FieldBase._set_data,
+            _FieldBase._set_scoping,
+            _FieldBase.append,
+            resize,
+            _set_field_definition,
+        ],
+        _load_field_definition: [_set_field_definition],
+        _FieldBase._entities_data_source: [
+            _FieldBase._set_data,
+            _FieldBase._set_data_pointer,
+            _FieldBase.append,
+            resize,
+            _set_field_definition,
+        ],
+    }
+
 
 class _LocalField(_LocalFieldBase, Field):
     """Caches the internal data of a field so that it can be modified locally.
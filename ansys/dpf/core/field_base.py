@@ -1,7 +1,9 @@
+import os
+
 from ansys.grpc.dpf import field_pb2, base_pb2, field_pb2_grpc
 from ansys.dpf.core import scoping
 from ansys.dpf.core.common import natures, locations
-from ansys.dpf.core import errors
+from ansys.dpf.core import errors, misc
 from ansys.dpf.core import server as serverlib
 
 import numpy as np
@@ -90,6 +92,9 @@ class _FieldBase:
         int
             Number of components in each elementary data of the field.
         """
+        return self._get_component_count()
+
+    def _get_component_count(self):
         request = field_pb2.CountRequest()
         request.entity = base_pb2.NUM_COMPONENT
         request.field.CopyFrom(self._message)
@@ -105,6 +110,9 @@ class _FieldBase:
             Number of elementary data in the field.
 
         """
+        return self._get_elementary_data_count()
+
+    def _get_elementary_data_count(self):
         request = field_pb2.CountRequest()
         request.entity = base_pb2.NUM_ELEMENTARY_DATA
         request.field.CopyFrom(self._message)
@@ -224,9 +232,19 @@ class _FieldBase:
     def scoping(self, scoping):
         return self._set_scoping(scoping)
 
-    def get_entity_data(self, index):
+    def get_entity_data(self, index, dtype=None):
         """Retrieves the elementary data of the scoping's index in an array.
 
+        Parameters
+        ----------
+        index : int
+            Index of the entity in the scoping.
+        dtype : numpy.dtype, str, optional
+            Precision of the data of a field of doubles, ``numpy.float64``
+            (``"double"``) or ``numpy.float32`` (``"float"``). The default is
+            ``None``, in which case the precision set with
+            :func:`ansys.dpf.core.settings.set_transfer_precision` is used.
+
         Returns
         --------
         numpy.ndarray
@@ -258,19 +276,25 @@ class _FieldBase:
                 -2.48670150e+06,  1.52268930e+07,  6.09583280e+07]])
 
         """
+        precision = self._wire_precision(dtype)
         request = field_pb2.GetElementaryDataRequest()
         request.field.CopyFrom(self._message)
         request.index = index
         list_message = self._stub.GetElementaryData(
-            request, metadata=[(b"float_or_double", b"double")]
+            request, metadata=[(b"float_or_double", precision.encode())]
         )
         data = []
         if list_message.elemdata_containers.data.HasField("datadouble"):
             data = list_message.elemdata_containers.data.datadouble.rep_double
+        elif list_message.elemdata_containers.data.HasField("datafloat"):
+            data = list_message.elemdata_containers.data.datafloat.rep_float
         elif list_message.elemdata_containers.data.HasField("dataint"):
             data = list_message.elemdata_containers.data.dataint.rep_int
 
-        array = np.array(data)
+        if self._message.datatype == "int":
+            array = np.array(data)
+        else:
+            array = np.array(data, dtype=_requested_dtype(dtype))
         if self.component_count != 1:
             n_comp = self.component_count
             array = array.reshape((len(data) // n_comp, n_comp))
@@ -317,6 +341,71 @@ class _FieldBase:
             raise ValueError(f"The ID {id} must be greater than 0.")
         return self.get_entity_data(index)
 
+    def get_entities_data(self, indices=None, ids=None):
+        """Retrieve the data of several entities at once.
+
+        The data and the data pointer of the field are downloaded on the first
+        call only, and kept until the field is modified through this object.
+        When ``ids`` are given, the scoping is retrieved in one request
+        instead of one request per entity.
+
+        Parameters
+        ----------
+        indices : list of int, numpy.ndarray, optional
+            Indices of the entities in the scoping.
+        ids : list of int, numpy.ndarray, optional
+            IDs of the entities, used when ``indices`` are not given.
+
+        Returns
+        -------
+        numpy.ndarray or tuple of numpy.ndarray
+            For fields whose entities hold a variable number of elementary
+            data, like elemental nodal fields, the concatenated data of
+            the entities and the ``offsets`` of each entity in it: the
+            data of the i-th entity is ``values[offsets[i]:offsets[i+1]]``.
+            Otherwise, an array with one row per entity.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> transient = examples.download_transient_result()
+        >>> model = dpf.Model(transient)
+        >>> stress_op = model.results.stress()
+        >>> field = stress_op.outputs.fields_container()[0]
+        >>> values, offsets = field.get_entities_data(ids=[391, 586])
+        >>> offsets
+        array([ 0,  8, 16], dtype=int32)
+
+        """
+        if indices is None:
+            if ids is None:
+                raise ValueError("Either indices or ids must be given.")
+            indices = self.scoping.index(np.asarray(ids, dtype=np.int32).reshape(-1))
+            if np.any(indices < 0):
+                missing = np.asarray(ids).reshape(-1)[indices < 0]
+                raise ValueError(f"The IDs {missing.tolist()} are not in the scoping.")
+        indices = np.asarray(indices, dtype=np.int64).reshape(-1)
+        data, data_pointer, ncomp = self._entities_data_source()
+        entities_data = _gather_entities_data(data, data_pointer, ncomp, indices)
+        if data.dtype == np.int32:
+            return entities_data
+        dtype = _requested_dtype(None)
+        if isinstance(entities_data, tuple):
+            values, offsets = entities_data
+            return values.astype(dtype, copy=False), offsets
+        return entities_data.astype(dtype, copy=False)
+
+    def _entities_data_source(self):
+        """Flat data, data pointer and number of components of the field.
+
+        The data is kept in the server's precision, so that it is cached
+        whatever the transfer precision.
+        """
+        dtype = None if self._message.datatype == "int" else np.float64
+        data = self._get_data(read_only=True, dtype=dtype)
+        return data.reshape(-1), self._data_pointer, self.component_count
+
     def append(self, data, scopingid):
         """Add an entity data to the existing data.
 
@@ -401,7 +490,7 @@ class _FieldBase:
 
     def _set_data_pointer(self, data):
         if isinstance(data, (np.ndarray, np.generic)):
-            data = np.array(data.reshape(data.size), dtype=np.int32)
+            data = np.asarray(data.reshape(data.size), dtype=np.int32)
         else:
             data = np.array(data, dtype=np.int32)
         if data.size == 0:
@@ -410,7 +499,8 @@ class _FieldBase:
         request = field_pb2.UpdateDataRequest()
         request.field.CopyFrom(self._message)
         self._stub.UpdateDataPointer(
-            scoping._data_chunk_yielder(request, data), metadata=metadata
+            scoping._data_chunk_yielder(request, data, server=self._server),
+            metadata=metadata,
         )
 
     @property
@@ -455,35 +545,203 @@ class _FieldBase:
         """
         return self._get_data(np_array=False)
 
-    def _get_data(self, np_array=True):
+    def _wire_precision(self, dtype=None):
+        """Precision, ``"double"`` or ``"float"``, of the data exchanged with the server."""
+        precision = _transfer_precision(misc.TRANSFER_PRECISION if dtype is None else dtype)
+        if precision == "float" and not self._server.capabilities.float32:
+            return "double"
+        return precision
+
+    def get_data(self, out=None, read_only=False, dtype=None):
+        """Retrieve the data in the field as an array.
+
+        The data is streamed from the server straight into the returned array
+        and only one request is made to retrieve its number of components.
+
+        Parameters
+        ----------
+        out : numpy.ndarray, optional
+            Preallocated C-contiguous array with the returned data type in
+            which the data is written. It must hold at least :attr:`size`
+            values, and can be reused from one call to another to avoid
+            new allocations. The default is ``None``, in which case a new
+            array is allocated.
+        read_only : bool, optional
+            Whether to return a non-writeable array. The default is ``False``.
+        dtype : numpy.dtype, str, optional
+            Precision of the data of a field of doubles, ``numpy.float64``
+            (``"double"``) or ``numpy.float32`` (``"float"``). Single
+            precision data is sent by the server in half the bytes. The
+            default is ``None``, in which case the precision of ``out`` is
+            used when it is given, and otherwise the precision set with
+            :func:`ansys.dpf.core.settings.set_transfer_precision`.
+            The data of a property field is always ``numpy.int32``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Data in the field, which is a view on ``out`` when it is given.
+
+        Notes
+        -----
+        Print a progress bar.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> import numpy as np
+        >>> field = dpf.fields_factory.field_from_array(np.ones((10, 3)))
+        >>> buffer = np.empty(field.size)
+        >>> data = field.get_data(out=buffer, read_only=True)
+        >>> data.shape
+        (10, 3)
+        >>> field.get_data(dtype=np.float32).dtype
+        dtype('float32')
+
+        """
+        return self._get_data(out=out, read_only=read_only, dtype=dtype)
+
+    def _list_data(self, dtype=None):
+        """Request the data of the field.
+
+        Returns
+        -------
+        service : grpc stream
+            Stream of the chunks of data.
+        dtype : numpy.dtype
+            Requested type of the values.
+        received_dtype : numpy.dtype
+            Type of the values sent by the server.
+        """
         request = field_pb2.ListRequest()
         request.field.CopyFrom(self._message)
         if self._message.datatype == "int":
             data_type = "int"
-            dtype = np.int32
+            dtype = received_dtype = np.int32
         else:
-            data_type = "double"
-            dtype = np.float
+            data_type = self._wire_precision(dtype)
+            dtype = _requested_dtype(dtype)
+            received_dtype = _TRANSFER_DTYPES[data_type]
         service = self._stub.List(request, metadata=[("float_or_double", data_type)])
-        array = scoping._data_get_chunk_(dtype, service, np_array)
+        if data_type == "float" and not getattr(self._server, "_float32_checked", False):
+            # a server may ignore the requested precision and send doubles,
+            # which is detected from the size announced by the first response
+            n_values = self.size
+            if scoping._stream_size(service) != n_values * received_dtype.itemsize:
+                service.cancel()
+                self._server.capabilities.float32 = False
+                return self._list_data(dtype)
+            if n_values:
+                self._server._float32_checked = True
+        return service, dtype, received_dtype
+
+    def _get_data(self, np_array=True, out=None, read_only=False, dtype=None):
+        if dtype is None and isinstance(out, np.ndarray) and self._message.datatype != "int":
+            # the data is returned in the precision of the given array
+            if out.dtype in _TRANSFER_DTYPES.values():
+                dtype = out.dtype
+        service, dtype, received_dtype = self._list_data(dtype)
+        if received_dtype == dtype or not np_array:
+            array = scoping._data_get_chunk_(received_dtype, service, np_array, out)
+        else:
+            # the server cannot send single precision data
+            array = scoping._data_get_chunk_(received_dtype, service)
+            if out is None:
+                array = array.astype(dtype)
+            else:
+                flat = scoping._check_out_buffer(out, dtype, array.size)
+                flat[:] = array
+                array = flat
 
-        ncomp = self.component_count
-        if ncomp != 1 and np_array:
-            array = array.reshape(self.shape)
+        if np_array:
+            ncomp = self.component_count
+            if ncomp != 1:
+                array = array.reshape((array.size // ncomp, ncomp))
+            if read_only:
+                array.flags.writeable = False
 
         return array
 
+    def to_file(self, path, format="npy", dtype=None):
+        """Write the data of the field in a file.
+
+        The data is streamed from the server to the file chunk by chunk,
+        so that it is never held in memory entirely.
+
+        Parameters
+        ----------
+        path : str
+            Path of the file, which is replaced when it exists.
+        format : str, optional
+            Format of the file. Only ``"npy"``, the NumPy binary format read
+            by ``numpy.load``, is supported.
+        dtype : numpy.dtype, str, optional
+            Precision of the data of a field of doubles, ``numpy.float64``
+            (``"double"``) or ``numpy.float32`` (``"float"``). The default is
+            ``None``, in which case the precision set with
+            :func:`ansys.dpf.core.settings.set_transfer_precision` is used.
+
+        Notes
+        -----
+        Print a progress bar.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from ansys.dpf import core as dpf
+        >>> field = dpf.fields_factory.field_from_array(np.ones((10, 3)))
+        >>> field.to_file("displacement.npy")  # doctest: +SKIP
+        >>> np.load("displacement.npy", mmap_mode="r").shape  # doctest: +SKIP
+        (10, 3)
+
+        """
+        _check_file_format(format)
+        ncomp = self.component_count
+        service, dtype, received_dtype = self._list_data(dtype)
+
+        def write_header(n_values):
+            shape = (n_values,) if ncomp == 1 else (n_values // ncomp, ncomp)
+            _write_npy_header(f, dtype, shape)
+
+        # write then rename so that readers never see partial files
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                scoping._data_get_chunk_to_file_(
+                    received_dtype, service, f, write_header, dtype
+                )
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
     @data.setter
     def data(self, data):
         self._set_data(data)
 
-    def _set_data(self, data):
+    def _set_data(self, data, dtype=None):
+        """Send the data of the field to the server.
+
+        The data of a field of doubles is sent in the precision ``dtype``.
+        By default, it is the precision set with
+        :func:`ansys.dpf.core.settings.set_transfer_precision`, or single
+        precision when the data is given as a ``numpy.float32`` array. The
+        internal copies of fields give their precision. The arrays
+        are cast to this precision one chunk at a time, and C-contiguous
+        arrays, memory-mapped ones included, are sent without being copied
+        entirely.
+        """
         if self._message.datatype == "int":
             if not isinstance(data[0], int) and not isinstance(data[0], np.int32):
                 raise errors.InvalidTypeError("data", "list of int")
-            data = np.array(data, dtype=np.int32)
+            dtype = np.int32
+            data = np.asarray(data, dtype=dtype).reshape(-1)
             metadata = [("size_int", f"{len(data)}")]
         else:
+            if dtype is None and isinstance(data, np.ndarray) and data.dtype == np.float32:
+                dtype = "float"
+            precision = self._wire_precision(dtype)
+            dtype = _TRANSFER_DTYPES[precision]
             if isinstance(data, (np.ndarray, np.generic)):
                 if (
                     0 != self.size
@@ -496,14 +754,16 @@ class _FieldBase:
                         f"shape {data.shape} was input"
                     )
                 else:
-                    data = np.array(data.reshape(data.size), dtype=float)
+                    # the chunks are cast while they are sent
+                    data = data.reshape(data.size)
             else:
-                data = np.array(data, dtype=float)
-            metadata = [("float_or_double", "double"), ("size_double", f"{len(data)}")]
+                data = np.array(data, dtype=dtype)
+            metadata = [("float_or_double", precision), ("size_double", f"{len(data)}")]
         request = field_pb2.UpdateDataRequest()
         request.field.CopyFrom(self._message)
         self._stub.UpdateData(
-            scoping._data_chunk_yielder(request, data), metadata=metadata
+            scoping._data_chunk_yielder(request, data, server=self._server, dtype=dtype),
+            metadata=metadata,
         )
 
 
@@ -529,12 +789,20 @@ class _LocalFieldBase(_FieldBase):
 
     def __cache_data__(self):
         self._ncomp = super().component_count
-        self._data_copy = super().data_as_list
-        self._num_entities_reserved = len(self._data_copy)
-        self._data_pointer_copy = super()._data_pointer_as_list
+        # the local copy keeps the server's precision whatever the transfer precision
+        self._data_copy = _GrowableArray(
+            self._dtype, super()._get_data(dtype=self._dtype), copy=False
+        )
+        self._data_pointer_copy = _GrowableArray(
+            np.int32, super()._data_pointer, copy=False
+        )
         self._scoping_copy = super().scoping.as_local_scoping()
         self._has_data_pointer = len(self._data_pointer_copy) > 0
 
+    @property
+    def _dtype(self):
+        return np.int32 if self._is_property_field else np.float64
+
     @property
     def _num_entities(self):
         return len(self._scoping_copy)
@@ -553,9 +821,18 @@ class _LocalFieldBase(_FieldBase):
         """
         return len(self._data_copy)
 
-    def get_entity_data(self, index):
+    def get_entity_data(self, index, dtype=None):
         """Retrieve the elementary data of the scoping's index as an array.
 
+        Parameters
+        ----------
+        index : int
+            Index of the entity in the scoping.
+        dtype : numpy.dtype, str, optional
+            Precision of the data of a field of doubles, ``numpy.float64``
+            or ``numpy.float32``. The default is ``None``, in which case the
+            data is returned with its local precision.
+
         Returns
         -------
         numpy.ndarray
@@ -589,32 +866,37 @@ class _LocalFieldBase(_FieldBase):
            1.52268930e+07  6.09583280e+07]]
 
         """
-        if index > self._num_entities:
+        if index >= self._num_entities:
             raise ValueError(
                 f"Requested scoping {index} is greater than the number of "
                 f"available indices {len(self._scoping_copy)}"
             )
         if self._has_data_pointer:
-            first_index = self._data_pointer_copy[index]
-            if index < len(self._data_pointer_copy) - 1:
-                last_index = self._data_pointer_copy[index + 1] - 1
+            data_pointer = self._data_pointer_copy.array
+            first_index = data_pointer[index]
+            if index < len(data_pointer) - 1:
+                last_index = data_pointer[index + 1] - 1
             else:
                 last_index = len(self._data_copy) - 1
         else:
             first_index = self._ncomp * index
             last_index = self._ncomp * (index + 1) - 1
-        if self._is_property_field:
-            array = np.array(
-                self._data_copy[first_index : last_index + 1], dtype=np.int32
-            )
-        else:
-            array = np.array(self._data_copy[first_index : last_index + 1])
+        array = self._data_copy.array[first_index : last_index + 1]
+        if dtype is not None and not self._is_property_field:
+            array = array.astype(_requested_dtype(dtype), copy=False)
 
         if self._ncomp > 1:
             return array.reshape((array.size // self._ncomp, self._ncomp))
         else:
             return array
 
+    def _entities_data_source(self):
+        if self._has_data_pointer:
+            data_pointer = self._data_pointer_copy.array
+        else:
+            data_pointer = np.empty(0, dtype=np.int32)
+        return self._data_copy.array, data_pointer, self._ncomp
+
     def get_entity_data_by_id(self, id):
         """Retrieve the data of the scoping's ID in the parameter of the field.
 
@@ -679,32 +961,88 @@ class _LocalFieldBase(_FieldBase):
         ...         f.append([[0.1*i,0.2*i, 0.3*i],[0.1*i,0.2*i, 0.3*i]],i)
 
         """
-        if self._is_property_field:
-            if isinstance(data[0], np.int64):
-                data = np.array(data, dtype=np.int32)
-            if not isinstance(data[0], int) and not isinstance(data[0], np.int32):
-                raise errors.InvalidTypeError("data", "list of int")
-        if (len(data) > 0 and isinstance(data, list)) or isinstance(
-            data, (np.ndarray, np.generic)
-        ):
-            data = np.array(data).flatten().tolist()
+        data = np.asarray(data)
+        if self._is_property_field and not np.issubdtype(data.dtype, np.integer):
+            raise errors.InvalidTypeError("data", "list of int")
 
         data_size = len(self._data_copy)
         self._scoping_copy.append(scopingid)
-        if len(self._data_pointer_copy) > 0:
+        if self._has_data_pointer:
             self._data_pointer_copy.append(data_size)
 
         self._data_copy.extend(data)
-        if self._has_data_pointer == False:
-            if isinstance(data, (np.ndarray, np.generic)):
-                data_size = data.size
-            else:
-                data_size = len(data)
-            if data_size > self._ncomp:
-                self._data_pointer_copy = [
-                    i * self._ncomp for i in range(0, self._num_entities)
-                ]
-                self._has_data_pointer = True
+        if self._has_data_pointer == False and data.size > self._ncomp:
+            self._data_pointer_copy = _GrowableArray(
+                np.int32, np.arange(self._num_entities) * self._ncomp
+            )
+            self._has_data_pointer = True
+
+    def append_many(self, ids, data, offsets=None):
+        """Add the data of several entities at once.
+
+        Parameters
+        ----------
+        ids : list of int, numpy.ndarray
+            Scoping IDs of the entities.
+        data : list, numpy.ndarray
+            Concatenated data of the entities.
+        offsets : list of int, numpy.ndarray, optional
+            Index of the first elementary data of each entity in ``data``
+            followed by the total number of elementary data, as returned
+            by :func:`get_entities_data`. The default is ``None``, in which
+            case ``data`` is split evenly between the entities.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> import numpy as np
+        >>> field_to_local = dpf.fields_factory.create_3d_vector_field(
+        ...     3, location=dpf.locations.elemental_nodal
+        ... )
+        >>> with field_to_local.as_local_field() as f:
+        ...     f.append_many([1, 2], np.ones((3, 3)), offsets=[0, 1, 3])
+        >>> field_to_local.get_entity_data(1).shape
+        (2, 3)
+
+        """
+        ids = np.asarray(ids, dtype=np.int32).reshape(-1)
+        data = np.asarray(data)
+        if self._is_property_field and not np.issubdtype(data.dtype, np.integer):
+            raise errors.InvalidTypeError("data", "list of int")
+        data = data.reshape(-1)
+        n_entities = ids.size
+        if offsets is None:
+            if n_entities == 0 or data.size % n_entities:
+                raise ValueError(
+                    f"{data.size} values cannot be split evenly between "
+                    f"{n_entities} entities, offsets are required."
+                )
+            entity_size = data.size // n_entities
+            data_pointer = np.arange(n_entities, dtype=np.int64) * entity_size
+            variable_size = entity_size != self._ncomp
+        else:
+            offsets = np.asarray(offsets, dtype=np.int64).reshape(-1)
+            if (
+                offsets.size != n_entities + 1
+                or offsets[0] != 0
+                or offsets[-1] * self._ncomp != data.size
+            ):
+                raise ValueError(
+                    "offsets must start with 0, hold one value per entity and "
+                    "end with the number of elementary data."
+                )
+            data_pointer = offsets[:-1] * self._ncomp
+            variable_size = bool(np.any(np.diff(offsets) != 1))
+
+        if self._has_data_pointer == False and variable_size:
+            self._data_pointer_copy = _GrowableArray(
+                np.int32, np.arange(self._num_entities) * self._ncomp
+            )
+            self._has_data_pointer = True
+        if self._has_data_pointer:
+            self._data_pointer_copy.extend(data_pointer + len(self._data_copy))
+        self._data_copy.extend(data)
+        self._scoping_copy.extend(ids)
 
     def data_as_list(self):
         """Retrieve the data in the field as a Python list.
@@ -727,7 +1065,7 @@ class _LocalFieldBase(_FieldBase):
         ...     my_data_list = f.data_as_list
 
         """
-        return self._data_copy
+        return self._data_copy.array.tolist()
 
     @property
     def data(self):
@@ -757,13 +1095,61 @@ class _LocalFieldBase(_FieldBase):
          [ 1.03542516e-02 -3.53018374e-03 -3.98914380e-05]]
 
         """
-
+        data = self._data_copy.array
         if self._ncomp > 1:
-            return np.array(self._data_copy).reshape(
-                len(self._data_copy) // self._ncomp, self._ncomp
-            )
+            return data.reshape(len(self._data_copy) // self._ncomp, self._ncomp)
         else:
-            return np.array(self._data_copy)
+            return data
+
+    def get_data(self, out=None, read_only=False, dtype=None):
+        """Retrieve the data in the local field as an array.
+
+        Parameters
+        ----------
+        out : numpy.ndarray, optional
+            Preallocated C-contiguous array with the returned data type in
+            which the data is copied. The default is ``None``.
+        read_only : bool, optional
+            Whether to return a non-writeable array. The default is ``False``.
+        dtype : numpy.dtype, str, optional
+            Precision of the data of a field of doubles, ``numpy.float64``
+            or ``numpy.float32``. The default is ``None``, in which case the
+            data is returned with its local precision.
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+        array = self.data
+        if dtype is not None and not self._is_property_field:
+            array = array.astype(_requested_dtype(dtype), copy=False)
+        if out is not None:
+            flat = scoping._check_out_buffer(out, array.dtype, array.size)
+            flat[:] = array.reshape(-1)
+            array = flat.reshape(array.shape)
+        if read_only:
+            array.flags.writeable = False
+        return array
+
+    def to_file(self, path, format="npy", dtype=None):
+        """Write the data of the local field in a file.
+
+        Parameters
+        ----------
+        path : str
+            Path of the file, which is replaced when it exists.
+        format : str, optional
+            Format of the file. Only ``"npy"`` is supported.
+        dtype : numpy.dtype, str, optional
+            Precision of the data of a field of doubles. The default is
+            ``None``, in which case the data is written with its local
+            precision.
+        """
+        _check_file_format(format)
+        array = self.get_data(dtype=dtype)
+        with open(path, "wb") as f:
+            _write_npy_header(f, array.dtype, array.shape)
+            f.write(np.ascontiguousarray(array).tobytes())
 
     @data.setter
     def data(self, data):
@@ -777,12 +1163,7 @@ class _LocalFieldBase(_FieldBase):
                         f"An array of shape {self.shape} is expected and "
                         f"shape {data.shape} was input"
                     )
-        if isinstance(data, (np.ndarray, np.generic)):
-            self._data_copy = data.flatten().tolist()
-        elif len(data) > 0 and isinstance(data, list):
-            self._data_copy = np.array(data).flatten().tolist()
-        else:
-            self._data_copy = data
+        self._data_copy = _GrowableArray(self._dtype, data)
 
     @property
     def elementary_data_count(self):
@@ -795,7 +1176,7 @@ class _LocalFieldBase(_FieldBase):
 
         """
         if hasattr(self, "_data_copy"):
-            return len(self._data_copy) / self._ncomp
+            return len(self._data_copy) // self._ncomp
         else:
             return super().elementary_data_count
 
@@ -820,7 +1201,7 @@ class _LocalFieldBase(_FieldBase):
         numpy.ndarray
             Array of first indexes of each entity data.
         """
-        return np.array(self._data_pointer_copy)
+        return self._data_pointer_copy.array
 
     @property
     def _data_pointer_as_list(self):
@@ -831,14 +1212,11 @@ class _LocalFieldBase(_FieldBase):
         List
             List of first indexes of each entity data.
         """
-        return self._data_pointer_copy
+        return self._data_pointer_copy.array.tolist()
 
     @_data_pointer.setter
     def _data_pointer(self, data):
-        if isinstance(data, (np.ndarray, np.generic)):
-            self._data_pointer_copy = data.tolist()
-        else:
-            self._data_pointer_copy = data
+        self._data_pointer_copy = _GrowableArray(np.int32, data)
         if self._has_data_pointer == False and len(data) > 0:
             self._has_data_pointer = True
 
@@ -875,9 +1253,11 @@ class _LocalFieldBase(_FieldBase):
 
     def release_data(self):
         """Release the data."""
-        super()._set_data(self._data_copy)
-        super()._set_data_pointer(self._data_pointer_copy)
+        super()._set_data(self._data_copy.array, dtype=self._dtype)
+        super()._set_data_pointer(self._data_pointer_copy.array)
         self._scoping_copy.release_data()
+        if hasattr(self._owner_field, "_cache"):
+            self._owner_field._cache.clear()
 
     def __enter__(self):
         return self
@@ -894,3 +1274,131 @@ class _LocalFieldBase(_FieldBase):
             self._is_exited = True
             self.release_data()
         pass
+
+
+def _gather_entities_data(data, data_pointer, ncomp, indices):
+    """Gather the data of the entities at ``indices`` from a flat data array.
+
+    Returns the values and the offsets of each entity when the field has a
+    data pointer, or an array with one row per entity otherwise.
+    """
+    if data_pointer.size == 0:
+        n_entities = data.size // ncomp
+    else:
+        n_entities = data_pointer.size
+    if indices.size and (indices.min() < 0 or indices.max() >= n_entities):
+        raise IndexError(
+            f"Entity indices must be between 0 and {n_entities - 1}."
+        )
+
+    if data_pointer.size == 0:
+        values = data.reshape(-1, ncomp)[indices]
+        return values if ncomp != 1 else values.reshape(-1)
+
+    ends = np.append(data_pointer[1:], data.size).astype(np.int64)
+    starts = data_pointer[indices].astype(np.int64)
+    lengths = ends[indices] - starts
+    offsets = np.zeros(indices.size + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    # position in the flat data of each value to gather
+    positions = np.repeat(starts - offsets[:-1], lengths) + np.arange(offsets[-1])
+    values = data[positions]
+    if ncomp != 1:
+        values = values.reshape(-1, ncomp)
+    return values, (offsets // ncomp).astype(np.int32)
+
+
+# numpy types of the precisions of the field data exchanged with the server
+_TRANSFER_DTYPES = {"double": np.dtype(np.float64), "float": np.dtype(np.float32)}
+
+
+def _transfer_precision(dtype):
+    """Return ``"double"`` or ``"float"`` for a precision given as a name or a numpy type."""
+    if isinstance(dtype, str) and dtype in _TRANSFER_DTYPES:
+        return dtype
+    try:
+        dtype = np.dtype(dtype)
+    except TypeError:
+        pass
+    for precision, precision_dtype in _TRANSFER_DTYPES.items():
+        if dtype == precision_dtype:
+            return precision
+    raise ValueError(
+        f"The precision must be numpy.float64 (\"double\") or numpy.float32 "
+        f"(\"float\"), not {dtype!r}."
+    )
+
+
+def _requested_dtype(dtype):
+    """numpy type of the field data returned to the user."""
+    return _TRANSFER_DTYPES[
+        _transfer_precision(misc.TRANSFER_PRECISION if dtype is None else dtype)
+    ]
+
+
+# formats of the files in which the field data is written
+_FILE_FORMATS = ("npy",)
+
+
+def _check_file_format(format):
+    if format not in _FILE_FORMATS:
+        raise ValueError(f"format must be one of {_FILE_FORMATS}, not {format!r}")
+
+
+def _write_npy_header(file, dtype, shape):
+    """Write the header of a ``.npy`` file of a C-ordered array."""
+    header = {
+        "descr": np.lib.format.dtype_to_descr(np.dtype(dtype)),
+        "fortran_order": False,
+        "shape": tuple(shape),
+    }
+    np.lib.format.write_array_header_1_0(file, header)
+
+
+class _GrowableArray:
+    """Contiguous typed array whose capacity doubles when it is extended.
+
+    Parameters
+    ----------
+    dtype : numpy.dtype
+        Type of the values.
+    values : list, numpy.ndarray, optional
+        Initial values, flattened.
+    copy : bool, optional
+        Whether to copy ``values`` when they already are a contiguous array
+        of the right type. The default is ``True``.
+    """
+
+    def __init__(self, dtype, values=(), copy=True):
+        if copy:
+            self._buffer = np.array(values, dtype=dtype).reshape(-1)
+        else:
+            self._buffer = np.asarray(values, dtype=dtype).reshape(-1)
+        self._size = self._buffer.size
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def array(self):
+        """View on the values, invalidated when the capacity grows."""
+        return self._buffer[: self._size]
+
+    def reserve(self, capacity):
+        if capacity > self._buffer.size:
+            buffer = np.empty(
+                max(capacity, 2 * self._buffer.size, 16), dtype=self._buffer.dtype
+            )
+            buffer[: self._size] = self._buffer[: self._size]
+            self._buffer = buffer
+
+    def extend(self, values):
+        values = np.asarray(values, dtype=self._buffer.dtype).reshape(-1)
+        self.reserve(self._size + values.size)
+        self._buffer[self._size : self._size + values.size] = values
+        self._size += values.size
+
+    def append(self, value):
+        self.reserve(self._size + 1)
+        self._buffer[self._size] = value
+        self._size += 1
@@ -3,6 +3,9 @@ from ansys.dpf.core.mapping_types import map_types_to_python
 from ansys.dpf.core.outputs import _Outputs, Output
 from ansys.dpf import core
 
+# documented Input classes, names and expected Python types by pin specification
+_INPUT_CLASSES = {}
+
 
 class Input:
     """
@@ -23,18 +26,37 @@ class Input:
         self._operator = operator
         self._pin = pin
         self._count_ellipsis = count_ellipsis
-        self._python_expected_types = []
-        for cpp_type in self._spec.type_names:
-            python_type = map_types_to_python[cpp_type]
-            if python_type not in self._python_expected_types:
-                self._python_expected_types.append(map_types_to_python[cpp_type])
-        if len(self._spec.type_names) == 0:
-            self._python_expected_types.append("Any")
-        docstr = self.__str__()
-        self.name = self._spec.name
-        if self._count_ellipsis != -1:
-            self.name += str(self._count_ellipsis + 1)
-        self._update_doc_str(docstr, self.name)
+        # the expected types and the documented class only depend on the pin
+        # specification, they are computed once for all the operators
+        key = (
+            self.__class__,
+            spec.name,
+            tuple(spec.type_names),
+            spec.optional,
+            spec.document,
+            count_ellipsis,
+        )
+        cached = _INPUT_CLASSES.get(key)
+        if cached is None:
+            self._python_expected_types = []
+            for cpp_type in self._spec.type_names:
+                python_type = map_types_to_python[cpp_type]
+                if python_type not in self._python_expected_types:
+                    self._python_expected_types.append(map_types_to_python[cpp_type])
+            if len(self._spec.type_names) == 0:
+                self._python_expected_types.append("Any")
+            docstr = self.__str__()
+            self.name = self._spec.name
+            if self._count_ellipsis != -1:
+                self.name += str(self._count_ellipsis + 1)
+            self._update_doc_str(docstr, self.name)
+            _INPUT_CLASSES[key] = (
+                self.__class__,
+                self.name,
+                self._python_expected_types,
+            )
+        else:
+            self.__class__, self.name, self._python_expected_types = cached
 
     def connect(self, inpt):
         """Connect any input (an entity or an operator output) to a specified input pin of this operator.
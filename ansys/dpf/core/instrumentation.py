@@ -0,0 +1,665 @@
+"""
+.. _ref_instrumentation:
+
+Instrumentation
+===============
+Records the remote procedure calls sent to the DPF servers.
+
+Each call made through the channel of a :class:`ansys.dpf.core.server.DpfServer`
+is timed and measured by a gRPC client interceptor. The calls are only
+recorded when a hook is registered, either with :func:`add_hook` to export
+them to a metrics stack or with the :func:`profiling` context manager to get
+per method statistics.
+
+The :func:`trace` context manager records, in addition to the calls, spans
+of the client-side activity (operator evaluations, data streams, file
+transfers, VTK conversions) as a timeline in the Chrome trace event format.
+
+Examples
+--------
+>>> from ansys.dpf import core as dpf
+>>> from ansys.dpf.core import examples
+>>> with dpf.profiling() as prof:
+...     model = dpf.Model(examples.simple_bar)
+...     fc = model.results.displacement().eval()
+>>> print(prof.report())  # doctest: +SKIP
+
+"""
+import bisect
+import contextlib
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from typing import NamedTuple
+
+import grpc
+
+# upper bounds of the latency histogram buckets, in seconds
+LATENCY_BUCKETS = (1e-4, 5e-4, 1e-3, 5e-3, 1e-2, 5e-2, 1e-1, 5e-1, 1.0, 5.0, float("inf"))
+
+_hooks = []
+_hooks_lock = threading.Lock()
+_tracers = []
+
+
+class RpcCall(NamedTuple):
+    """Record of a remote procedure call sent to a DPF server.
+
+    Attributes
+    ----------
+    service : str
+        Name of the service, for example ``"FieldService"``.
+    method : str
+        Name of the method, for example ``"Count"``.
+    duration : float
+        Time between the call and the end of the last response, in seconds.
+    request_bytes : int
+        Size of the serialized requests.
+    response_bytes : int
+        Size of the serialized responses.
+    request_chunks : int
+        Number of requests sent, more than one for streamed requests.
+    response_chunks : int
+        Number of responses received, more than one for streamed responses.
+    code : grpc.StatusCode
+        Status of the call.
+    start : float
+        Start of the call, from ``time.perf_counter()``.
+    thread_id : int
+        Identifier of the thread that made the call.
+    """
+
+    service: str
+    method: str
+    duration: float
+    request_bytes: int
+    response_bytes: int
+    request_chunks: int
+    response_chunks: int
+    code: grpc.StatusCode
+    start: float
+    thread_id: int
+
+
+def add_hook(hook):
+    """Register a function called with each remote procedure call.
+
+    The hook is called with an :class:`RpcCall` once the call is done, in the
+    thread finishing the call, so it should be short and thread safe.
+
+    Parameters
+    ----------
+    hook : callable
+        Function taking an :class:`RpcCall`.
+
+    Examples
+    --------
+    >>> from ansys.dpf.core import instrumentation
+    >>> calls = []
+    >>> instrumentation.add_hook(calls.append)
+    >>> instrumentation.remove_hook(calls.append)
+
+    """
+    with _hooks_lock:
+        _hooks.append(hook)
+
+
+def remove_hook(hook):
+    """Unregister a function registered with :func:`add_hook`.
+
+    Parameters
+    ----------
+    hook : callable
+        Function taking an :class:`RpcCall`.
+    """
+    with _hooks_lock:
+        _hooks.remove(hook)
+
+
+def _notify(call):
+    for hook in list(_hooks):
+        hook(call)
+
+
+def _split_method(full_method):
+    # full_method is "/package.Service/Method"
+    service, _, method = full_method.rpartition("/")
+    return service.rpartition(".")[2].lstrip("/"), method
+
+
+def _byte_size(message):
+    try:
+        return message.ByteSize()
+    except AttributeError:
+        return 0
+
+
+class _CallRecord:
+    """Measures of a call in progress, notified once when the call ends."""
+
+    def __init__(self, full_method):
+        self.service, self.method = _split_method(full_method)
+        self.start = time.perf_counter()
+        self.thread_id = threading.get_ident()
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.request_chunks = 0
+        self.response_chunks = 0
+        self._done = False
+
+    def count_request(self, request):
+        self.request_chunks += 1
+        self.request_bytes += _byte_size(request)
+
+    def count_response(self, response):
+        self.response_chunks += 1
+        self.response_bytes += _byte_size(response)
+
+    def requests(self, request_iterator):
+        for request in request_iterator:
+            self.count_request(request)
+            yield request
+
+    def done(self, code):
+        if self._done:
+            return
+        self._done = True
+        _notify(
+            RpcCall(
+                self.service,
+                self.method,
+                time.perf_counter() - self.start,
+                self.request_bytes,
+                self.response_bytes,
+                self.request_chunks,
+                self.response_chunks,
+                code,
+                self.start,
+                self.thread_id,
+            )
+        )
+
+    def future_done(self, future):
+        try:
+            code = future.code()
+        except Exception:
+            code = None
+        if code is None or code == grpc.StatusCode.OK:
+            try:
+                self.count_response(future.result())
+                code = grpc.StatusCode.OK
+            except Exception:
+                code = code or grpc.StatusCode.UNKNOWN
+        self.done(code)
+
+
+class _ResponseIterator:
+    """Wraps a streamed response to count its chunks as they are read."""
+
+    def __init__(self, call, record):
+        self._call = call
+        self._record = record
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            response = next(self._call)
+        except StopIteration:
+            self._record.done(grpc.StatusCode.OK)
+            raise
+        except grpc.RpcError as e:
+            self._record.done(e.code())
+            raise
+        self._record.count_response(response)
+        return response
+
+    def __getattr__(self, name):
+        return getattr(self._call, name)
+
+
+class _RecordingInterceptor(
+    grpc.UnaryUnaryClientInterceptor,
+    grpc.UnaryStreamClientInterceptor,
+    grpc.StreamUnaryClientInterceptor,
+    grpc.StreamStreamClientInterceptor,
+):
+    """Client interceptor recording the calls while hooks are registered."""
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        if not _hooks:
+            return continuation(client_call_details, request)
+        record = _CallRecord(client_call_details.method)
+        record.count_request(request)
+        call = continuation(client_call_details, request)
+        call.add_done_callback(record.future_done)
+        return call
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        if not _hooks:
+            return continuation(client_call_details, request)
+        record = _CallRecord(client_call_details.method)
+        record.count_request(request)
+        return _ResponseIterator(continuation(client_call_details, request), record)
+
+    def intercept_stream_unary(
+        self, continuation, client_call_details, request_iterator
+    ):
+        if not _hooks:
+            return continuation(client_call_details, request_iterator)
+        record = _CallRecord(client_call_details.method)
+        call = continuation(client_call_details, record.requests(request_iterator))
+        call.add_done_callback(record.future_done)
+        return call
+
+    def intercept_stream_stream(
+        self, continuation, client_call_details, request_iterator
+    ):
+        if not _hooks:
+            return continuation(client_call_details, request_iterator)
+        record = _CallRecord(client_call_details.method)
+        call = continuation(client_call_details, record.requests(request_iterator))
+        return _ResponseIterator(call, record)
+
+
+def instrumented_channel(channel):
+    """Return a channel recording the calls made through it.
+
+    Parameters
+    ----------
+    channel : grpc.Channel
+        Channel to instrument.
+
+    Returns
+    -------
+    grpc.Channel
+    """
+    return grpc.intercept_channel(channel, _RecordingInterceptor())
+
+
+class MethodStats:
+    """Statistics of the calls to a method of a service.
+
+    Attributes
+    ----------
+    calls : int
+        Number of calls.
+    errors : int
+        Number of calls that failed.
+    total_time : float
+        Cumulated duration of the calls, in seconds.
+    max_time : float
+        Longest call, in seconds.
+    request_bytes : int
+        Cumulated size of the requests.
+    response_bytes : int
+        Cumulated size of the responses.
+    request_chunks : int
+        Number of requests, counting each message of the streamed requests.
+    response_chunks : int
+        Number of responses, counting each message of the streamed responses.
+    histogram : list[int]
+        Number of calls by latency bucket, the upper bounds of the buckets
+        being given by ``LATENCY_BUCKETS``.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.request_chunks = 0
+        self.response_chunks = 0
+        self.histogram = [0] * len(LATENCY_BUCKETS)
+
+    @property
+    def mean_time(self):
+        """Mean duration of the calls, in seconds."""
+        return self.total_time / self.calls if self.calls else 0.0
+
+    def add(self, call):
+        self.calls += 1
+        if call.code != grpc.StatusCode.OK:
+            self.errors += 1
+        self.total_time += call.duration
+        self.max_time = max(self.max_time, call.duration)
+        self.request_bytes += call.request_bytes
+        self.response_bytes += call.response_bytes
+        self.request_chunks += call.request_chunks
+        self.response_chunks += call.response_chunks
+        self.histogram[bisect.bisect_left(LATENCY_BUCKETS, call.duration)] += 1
+
+
+class Profile:
+    """Statistics of the remote procedure calls by service and method.
+
+    An instance is returned by :func:`profiling`.
+
+    Attributes
+    ----------
+    stats : dict
+        :class:`MethodStats` by ``(service, method)``.
+    """
+
+    def __init__(self):
+        self.stats = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, call):
+        with self._lock:
+            key = (call.service, call.method)
+            stats = self.stats.get(key)
+            if stats is None:
+                stats = MethodStats()
+                self.stats[key] = stats
+            stats.add(call)
+
+    @property
+    def calls(self):
+        """Total number of calls."""
+        return sum(stats.calls for stats in self.stats.values())
+
+    @property
+    def total_time(self):
+        """Cumulated duration of the calls, in seconds."""
+        return sum(stats.total_time for stats in self.stats.values())
+
+    def report(self, sort_by="total_time"):
+        """Return a table of the statistics by method.
+
+        Parameters
+        ----------
+        sort_by : str, optional
+            Attribute of :class:`MethodStats` used to sort the methods in
+            descending order. The default is ``"total_time"``.
+
+        Returns
+        -------
+        str
+        """
+        header = (
+            f"{'method':<45}{'calls':>8}{'errors':>8}{'total (s)':>12}"
+            f"{'mean (ms)':>12}{'max (ms)':>12}{'sent (B)':>14}{'recv (B)':>14}"
+            f"{'chunks':>10}"
+        )
+        lines = [header, "-" * len(header)]
+        items = sorted(
+            self.stats.items(), key=lambda item: getattr(item[1], sort_by), reverse=True
+        )
+        for (service, method), stats in items:
+            lines.append(
+                f"{service + '.' + method:<45}{stats.calls:>8}{stats.errors:>8}"
+                f"{stats.total_time:>12.4f}{stats.mean_time * 1e3:>12.3f}"
+                f"{stats.max_time * 1e3:>12.3f}{stats.request_bytes:>14}"
+                f"{stats.response_bytes:>14}"
+                f"{stats.request_chunks + stats.response_chunks:>10}"
+            )
+        lines.append("-" * len(header))
+        lines.append(f"{'total':<45}{self.calls:>8}{'':>8}{self.total_time:>12.4f}")
+        return "\n".join(lines)
+
+    def __str__(self):
+        return self.report()
+
+
+@contextlib.contextmanager
+def profiling():
+    """Context manager recording the remote procedure calls made in its scope.
+
+    Yields
+    ------
+    Profile
+        Statistics of the calls, filled while the context is active.
+
+    Examples
+    --------
+    >>> from ansys.dpf import core as dpf
+    >>> with dpf.profiling() as prof:
+    ...     field = dpf.Field()
+    ...     field.data = [1., 2., 3.]
+    >>> prof.calls > 0
+    True
+
+    """
+    profile = Profile()
+    add_hook(profile)
+    try:
+        yield profile
+    finally:
+        remove_hook(profile)
+
+
+class _Span:
+    """Context manager recording a span in the active traces."""
+
+    __slots__ = ("name", "args", "start", "thread_id")
+
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+        self.start = None
+
+    def __enter__(self):
+        if _tracers:
+            self.thread_id = threading.get_ident()
+            self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.start is not None:
+            duration = time.perf_counter() - self.start
+            for tracer in list(_tracers):
+                tracer.add_span(
+                    self.name, "python", self.start, duration, self.thread_id, self.args
+                )
+
+
+def span(name, **args):
+    """Return a context manager recording a span in the active traces.
+
+    Nothing is recorded when no trace is active.
+
+    Parameters
+    ----------
+    name : str
+        Name of the span.
+    **args
+        Values displayed with the span in the trace viewer.
+
+    Examples
+    --------
+    >>> from ansys.dpf.core import instrumentation
+    >>> with instrumentation.span("post-processing", step=1):
+    ...     pass
+
+    """
+    return _Span(name, args)
+
+
+def traced(func):
+    """Decorator recording a span, named after the function, in the active traces.
+
+    The span of a generator function lasts until the generator is exhausted.
+    """
+    name = func.__qualname__
+    if inspect.isgeneratorfunction(func):
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with _Span(name, {}):
+                yield from func(*args, **kwargs)
+
+    else:
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _tracers:
+                return func(*args, **kwargs)
+            with _Span(name, {}):
+                return func(*args, **kwargs)
+
+    return wrapper
+
+
+class Trace:
+    """Timeline of the client-side activity and of the remote procedure calls.
+
+    An instance is returned by :func:`trace`. The spans are stored as
+    Chrome trace events, which can be viewed in Perfetto
+    (https://ui.perfetto.dev) or in ``chrome://tracing``. The spans nested in
+    time in a thread are displayed nested, showing which call triggered which
+    remote procedure calls.
+
+    Attributes
+    ----------
+    events : list[dict]
+        Trace events, with timestamps in microseconds from the start of the trace.
+    """
+
+    def __init__(self):
+        self.events = []
+        self._origin = time.perf_counter()
+        self._pid = os.getpid()
+        self._threads = {}
+        self._lock = threading.Lock()
+
+    def add_span(self, name, category, start, duration, thread_id, args=None):
+        """Add a span to the timeline.
+
+        Parameters
+        ----------
+        name : str
+            Name of the span.
+        category : str
+            Category of the span, for example ``"python"`` or ``"rpc"``.
+        start : float
+            Start of the span, from ``time.perf_counter()``.
+        duration : float
+            Duration of the span in seconds.
+        thread_id : int
+            Identifier of the thread.
+        args : dict, optional
+            Values displayed with the span.
+        """
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start - self._origin) * 1e6,
+            "dur": duration * 1e6,
+            "pid": self._pid,
+            "tid": thread_id,
+        }
+        if args:
+            event["args"] = {key: _json_value(value) for key, value in args.items()}
+        with self._lock:
+            self.events.append(event)
+            if thread_id not in self._threads:
+                self._threads[thread_id] = _thread_name(thread_id)
+
+    def __call__(self, call):
+        self.add_span(
+            f"{call.service}.{call.method}",
+            "rpc",
+            call.start,
+            call.duration,
+            call.thread_id,
+            {
+                "request_bytes": call.request_bytes,
+                "response_bytes": call.response_bytes,
+                "chunks": call.request_chunks + call.response_chunks,
+                "code": call.code.name if call.code is not None else None,
+            },
+        )
+
+    def to_chrome_trace(self):
+        """Return the timeline in the Chrome trace event format.
+
+        Returns
+        -------
+        dict
+        """
+        with self._lock:
+            metadata = [
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": self._pid,
+                    "tid": thread_id,
+                    "args": {"name": name},
+                }
+                for thread_id, name in self._threads.items()
+            ]
+            events = sorted(self.events, key=lambda event: event["ts"])
+        return {"traceEvents": metadata + events, "displayTimeUnit": "ms"}
+
+    def save(self, path):
+        """Write the timeline in a Chrome trace JSON file.
+
+        Parameters
+        ----------
+        path : str
+            Path of the JSON file.
+        """
+        with open(path, "w") as f:
+            json.dump(self.to_chrome_trace(), f)
+
+
+def _json_value(value):
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if hasattr(value, "item"):
+        # numpy scalar
+        return value.item()
+    return str(value)
+
+
+def _thread_name(thread_id):
+    for thread in threading.enumerate():
+        if thread.ident == thread_id:
+            return thread.name
+    return str(thread_id)
+
+
+@contextlib.contextmanager
+def trace(path=None):
+    """Context manager recording a timeline of the activity in its scope.
+
+    Parameters
+    ----------
+    path : str, optional
+        Path of a JSON file where the timeline is written in the Chrome trace
+        event format when the context exits. The default is ``None``, in
+        which case the timeline is only kept in memory.
+
+    Yields
+    ------
+    Trace
+        Timeline, filled while the context is active.
+
+    Examples
+    --------
+    >>> from ansys.dpf import core as dpf
+    >>> from ansys.dpf.core import examples
+    >>> with dpf.trace() as timeline:
+    ...     model = dpf.Model(examples.simple_bar)
+    ...     disp = model.results.displacement().eval()
+    >>> timeline.save("dpf_trace.json")  # doctest: +SKIP
+
+    """
+    timeline = Trace()
+    _tracers.append(timeline)
+    add_hook(timeline)
+    try:
+        yield timeline
+    finally:
+        remove_hook(timeline)
+        _tracers.remove(timeline)
+        if path is not None:
+            timeline.save(path)
@@ -2,11 +2,17 @@
 MeshedRegion
 ============
 """
+import hashlib
+import json
+import os
+
+import numpy as np
+
 from ansys import dpf
-from ansys.dpf.core import scoping
+from ansys.dpf.core import instrumentation, misc, scoping
 from ansys.dpf.core.check_version import server_meet_version
 from ansys.dpf.core.common import locations, types
-from ansys.dpf.core.elements import Elements, element_types
+from ansys.dpf.core.elements import Elements
 from ansys.dpf.core.nodes import Nodes
 from ansys.dpf.core.plotter import Plotter as _DpfPlotter
 from ansys.dpf.core.cache import class_handling_cache
@@ -70,6 +76,9 @@ class MeshedRegion:
         if server is None:
             server = dpf.core._global_server()
 
+        # entities added one at a time are gathered in this request, which
+        # is sent before any other request is made on the mesh
+        self._pending_add = None
         self._server = server
         self._stub = self._connect()
 
@@ -86,6 +95,7 @@ class MeshedRegion:
         self._full_grid = None
         self._elements = None
         self._nodes = None
+        self._topology_cache = None
 
     def _get_scoping(self, loc=locations.nodal):
         """
@@ -195,9 +205,50 @@ class MeshedRegion:
         request.unit = unit
         return self._stub.UpdateRequest(request)
 
+    @property
+    def _message(self):
+        if self._pending_add is not None:
+            self._flush_add_request()
+        return self._mesh_message
+
+    @_message.setter
+    def _message(self, value):
+        self._mesh_message = value
+
+    @property
+    def _stub(self):
+        if self._pending_add is not None:
+            self._flush_add_request()
+        return self._mesh_stub
+
+    @_stub.setter
+    def _stub(self, value):
+        self._mesh_stub = value
+
+    def _add_request(self):
+        """Request gathering the nodes and elements added one at a time."""
+        if self._pending_add is None:
+            self._pending_add = meshed_region_pb2.AddRequest(mesh=self._mesh_message)
+        return self._pending_add
+
+    def _flush_add_request(self, min_entities=0):
+        """Send the nodes and elements added one at a time.
+
+        Parameters
+        ----------
+        min_entities : int, optional
+            Number of gathered entities under which nothing is sent.
+        """
+        request = self._pending_add
+        if request is None:
+            return
+        if len(request.nodes) + len(request.elements) >= min_entities:
+            self._pending_add = None
+            self._mesh_stub.Add(request)
+
     def __del__(self):
         try:
-            self._stub.Delete(self._message)
+            self._mesh_stub.Delete(self._mesh_message)
         except:
             pass
 
@@ -264,6 +315,15 @@ class MeshedRegion:
     def _set_stream_provider(self, stream_provider):
         self._stream_provider = stream_provider
 
+    def _set_topology_cache(self, topology_cache):
+        self._topology_cache = topology_cache
+
+    def _topology_array(self, name, getter):
+        """Retrieve a topology array from the on-disk cache, when there is one."""
+        if self._topology_cache is None:
+            return getter()
+        return self._topology_cache.get(name, getter)
+
     # NOTE: kept only for reference as the mesh operator is being moved out of dpf
     # def write_vtk(self, filename, skin_only=True):
     #     """Return a vtk mesh"""
@@ -305,11 +365,18 @@ class MeshedRegion:
     #     self._message = skin.get_output(0, types.meshed_region)
     #     return MeshedRegion(self._server.channel, skin, self._model, name)
 
+    @instrumentation.traced
     def _as_vtk(self, as_linear=True, include_ids=False):
         """Convert DPF mesh to a PyVista unstructured grid."""
-        nodes = self.nodes.coordinates_field.data
-        etypes = self.elements.element_types_field.data
-        conn = self.elements.connectivities_field.data
+        nodes = self._topology_array(
+            "coordinates", lambda: self.nodes.coordinates_field.get_data(dtype=np.float64)
+        )
+        etypes = self._topology_array(
+            "element_types", lambda: self.elements.element_types_field.data
+        )
+        conn = self._topology_array(
+            "connectivity", lambda: self.elements.connectivities_field.data
+        )
         try:
             from ansys.dpf.core.vtk_helper import dpf_mesh_to_vtk
         except ModuleNotFoundError:
@@ -322,8 +389,8 @@ class MeshedRegion:
 
         # consider adding this when scoping request is faster
         if include_ids:
-            grid["node_ids"] = self.nodes.scoping.ids
-            grid["element_ids"] = self.elements.scoping.ids
+            grid["node_ids"] = self.nodes._get_ids()
+            grid["element_ids"] = self.elements._get_ids()
 
         return grid
 
@@ -444,24 +511,90 @@ class MeshedRegion:
         >>> deep_copy = meshed_region.deep_copy(server=other_server)
 
         """
-        node_ids = self.nodes.scoping.ids
-        element_ids = self.elements.scoping.ids
-        mesh = MeshedRegion(
-            num_nodes=len(node_ids), num_elements=len(element_ids), server=server
+        connectivities = self.elements.connectivities_field
+        mesh = MeshedRegion.from_arrays(
+            node_ids=self.nodes.scoping._get_ids(np_array=True),
+            coordinates=self.nodes.coordinates_field.get_data(dtype=np.float64),
+            element_ids=self.elements.scoping._get_ids(np_array=True),
+            element_types=self.elements.element_types_field.get_data(),
+            connectivity=connectivities.get_data(),
+            offsets=connectivities._data_pointer,
+            server=server,
         )
-        with self.nodes.coordinates_field.as_local_field() as coord:
-            for i, node in enumerate(mesh.nodes.add_nodes(len(node_ids))):
-                node.id = node_ids[i]
-                node.coordinates = coord.get_entity_data(i)
-        with self.elements.connectivities_field.as_local_field() as connect:
-            with self.elements.element_types_field.as_local_field() as types:
-                for i, elem in enumerate(mesh.elements.add_elements(len(element_ids))):
-                    elem.id = element_ids[i]
-                    elem.connectivity = connect.get_entity_data(i)
-                    elem.shape = element_types.shape(types.get_entity_data(i)[0])
         mesh.unit = self.unit
         return mesh
 
+    @staticmethod
+    def from_arrays(
+        node_ids,
+        coordinates,
+        element_ids=None,
+        element_types=None,
+        connectivity=None,
+        offsets=None,
+        server=None,
+    ):
+        """Create a meshed region from arrays of nodes and elements.
+
+        The nodes and elements are sent to the server in a few large requests.
+
+        Parameters
+        ----------
+        node_ids : list of int, numpy.ndarray
+            IDs of the nodes.
+        coordinates : numpy.ndarray
+            ``(n_nodes, 3)`` coordinates of the nodes.
+        element_ids : list of int, numpy.ndarray, optional
+            IDs of the elements.
+        element_types : list of int or element_types, numpy.ndarray, optional
+            Types of the elements, see
+            :class:`ansys.dpf.core.elements.element_types`.
+        connectivity : list of int, numpy.ndarray, optional
+            Concatenated node indices of all the elements.
+        offsets : list of int, numpy.ndarray, optional
+            Index of the first node of each element in ``connectivity``,
+            optionally followed by the size of ``connectivity``.
+        server : ansys.dpf.core.server, optional
+            Server with the channel connected to the remote or local instance.
+            The default is ``None``, in which case an attempt is made to use the
+            global server.
+
+        Returns
+        -------
+        mesh : MeshedRegion
+
+        Examples
+        --------
+        Create a mesh with two quadrilateral shells.
+
+        >>> import ansys.dpf.core as dpf
+        >>> import numpy as np
+        >>> coordinates = np.array([[0., 0., 0.], [1., 0., 0.], [2., 0., 0.],
+        ...                         [0., 1., 0.], [1., 1., 0.], [2., 1., 0.]])
+        >>> mesh = dpf.MeshedRegion.from_arrays(
+        ...     node_ids=range(1, 7),
+        ...     coordinates=coordinates,
+        ...     element_ids=[1, 2],
+        ...     element_types=[dpf.element_types.Quad4, dpf.element_types.Quad4],
+        ...     connectivity=[0, 1, 4, 3, 1, 2, 5, 4],
+        ...     offsets=[0, 4, 8],
+        ... )
+        >>> mesh.elements.n_elements
+        2
+
+        """
+        node_ids = np.asarray(node_ids, dtype=np.int32).reshape(-1)
+        n_elements = 0 if element_ids is None else len(element_ids)
+        mesh = MeshedRegion(
+            num_nodes=node_ids.size, num_elements=n_elements, server=server
+        )
+        mesh.nodes.add_nodes_from_arrays(node_ids, coordinates)
+        if n_elements:
+            mesh.elements.add_elements_from_arrays(
+                element_ids, element_types, connectivity, offsets
+            )
+        return mesh
+
     def __send_init_request(self, num_nodes=0, num_elements=0):
         request = meshed_region_pb2.CreateRequest()
         if num_nodes:
@@ -475,3 +608,87 @@ class MeshedRegion:
         _get_available_named_selections: None,
         named_selection: None
     }
+
+
+class _MeshTopologyCache:
+    """On-disk cache of the topology arrays of a mesh read from result files.
+
+    The arrays are saved as ``.npy`` files in a directory named after a
+    fingerprint of the result files (path, size and modification time) and
+    of the server version, and are loaded back with ``numpy.memmap``.
+
+    Parameters
+    ----------
+    directory : str
+        Directory of the arrays of this mesh.
+    """
+
+    # bump when the content of the cached arrays changes
+    _FORMAT_VERSION = 1
+
+    def __init__(self, directory):
+        self._directory = directory
+
+    @staticmethod
+    def from_data_sources(data_sources, server):
+        """Create the cache of the mesh read from data sources.
+
+        Returns
+        -------
+        topology_cache : _MeshTopologyCache or None
+            ``None`` when the cache is disabled or when the result files
+            are not accessible from the client.
+        """
+        root = misc.MESH_TOPOLOGY_CACHE_PATH
+        if root is None:
+            return None
+        files = data_sources.result_files
+        if not files or not all(os.path.isfile(path) for path in files):
+            return None
+        fingerprint = {
+            "format": _MeshTopologyCache._FORMAT_VERSION,
+            "server_version": server.version,
+            "files": [],
+        }
+        for path in sorted(files):
+            stat = os.stat(path)
+            fingerprint["files"].append(
+                [os.path.abspath(path), stat.st_size, stat.st_mtime_ns]
+            )
+        key = hashlib.sha256(
+            json.dumps(fingerprint, sort_keys=True).encode()
+        ).hexdigest()
+        return _MeshTopologyCache(os.path.join(root, key))
+
+    def get(self, name, getter):
+        """Load an array from the cache, or retrieve it and save it.
+
+        Parameters
+        ----------
+        name : str
+            Name of the array.
+        getter : callable
+            Retrieves the array from the server.
+
+        Returns
+        -------
+        numpy.ndarray
+            Copy-on-write memory map when the array is cached.
+        """
+        path = os.path.join(self._directory, name + ".npy")
+        if os.path.isfile(path):
+            try:
+                return np.load(path, mmap_mode="c")
+            except (OSError, ValueError):
+                pass
+        array = np.ascontiguousarray(getter())
+        try:
+            os.makedirs(self._directory, exist_ok=True)
+            # write then rename so that readers never see partial files
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                np.save(f, array)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+        return array
@@ -2,11 +2,23 @@
 import platform
 import glob
 import os
-from pkgutil import iter_modules
+from importlib.util import find_spec
 
 
 DEFAULT_FILE_CHUNK_SIZE = 524288
+DEFAULT_ARRAY_CHUNK_SIZE = 524288
+MIN_CHUNK_SIZE = 65536
+MAX_CHUNK_SIZE = 2097152
+ADAPTIVE_CHUNK_SIZE = True
+FILE_TRANSFER_WORKERS = 4
+FILE_TRANSFER_READ_AHEAD = 4
+UPLOAD_CACHE = False
+UPLOAD_CACHE_SAMPLING = None
 DYNAMIC_RESULTS = True
+MESH_TOPOLOGY_CACHE_PATH = None
+PYVISTA_CONFIGURED = False
+DEFERRED_CONNECTIONS = False
+TRANSFER_PRECISION = "double"
 
 # ANSYS CPython Workbench environment may not have scooby installed.
 try:
@@ -30,8 +42,14 @@ def module_exists(module_name):
     module_name : str
         Name of the module.
 
+    Notes
+    -----
+    The module is looked up without being imported.
     """
-    return module_name in (name for loader, name, ispkg in iter_modules())
+    try:
+        return find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
 
 
 class Report(ScoobyReport):
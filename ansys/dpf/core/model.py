@@ -12,6 +12,7 @@ from ansys import dpf
 from ansys.dpf.core import Operator
 from ansys.dpf.core.common import types
 from ansys.dpf.core.data_sources import DataSources
+from ansys.dpf.core.meshed_region import _MeshTopologyCache
 from ansys.dpf.core.results import Results, CommonResults
 from ansys.dpf.core.server import LOG
 from ansys.dpf.core import misc
@@ -394,6 +395,12 @@ class Metadata:
         if self._meshed_region is None:
             self._meshed_region = self.mesh_provider.get_output(0, types.meshed_region)
             self._meshed_region._set_stream_provider(self._stream_provider)
+            if misc.MESH_TOPOLOGY_CACHE_PATH is not None:
+                self._meshed_region._set_topology_cache(
+                    _MeshTopologyCache.from_data_sources(
+                        self._data_sources, self._server
+                    )
+                )
 
         return self._meshed_region
 
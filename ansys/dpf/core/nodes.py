@@ -7,7 +7,7 @@ import numpy as np
 
 
 from ansys import dpf
-from ansys.dpf.core import field, property_field
+from ansys.dpf.core import field, misc, property_field, scoping
 from ansys.grpc.dpf import meshed_region_pb2
 from ansys.dpf.core.errors import protect_grpc
 
@@ -135,6 +135,10 @@ class Nodes:
 
     def node_by_id(self, id):
         """Array of node coordinates ordered by ID."""
+        if self._mapping_id_to_index is not None:
+            index = self._mapping_id_to_index.get(id)
+            if index is not None:
+                return self.__get_node(nodeindex=index)
         return self.__get_node(nodeid=id)
 
     def node_by_index(self, index):
@@ -262,12 +266,23 @@ class Nodes:
         fieldOut = self._mesh._stub.ListProperty(request)
         return field.Field(server=self._mesh._server, field=fieldOut)
 
+    def _get_ids(self):
+        """Node IDs as an array, read from the mesh topology cache when enabled."""
+        return self._mesh._topology_array(
+            "node_ids", lambda: self.scoping._get_ids(np_array=True)
+        )
+
     def _build_mapping_id_to_index(self):
         """Retrieve a mapping between IDs and indices of the entity."""
-        return {eid: i for i, eid in enumerate(self.scoping.ids)}
+        return scoping._IdToIndexMap(self._get_ids())
 
     @property
     def mapping_id_to_index(self):
+        """Mapping between the IDs and indices of the nodes.
+
+        The mapping is built once from the node scoping and is also used
+        by :func:`map_scoping` and :func:`node_by_id`.
+        """
         if self._mapping_id_to_index is None:
             self._mapping_id_to_index = self._build_mapping_id_to_index()
         return self._mapping_id_to_index
@@ -310,10 +325,7 @@ class Nodes:
         """
         if external_scope.location in ["Elemental", "NodalElemental"]:
             raise ValueError('Input scope location must be "Nodal"')
-        arr = np.array(list(map(self.mapping_id_to_index.get, external_scope.ids)))
-        mask = arr != None
-        ind = arr[mask].astype(np.int)
-        return ind, mask
+        return self.mapping_id_to_index.map(external_scope._get_ids(np_array=True))
 
     def add_node(self, id, coordinates):
         """Add a node in the mesh.
@@ -325,12 +337,58 @@ class Nodes:
 
         coordinates : list[float]
             List of ``[x, y, z]`` coordinates for the node.
+
+        Notes
+        -----
+        Nodes and elements added one at a time are sent to the server
+        together, before the next request is made on the mesh.
         """
-        request = meshed_region_pb2.AddRequest(mesh=self._mesh._message)
-        node_request = meshed_region_pb2.NodeRequest(id=id)
-        node_request.coordinates.extend(coordinates)
-        request.nodes.append(node_request)
-        self._mesh._stub.Add(request)
+        if isinstance(coordinates, (np.ndarray, np.generic)):
+            coordinates = coordinates.reshape(-1).tolist()
+        self._mesh._add_request().nodes.add(id=id, coordinates=coordinates)
+        self._mesh._flush_add_request(_MAX_PENDING_ENTITIES)
+
+    def add_nodes_from_arrays(self, ids, coordinates):
+        """Add nodes in the mesh from arrays of IDs and coordinates.
+
+        The nodes are sent to the server in a few large requests.
+
+        Parameters
+        ----------
+        ids : list of int, numpy.ndarray
+            IDs of the new nodes.
+        coordinates : numpy.ndarray
+            ``(n_nodes, 3)`` coordinates of the new nodes.
+
+        Examples
+        --------
+        >>> import ansys.dpf.core as dpf
+        >>> import numpy as np
+        >>> meshed_region = dpf.MeshedRegion(num_nodes=4)
+        >>> coordinates = np.array([[0., 0., 0.], [1., 0., 0.],
+        ...                         [1., 1., 0.], [0., 1., 0.]])
+        >>> meshed_region.nodes.add_nodes_from_arrays([1, 2, 3, 4], coordinates)
+        >>> meshed_region.nodes.n_nodes
+        4
+
+        """
+        ids = np.asarray(ids, dtype=np.int32).reshape(-1).tolist()
+        coordinates = np.asarray(coordinates, dtype=np.float64).reshape(-1, 3)
+        if coordinates.shape[0] != len(ids):
+            raise ValueError(
+                f"{coordinates.shape[0]} coordinates are given for {len(ids)} nodes."
+            )
+        coordinates = coordinates.tolist()
+        # a node takes an int32 id and 3 doubles
+        chunk = max(misc.DEFAULT_ARRAY_CHUNK_SIZE // 28, 1)
+        mesh_message = self._mesh._message
+        stub = self._mesh._stub
+        for start in range(0, len(ids), chunk):
+            request = meshed_region_pb2.AddRequest(mesh=mesh_message)
+            add = request.nodes.add
+            for i in range(start, min(start + chunk, len(ids))):
+                add(id=ids[i], coordinates=coordinates[i])
+            stub.Add(request)
 
     def add_nodes(self, num):
         """Add a number of nodes in the mesh.
@@ -366,6 +424,10 @@ class Nodes:
         self._mesh._stub.Add(request)
 
 
+# number of nodes and elements added one at a time after which they are sent
+_MAX_PENDING_ENTITIES = 10000
+
+
 class NodeAdder:
     """Adds a new node to a meshed region.
 
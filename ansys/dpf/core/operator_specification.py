@@ -0,0 +1,117 @@
+"""
+.. _ref_operator_specification:
+
+Operator Specification
+======================
+Caches the specifications of the operators, parsed once per server,
+operator name and configuration, and shared by all the operator instances.
+"""
+from ansys.dpf.core import server as serverlib
+from ansys.dpf.core.errors import protect_grpc
+from ansys.dpf.core.outputs import _outputs_by_python_type
+from ansys.grpc.dpf import operator_pb2, operator_pb2_grpc
+
+
+class OperatorSpecification:
+    """Specification of an operator parsed on the client side.
+
+    Parameters
+    ----------
+    name : str
+        Name of the operator.
+    spec : operator_pb2.Specification
+        Specification of the operator sent by the server.
+
+    Attributes
+    ----------
+    name : str
+        Name of the operator.
+    description : str
+        Description of the operator.
+    inputs : dict
+        Input pin specifications by pin number.
+    outputs : dict
+        Output pin specifications by pin number.
+    outputs_by_type : dict
+        Output pins by Python type name, ``"Any"`` matching all the outputs.
+    """
+
+    def __init__(self, name, spec):
+        self.name = name
+        self.description = spec.description
+        self.inputs = dict(spec.map_input_pin_spec)
+        self.outputs = dict(spec.map_output_pin_spec)
+        self.outputs_by_type = _outputs_by_python_type(self.outputs)
+
+    def __repr__(self):
+        return (
+            f"OperatorSpecification({self.name!r}, inputs={list(self.inputs)}, "
+            f"outputs={list(self.outputs)})"
+        )
+
+
+def _config_key(config):
+    if config is None:
+        return None
+    return config._message.SerializeToString()
+
+
+def _server_specifications(server):
+    specs = getattr(server, "_operator_specifications", None)
+    if specs is None:
+        specs = {}
+        server._operator_specifications = specs
+    return specs
+
+
+@protect_grpc
+def _request_specification(server, name, config=None):
+    """Create a throwaway operator on the server to read its specification."""
+    stub = operator_pb2_grpc.OperatorServiceStub(server.channel)
+    request = operator_pb2.CreateOperatorRequest()
+    request.name = name
+    if config:
+        request.config.CopyFrom(config._message)
+    message = stub.Create(request)
+    try:
+        return message.spec
+    finally:
+        stub.Delete(message)
+
+
+def get_specification(name, server=None, config=None, spec=None):
+    """Retrieve the specification of an operator from the server's registry.
+
+    The specification is requested to the server and parsed only the first
+    time it is needed.
+
+    Parameters
+    ----------
+    name : str
+        Name of the operator. For example, ``"U"``.
+    server : server.DPFServer, optional
+        Server with the channel connected to the remote or local instance. The
+        default is ``None``, in which case an attempt is made to use the global
+        server.
+    config : ansys.dpf.core.Config, optional
+        Configuration of the operator. The default is ``None``.
+    spec : operator_pb2.Specification, optional
+        Specification already sent by the server, which is parsed when the
+        registry does not hold it yet. The default is ``None``, in which case
+        it is requested to the server.
+
+    Returns
+    -------
+    OperatorSpecification
+    """
+    if server is None:
+        server = serverlib._global_server()
+    specs = _server_specifications(server)
+    key = (name, _config_key(config))
+    specification = specs.get(key)
+    if specification is None:
+        if spec is None:
+            spec = _request_specification(server, name, config)
+        specification = OperatorSpecification(name, spec)
+        specs[key] = specification
+    return specification
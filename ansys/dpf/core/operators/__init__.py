@@ -4,19 +4,34 @@
 ansys.dpf.core.operators
 ========================
 """
-  
+import importlib
 
-from . import result
-from . import math
-from . import min_max
-from . import scoping
-from . import utility
-from . import metadata
-from . import logic
-from . import mesh
-from . import filter
-from . import serialization
-from . import averaging
-from . import geo
-from . import invariant
-from . import mapping
+# the categories are imported on first access
+_CATEGORIES = (
+    "result",
+    "math",
+    "min_max",
+    "scoping",
+    "utility",
+    "metadata",
+    "logic",
+    "mesh",
+    "filter",
+    "serialization",
+    "averaging",
+    "geo",
+    "invariant",
+    "mapping",
+)
+
+__all__ = list(_CATEGORIES)
+
+
+def __getattr__(name):
+    if name in _CATEGORIES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_CATEGORIES))
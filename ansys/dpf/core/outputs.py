@@ -61,22 +61,23 @@ class _Outputs:
         Dictionary of outputs.
     operator :
 
+    outputs_by_type : dict, optional
+        Output pins by Python type name, computed from ``dict_outputs`` when
+        not given.
     """
 
-    def __init__(self, dict_outputs, operator):
+    def __init__(self, dict_outputs, operator, outputs_by_type=None):
         self._dict_outputs = dict_outputs
         self._operator = operator
         self._outputs = []
+        self._outputs_by_type = outputs_by_type
 
     def _get_given_output(self, input_type_name):
+        if self._outputs_by_type is None:
+            self._outputs_by_type = _outputs_by_python_type(self._dict_outputs)
         corresponding_pins = []
         for asked_camel_types in input_type_name:
-            for pin in self._dict_outputs:
-                for cpp_type in self._dict_outputs[pin].type_names:
-                    if map_types_to_python[cpp_type] == asked_camel_types:
-                        corresponding_pins.append(pin)
-                    elif asked_camel_types == "Any":
-                        corresponding_pins.append(pin)
+            corresponding_pins.extend(self._outputs_by_type.get(asked_camel_types, ()))
         return corresponding_pins
 
     def __str__(self):
@@ -95,6 +96,19 @@ class _Outputs:
         return docstr
 
 
+def _outputs_by_python_type(dict_outputs):
+    """Map each Python type name to the output pins returning it.
+
+    ``"Any"`` matches all the output pins.
+    """
+    table = {"Any": []}
+    for pin, spec in dict_outputs.items():
+        for cpp_type in spec.type_names:
+            table.setdefault(map_types_to_python[cpp_type], []).append(pin)
+            table["Any"].append(pin)
+    return table
+
+
 def _clearRepeatedMessage(message):
     try:
         while True:
@@ -135,8 +149,8 @@ class Outputs(_Outputs):
 
     """
 
-    def __init__(self, dict_outputs, operator):
-        super().__init__(dict_outputs, operator)
+    def __init__(self, dict_outputs, operator, outputs_by_type=None):
+        super().__init__(dict_outputs, operator, outputs_by_type)
         for pin in self._dict_outputs:
             if (
                 len(self._dict_outputs[pin].type_names) == 1
@@ -12,6 +12,20 @@ from ansys.dpf import core
 from ansys.dpf.core.common import locations, DefinitionLabels
 from ansys.dpf.core.common import shell_layers as eshell_layers
 from ansys.dpf.core import errors as dpf_errors
+from ansys.dpf.core import settings
+
+
+def _import_pyvista():
+    """Import PyVista and apply the default DPF configuration on first use."""
+    try:
+        import pyvista as pv
+    except ModuleNotFoundError:
+        raise ModuleNotFoundError(
+            "To use plotting capabilities, please install pyvista "
+            "with :\n pip install pyvista>=0.24.0"
+        )
+    settings._set_default_pyvista_config_once()
+    return pv
 
 
 def plot_chart(fields_container):
@@ -68,6 +82,7 @@ class Plotter:
             ee ``help(pyvista.plot)``.
 
         """
+        _import_pyvista()
         kwargs.setdefault("color", "w")
         kwargs.setdefault("show_edges", True)
         return self._mesh.grid.plot(**kwargs)
@@ -258,13 +273,7 @@ class Plotter:
         # create the plotter and add the meshes
         background = kwargs.pop("background", None)
 
-        try:
-            import pyvista as pv
-        except ModuleNotFoundError:
-            raise ModuleNotFoundError(
-                "To use plotting capabilities, please install pyvista "
-                "with :\n pip install pyvista>=0.24.0"
-            )
+        pv = _import_pyvista()
         plotter = pv.Plotter(notebook=notebook, off_screen=off_screen)
 
         # add meshes
@@ -290,13 +299,7 @@ class Plotter:
         This method is private.  DPF publishes a VTK file and displays
         this file using PyVista.
         """
-        try:
-            import pyvista as pv
-        except ModuleNotFoundError:
-            raise ModuleNotFoundError(
-                "To use plotting capabilities, please install pyvista "
-                "with :\n pip install pyvista>=0.24.0"
-            )
+        pv = _import_pyvista()
 
         plotter = pv.Plotter(notebook=notebook)
         # mesh_provider = Operator("MeshProvider")
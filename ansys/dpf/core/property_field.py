@@ -3,10 +3,12 @@ PropertyField
 =============
 """
 
+from ansys.dpf.core.cache import class_handling_cache
 from ansys.dpf.core.common import natures, locations
 from ansys.dpf.core.field_base import _FieldBase, _LocalFieldBase
 
 
+@class_handling_cache
 class PropertyField(_FieldBase):
     """Describes field properties such as connectivity.
 
@@ -149,6 +151,24 @@ class PropertyField(_FieldBase):
         """
         return _LocalPropertyField(self)
 
+    _to_cache = {
+        _FieldBase._get_component_count: [
+            _FieldBase._set_data,
+            _FieldBase._set_scoping,
+            _FieldBase.append,
+        ],
+        _FieldBase._get_elementary_data_count: [
+            _FieldBase._set_data,
+            _FieldBase._set_scoping,
+            _FieldBase.append,
+        ],
+        _FieldBase._entities_data_source: [
+            _FieldBase._set_data,
+            _FieldBase._set_data_pointer,
+            _FieldBase.append,
+        ],
+    }
+
 
 class _LocalPropertyField(_LocalFieldBase, PropertyField):
     """Caches the internal data of a field so that it can be modified locally.
@@ -7,9 +7,13 @@ This module contains the Results and Result classes that are created by the mode
 to easily access results in result files."""
 import functools
 
+import numpy as np
 
 from ansys.dpf.core import Operator
 from ansys.dpf.core import errors
+from ansys.dpf.core import server as serverlib
+from ansys.dpf.core.common import locations, types
+from ansys.dpf.core.field_base import _requested_dtype
 from ansys.dpf.core.scoping import Scoping
 from ansys.dpf.core.custom_fields_container import (
     ElShapeFieldsContainer,
@@ -101,8 +105,9 @@ class Results:
     def _connect_operators(self):
         """Dynamically add operators for results.
 
-        The new operator's subresults are connected to the model's
-        streams.
+        The properties are created from the result info only: the operators
+        are created when the results are first used, and their documentation
+        when it is first read.
 
         Examples
         --------
@@ -122,20 +127,14 @@ class Results:
         # dynamically add function based on input type
         self._op_map_rev = {}
         for result_type in self._result_info:
-            try:
-                doc = Operator(
-                    result_type.operator_name, server=self._model._server
-                ).__str__()
-                bound_method = self.__result__
-                method2 = functools.partial(bound_method, result_type)
-                setattr(self.__class__, result_type.name, property(method2, doc=doc))
-
-                self._op_map_rev[result_type.name] = result_type.name
-            except errors.DPFServerException:
-                pass
-            except Exception as e:
-                print(result_type.name)
-                raise e
+            bound_method = self.__result__
+            method2 = functools.partial(bound_method, result_type)
+            setattr(
+                self.__class__,
+                result_type.name,
+                _ResultProperty(method2, result_type.operator_name, self._model._server),
+            )
+            self._op_map_rev[result_type.name] = result_type.name
 
     def __str__(self):
         return str(self._result_info)
@@ -200,32 +199,29 @@ class Result:
         else:
             self._result_info = result_info
         self._specific_fc_type = None
-        from ansys.dpf.core import operators
+        self._result_operator = None
+
+    @property
+    def _operator(self):
+        """Result provider, created on first use and connected to the model's streams."""
+        if self._result_operator is None:
+            from ansys.dpf.core import operators
 
-        try:
-            # create the operator to read its documentation
-            # if the operator doesn't exist, the method will not be added
-            doc = Operator(
-                self._result_info.operator_name, server=self._model._server
-            ).__str__()
-            self.__doc__ = doc
             if hasattr(operators, "result") and hasattr(
                 operators.result, self._result_info.name
             ):
-                self._operator = getattr(operators.result, self._result_info.name)(
+                op = getattr(operators.result, self._result_info.name)(
                     server=self._model._server
                 )
             else:
-                self._operator = Operator(
-                    self._result_info.operator_name, server=self._model._server
-                )
-            self._operator._add_sub_res_operators(self._result_info.sub_results)
-            self._model.__connect_op__(self._operator)
-        except errors.DPFServerException:
-            pass
-        except Exception as e:
-            print(self._result_info.name)
-            raise e
+                op = Operator(self._result_info.operator_name, server=self._model._server)
+            op._add_sub_res_operators(self._result_info.sub_results)
+            self._model.__connect_op__(op)
+            self._result_operator = op
+            self.__doc__ = _operator_doc(
+                self._result_info.operator_name, self._model._server, op
+            )
+        return self._result_operator
 
     def __call__(self, time_scoping=None, mesh_scoping=None):
         op = self._operator
@@ -555,6 +551,157 @@ class Result:
         self._location = location
         return self
 
+    def time_history(self, ids, component=None, max_workers=4):
+        """Extract the time history of the result on a set of entities.
+
+        The result is rescoped on the server with the ``Rescope_fc``
+        operator, so that only the values on ``ids`` are transferred, and
+        the fields of the different time sets are looked up and downloaded
+        concurrently into a single preallocated array.
+
+        The time scoping and location previously specified on this result
+        are used. When no time scoping is specified, all the time sets
+        are extracted. The previously specified mesh scoping is ignored.
+
+        Parameters
+        ----------
+        ids : list[int], numpy.ndarray
+            IDs of the nodes or elements (depending on the location of the
+            result) to extract. IDs without a value are filled with ``nan``.
+        component : int, optional
+            Index of a single component to extract. The default is ``None``,
+            in which case all the components are extracted.
+        max_workers : int, optional
+            Maximum number of time sets looked up and downloaded at the same time.
+            The default is ``4``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of shape ``(n_times, n_ids, n_components)`` ordered by
+            increasing time set ID, in the precision set with
+            :func:`ansys.dpf.core.settings.set_transfer_precision`.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.msup_transient)
+        >>> disp = model.results.displacement
+        >>> disp.time_history([1, 2, 3]).shape
+        (20, 3, 3)
+        >>> disp.time_history([1, 2, 3], component=0).shape
+        (20, 3, 1)
+
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        server = self._model._server
+        ids = np.asarray(ids, dtype=np.int32).reshape(-1)
+        location = self._location or self._result_info.native_scoping_location
+        mesh_scoping = Scoping(location=location, server=server)
+        mesh_scoping.ids = ids
+
+        time_scoping = self._time_scoping
+        if time_scoping is None:
+            time_scoping = list(
+                range(
+                    1, len(self._model.metadata.time_freq_support.time_frequencies) + 1
+                )
+            )
+
+        # a dedicated provider is used to leave this result's operator untouched
+        provider = Operator(self._result_info.operator_name, server=server)
+        self._model.__connect_op__(provider)
+        provider.inputs.time_scoping(time_scoping)
+        if self._location:
+            provider.inputs.requested_location(self._location)
+
+        rescope = Operator("Rescope_fc", server=server)
+        rescope.connect(0, provider, 0)
+        rescope.connect(1, mesh_scoping)
+        rescope.connect(2, float("nan"))
+        output = rescope
+        if component is not None:
+            output = Operator("component_selector_fc", server=server)
+            output.connect(0, rescope, 0)
+            output.connect(1, int(component))
+        fc = output.get_output(0, types.fields_container)
+
+        time_ids = np.sort(fc.get_label_scoping("time")._get_ids(np_array=True))
+        if time_ids.size == 0:
+            return np.empty((0, ids.size, 0))
+
+        first_field = fc.get_field_by_time_id(int(time_ids[0]))
+        ncomp = first_field.component_count
+        if (
+            first_field.location == locations.elemental_nodal
+            or first_field.elementary_data_count != ids.size
+        ):
+            raise ValueError(
+                f"The result on {first_field.location} location has not one value "
+                "per ID. Use 'on_location' to request a nodal or elemental location."
+            )
+        # allocated in the precision of the transfers
+        out = np.empty((time_ids.size, ids.size, ncomp), dtype=_requested_dtype(None))
+
+        def fetch(index):
+            # the fields are looked up and downloaded by the workers
+            if index == 0:
+                field = first_field
+            else:
+                field = fc.get_field_by_time_id(int(time_ids[index]))
+            field.get_data(out=out[index], dtype=out.dtype)
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            # consume the results to re-raise the errors
+            list(executor.map(fetch, range(time_ids.size)))
+        return out
+
+
+class _ResultProperty(property):
+    """Property returning a ``Result`` and whose documentation is read from the
+    result provider on first access only."""
+
+    def __init__(self, fget, operator_name, server):
+        super().__init__(fget)
+        self._operator_name = operator_name
+        self._server = server
+
+    @property
+    def __doc__(self):
+        return _operator_doc(self._operator_name, self._server)
+
+    @__doc__.setter
+    def __doc__(self, value):
+        pass
+
+
+# documentation of the operators by server version and operator name
+_OPERATOR_DOCS = {}
+
+
+def _operator_doc(operator_name, server=None, operator=None):
+    """Return the documentation of an operator, which is requested once per
+    server version.
+
+    An empty string is returned, and not cached, when the server has no such
+    operator, so that an operator loaded later is documented.
+    """
+    if server is None:
+        server = serverlib._global_server()
+    key = (server.version, operator_name)
+    doc = _OPERATOR_DOCS.get(key)
+    if doc is None:
+        try:
+            if operator is None:
+                operator = Operator(operator_name, server=server)
+            doc = operator.__str__()
+        except errors.DPFServerException:
+            return ""
+        _OPERATOR_DOCS[key] = doc
+    return doc
+
 
 class CommonResults(Results):
     """Default implementation of the class:'Results'.
@@ -6,12 +6,13 @@ Scoping
 """
 
 import array
-import sys
+from collections.abc import Mapping
+import time
 
 import numpy as np
-from ansys.dpf.core.check_version import server_meet_version, version_requires
+from ansys.dpf.core.check_version import version_requires
 from ansys.dpf.core.common import _common_progress_bar, locations
-from ansys.dpf.core import misc
+from ansys.dpf.core import chunking, instrumentation
 from ansys.grpc.dpf import base_pb2, scoping_pb2, scoping_pb2_grpc
 
 
@@ -125,22 +126,24 @@ class Scoping:
         -----
         Print a progress bar.
         """
-        # must convert to a list for gRPC
+        # must convert to a contiguous int32 array for gRPC
         if isinstance(ids, range):
-            ids = np.array(list(ids), dtype=np.int32)
-        elif not isinstance(ids, (np.ndarray, np.generic)):
-            ids = np.array(ids, dtype=np.int32)
+            ids = np.arange(ids.start, ids.stop, ids.step, dtype=np.int32)
         else:
-            ids = np.array(list(ids), dtype=np.int32)
+            ids = np.ascontiguousarray(ids, dtype=np.int32).reshape(-1)
 
         metadata = [("size_int", f"{len(ids)}")]
         request = scoping_pb2.UpdateIdsRequest()
         request.scoping.CopyFrom(self._message)
-        if server_meet_version("2.1", self._server):
-            self._stub.UpdateIds(_data_chunk_yielder(request, ids), metadata=metadata)
+        capabilities = self._server.capabilities
+        if capabilities.streaming:
+            self._stub.UpdateIds(
+                _data_chunk_yielder(request, ids, server=self._server), metadata=metadata
+            )
         else:
             self._stub.UpdateIds(
-                _data_chunk_yielder(request, ids, 8.0e6), metadata=metadata
+                _data_chunk_yielder(request, ids, capabilities.max_message_size),
+                metadata=metadata,
             )
 
     def _get_ids(self, np_array=False):
@@ -154,7 +157,7 @@ class Scoping:
         -----
         Print a progress bar.
         """
-        if server_meet_version("2.1", self._server):
+        if self._server.capabilities.streaming:
             service = self._stub.List(self._message)
             dtype = np.int32
             return _data_get_chunk_(dtype, service, np_array)
@@ -221,35 +224,165 @@ class Scoping:
         request.scoping.CopyFrom(self._message)
         return self._stub.Get(request).index
 
-    def id(self, index: int):
+    def _get_ids_at(self, indices):
+        """Retrieve the IDs at an array of indices in one request.
+
+        Parameters
+        ----------
+        indices : numpy.ndarray
+            Indices of the IDs.
+
+        Returns
+        -------
+        ids : numpy.ndarray
+            ``int32`` IDs.
+        """
+        return self._get_ids(np_array=True)[indices]
+
+    def _get_indices(self, ids):
+        """Retrieve the indices of an array of IDs in one request.
+
+        Parameters
+        ----------
+        ids : numpy.ndarray
+            IDs to retrieve.
+
+        Returns
+        -------
+        indices : numpy.ndarray
+            ``int32`` indices, ``-1`` where the ID is not in the scoping.
+        """
+        return _IdToIndexMap(self._get_ids(np_array=True)).indices(ids)
+
+    def id(self, index):
         """Retrieve the ID at a given index.
 
         Parameters
         ----------
-        index : int
-            Index for the ID.
+        index : int, list of int, numpy.ndarray
+            Index for the ID. When several indices are given, all the IDs
+            are retrieved at once.
 
         Returns
         -------
-        size : int
+        id : int, numpy.ndarray
 
         """
-        return self._get_id(index)
+        if np.ndim(index) == 0:
+            return self._get_id(index)
+        return self._get_ids_at(np.asarray(index, dtype=np.int64))
 
-    def index(self, id: int):
+    def index(self, id):
         """Retrieve the index of a given ID.
 
         Parameters
         ----------
-        id : int
-            ID for the index to retrieve.
+        id : int, list of int, numpy.ndarray
+            ID for the index to retrieve. When several IDs are given, all
+            the indices are retrieved at once.
 
         Returns
         -------
-        size : int
+        index : int, numpy.ndarray
+            Index, or ``int32`` indices with ``-1`` for the IDs
+            not found in the scoping.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> scoping = dpf.Scoping(ids=[4, 8, 2])
+        >>> scoping.index([2, 4, 5])
+        array([ 2,  0, -1], dtype=int32)
+
+        """
+        if np.ndim(id) == 0:
+            return self._get_index(id)
+        return self._get_indices(id)
+
+    def _new_from_ids(self, ids):
+        scop = Scoping(server=self._server)
+        scop.ids = ids
+        location = self.location
+        if location:
+            scop.location = location
+        return scop
+
+    def intersection(self, other):
+        """Create a scoping with the IDs of this scoping that are also in another one.
+
+        The order of the IDs of this scoping is kept.
+
+        Parameters
+        ----------
+        other : Scoping, list of int, numpy.ndarray
+            Scoping or IDs to intersect with.
+
+        Returns
+        -------
+        scoping : Scoping
+            Scoping on the same server and location as this one.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> scoping = dpf.Scoping(ids=[1, 2, 3, 4])
+        >>> scoping.intersection([4, 2, 7]).ids
+        [2, 4]
 
         """
-        return self._get_index(id)
+        ids = self._get_ids(np_array=True)
+        return self._new_from_ids(ids[np.isin(ids, _ids_of(other))])
+
+    def union(self, other):
+        """Create a scoping with the IDs of this scoping followed by the new IDs of another one.
+
+        Parameters
+        ----------
+        other : Scoping, list of int, numpy.ndarray
+            Scoping or IDs to add.
+
+        Returns
+        -------
+        scoping : Scoping
+            Scoping on the same server and location as this one.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> scoping = dpf.Scoping(ids=[1, 2, 3])
+        >>> scoping.union([4, 2, 7]).ids
+        [1, 2, 3, 4, 7]
+
+        """
+        ids = self._get_ids(np_array=True)
+        other_ids = _ids_of(other)
+        extra = other_ids[~np.isin(other_ids, ids)]
+        _, first = np.unique(extra, return_index=True)
+        return self._new_from_ids(np.concatenate([ids, extra[np.sort(first)]]))
+
+    def difference(self, other):
+        """Create a scoping with the IDs of this scoping that are not in another one.
+
+        Parameters
+        ----------
+        other : Scoping, list of int, numpy.ndarray
+            Scoping or IDs to remove.
+
+        Returns
+        -------
+        scoping : Scoping
+            Scoping on the same server and location as this one.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> scoping = dpf.Scoping(ids=[1, 2, 3, 4])
+        >>> scoping.difference([4, 2, 7]).ids
+        [1, 3]
+
+        """
+        ids = self._get_ids(np_array=True)
+        return self._new_from_ids(ids[~np.isin(ids, _ids_of(other))])
 
     @property
     def ids(self):
@@ -387,7 +520,9 @@ class Scoping:
 class _LocalScoping(Scoping):
     """Caches the internal data of the scoping so that it can be modified locally.
 
-    A single update request is sent to the server when the local scoping is deleted.
+    The IDs are kept in a contiguous ``int32`` array and the ID to index
+    mapping is only built on the first lookup. A single update request is
+    sent to the server when the local scoping is deleted.
 
     Parameters
     ----------
@@ -404,12 +539,29 @@ class _LocalScoping(Scoping):
         self.__cache_data__()
 
     def __cache_data__(self):
-        self._scoping_ids_copy = self._owner_scoping._get_ids(False)
+        self._ids_copy = np.array(
+            self._owner_scoping._get_ids(np_array=True), dtype=np.int32
+        ).reshape(-1)
+        self._num_ids = self._ids_copy.size
         self._location = self._owner_scoping.location
         self.__init_map__()
 
     def __init_map__(self):
-        self._mapper = dict(zip(self._scoping_ids_copy, np.arange(self._count())))
+        # the mapper is built lazily, the ids modified since it was built
+        # are tracked in a dict until the next batch lookup
+        self._mapper = None
+        self._modified_ids = {}
+
+    def _reserve(self, size):
+        if size > self._ids_copy.size:
+            ids = np.empty(max(size, 2 * self._ids_copy.size, 16), dtype=np.int32)
+            ids[: self._num_ids] = self._ids_copy[: self._num_ids]
+            self._ids_copy = ids
+
+    def _build_mapper(self):
+        self._mapper = _IdToIndexMap(self._ids_copy[: self._num_ids].copy())
+        self._modified_ids = {}
+        return self._mapper
 
     def _count(self):
         """
@@ -418,7 +570,7 @@ class _LocalScoping(Scoping):
         count : int
             Number of scoping IDs.
         """
-        return len(self._scoping_ids_copy)
+        return self._num_ids
 
     def _get_location(self):
         """Retrieve the location of the IDs.
@@ -447,18 +599,11 @@ class _LocalScoping(Scoping):
         ----------
         ids : list of int
             IDs to set.
-
-        Notes
-        -----
-        Print a progress bar.
         """
-        # must convert to a list for gRPC
         if isinstance(ids, range):
-            ids = list(ids)
-        elif isinstance(ids, (np.ndarray, np.generic)):
-            ids = ids.tolist()
-
-        self._scoping_ids_copy = ids
+            ids = np.arange(ids.start, ids.stop, ids.step, dtype=np.int32)
+        self._ids_copy = np.array(ids, dtype=np.int32).reshape(-1)
+        self._num_ids = self._ids_copy.size
         self.__init_map__()
 
     def _get_ids(self, np_array=False):
@@ -467,15 +612,11 @@ class _LocalScoping(Scoping):
         -------
         ids : list[int], numpy.array (if np_array==True)
             List of IDs.
-
-        Notes
-        -----
-        Print a progress bar.
         """
         if np_array:
-            return np.ndarray(self._scoping_ids_copy, dtype=np.int32)
+            return self._ids_copy[: self._num_ids].copy()
         else:
-            return self._scoping_ids_copy
+            return self._ids_copy[: self._num_ids].tolist()
 
     def set_id(self, index, scopingid):
         """Set the ID of a scoping's index.
@@ -487,16 +628,29 @@ class _LocalScoping(Scoping):
         scopingid : int
             ID of the scoping.
         """
-        init_size = self._count()
-        if init_size <= index:
-            for i in range(init_size, index+1):
-                self._scoping_ids_copy.append(-1)
-        self._scoping_ids_copy[index] = scopingid
-        self._mapper[scopingid] = index
+        if self._num_ids <= index:
+            self._reserve(index + 1)
+            self._ids_copy[self._num_ids: index + 1] = -1
+            self._num_ids = index + 1
+        self._ids_copy[index] = scopingid
+        self._modified_ids[scopingid] = index
 
     def append(self, id):
-        self._scoping_ids_copy.append(id)
-        self._mapper[id] = len(self)-1
+        self.set_id(self._num_ids, id)
+
+    def extend(self, ids):
+        """Append several IDs at the end of the scoping.
+
+        Parameters
+        ----------
+        ids : list of int, numpy.ndarray
+            IDs to append.
+        """
+        ids = np.asarray(ids, dtype=np.int32).reshape(-1)
+        self._reserve(self._num_ids + ids.size)
+        self._ids_copy[self._num_ids: self._num_ids + ids.size] = ids
+        self._num_ids += ids.size
+        self.__init_map__()
 
     def _get_id(self, index):
         """Retrieve the index that the scoping ID is located on.
@@ -511,7 +665,10 @@ class _LocalScoping(Scoping):
         id : int
             ID of the scoping's index.
         """
-        return self._scoping_ids_copy[index]
+        return int(self._ids_copy[: self._num_ids][index])
+
+    def _get_ids_at(self, indices):
+        return self._ids_copy[: self._num_ids][indices]
 
     def _get_index(self, scopingid):
         """Retrieve an ID corresponding to an ID in the scoping.
@@ -524,13 +681,25 @@ class _LocalScoping(Scoping):
         Returns
         -------
         index : int
-            Index of the ID.
+            Index of the ID, ``-1`` if the ID is not in the scoping.
         """
-        return self._mapper[scopingid]
+        index = self._modified_ids.get(scopingid)
+        if index is None or self._ids_copy[index] != scopingid:
+            mapper = self._mapper if self._mapper is not None else self._build_mapper()
+            index = mapper.get(scopingid)
+            if index is None or self._ids_copy[index] != scopingid:
+                # the id was overwritten by set_id since the mapper was built
+                return -1
+        return index
+
+    def _get_indices(self, ids):
+        if self._mapper is None or self._modified_ids:
+            self._build_mapper()
+        return self._mapper.indices(ids)
 
     def release_data(self):
         """Release the data."""
-        super()._set_ids(self._scoping_ids_copy)
+        super()._set_ids(self._ids_copy[: self._num_ids])
         super()._set_location(self._location)
 
     def __enter__(self):
@@ -550,9 +719,44 @@ class _LocalScoping(Scoping):
         pass
 
 
-def _data_chunk_yielder(request, data, chunk_size=None):
+def _ids_of(scoping):
+    """Return the IDs of a scoping or of a sequence of IDs as an array."""
+    if isinstance(scoping, Scoping):
+        return scoping._get_ids(np_array=True)
+    return np.asarray(scoping, dtype=np.int32).reshape(-1)
+
+
+@instrumentation.traced
+def _data_chunk_yielder(request, data, chunk_size=None, server=None, dtype=None):
+    """Stream an array to the server in chunks of whole values.
+
+    Only one chunk of the array is copied at a time, so that a
+    memory-mapped array is read from the disk as it is sent.
+
+    Parameters
+    ----------
+    request : protobuf message
+        Request whose ``array`` attribute receives the raw bytes of each chunk.
+    data : numpy.ndarray
+        Flat contiguous array to send.
+    chunk_size : int, optional
+        Fixed size in bytes of the chunks. The default is ``None``, in which
+        case the chunk size of the arrays sent to ``server`` is used and
+        adapted to the throughput of this upload, see
+        :mod:`ansys.dpf.core.chunking`.
+    server : ansys.dpf.core.server.DpfServer, optional
+        Server receiving the array.
+    dtype : numpy.dtype, optional
+        Type of the values sent, to which each chunk is cast. The default is
+        ``None``, in which case the values are sent with the array's type.
+    """
+    chunk_policy = None
     if not chunk_size:
-        chunk_size = misc.DEFAULT_FILE_CHUNK_SIZE
+        chunk_policy = chunking.policy(server, "arrays")
+        chunk_size = chunk_policy.chunk_size()
+    dtype = data.dtype if dtype is None else np.dtype(dtype)
+    if dtype == data.dtype:
+        dtype = None
 
     length = data.size
     need_progress_bar = length > 1e6
@@ -565,11 +769,15 @@ def _data_chunk_yielder(request, data, chunk_size=None):
     if length == 0:
         yield request
         return
-    unitary_size = int(chunk_size // sys.getsizeof(data[0]))
+    start = time.perf_counter()
+    itemsize = data.itemsize if dtype is None else dtype.itemsize
+    unitary_size = max(int(chunk_size // itemsize), 1)
     if length - sent_length < unitary_size:
         unitary_size = length - sent_length
     while sent_length < length:
         currentcopy = data[sent_length: sent_length + unitary_size]
+        if dtype is not None:
+            currentcopy = currentcopy.astype(dtype)
         request.array = currentcopy.tobytes()
         sent_length = sent_length + unitary_size
         if length - sent_length < unitary_size:
@@ -580,6 +788,9 @@ def _data_chunk_yielder(request, data, chunk_size=None):
                 bar.update(sent_length)
         except:
             pass
+    # the chunks are consumed as gRPC sends them
+    if chunk_policy is not None:
+        chunk_policy.record(length * itemsize, time.perf_counter() - start)
     try:
         if need_progress_bar:
             bar.finish()
@@ -587,7 +798,38 @@ def _data_chunk_yielder(request, data, chunk_size=None):
         pass
 
 
-def _data_get_chunk_(dtype, service, np_array=True):
+def _stream_size(service):
+    """Size in bytes of a streamed array announced by the server, or ``None``."""
+    for metadata in service.initial_metadata():
+        if metadata.key == "size_tot":
+            return int(metadata.value)
+    return None
+
+
+@instrumentation.traced
+def _data_get_chunk_(dtype, service, np_array=True, out=None):
+    """Receive a streamed array from the server.
+
+    Parameters
+    ----------
+    dtype : numpy.dtype
+        Type of the values sent by the server.
+    service : grpc stream
+        Stream of chunks whose ``array`` attribute holds raw bytes.
+    np_array : bool, optional
+        Whether to return a ``numpy.ndarray`` or a Python list.
+        The default is ``True``.
+    out : numpy.ndarray, optional
+        Preallocated C-contiguous array with the same ``dtype`` in which the
+        chunks are written directly. It must hold at least the number of values
+        sent by the server. The default is ``None``, in which case a new array
+        is allocated.
+
+    Returns
+    -------
+    arr : numpy.ndarray or list
+        Flat array (a view of ``out`` when it is given) or list of the values.
+    """
     tupleMetaData = service.initial_metadata()
 
     need_progress_bar = False
@@ -596,34 +838,38 @@ def _data_get_chunk_(dtype, service, np_array=True):
             size = int(tupleMetaData[iMeta].value)
 
     itemsize = np.dtype(dtype).itemsize
-    need_progress_bar = size // itemsize > 1e6
+    n_values = size // itemsize
+    need_progress_bar = n_values > 1e6
     if need_progress_bar:
         bar = _common_progress_bar(
-            "Receiving data...", unit=dtype.__name__ + "s", tot_size=size // itemsize
+            "Receiving data...", unit=np.dtype(dtype).name + "s", tot_size=n_values
         )
         bar.start()
 
     if np_array:
-        arr = np.empty(size // itemsize, dtype)
+        if out is None:
+            arr = np.empty(n_values, dtype)
+        else:
+            arr = _check_out_buffer(out, dtype, n_values)
+        # write the raw bytes of each chunk straight into the array's memory
+        buffer = memoryview(arr).cast("B")
         i = 0
         for chunk in service:
-            curr_size = len(chunk.array) // itemsize
-            arr[i : i + curr_size] = np.frombuffer(chunk.array, dtype)
+            curr_size = len(chunk.array)
+            buffer[i : i + curr_size] = chunk.array
             i += curr_size
             try:
                 if need_progress_bar:
-                    bar.update(i)
+                    bar.update(i // itemsize)
             except:
                 pass
 
     else:
         arr = []
-        if dtype == np.float:
-            dtype = "d"
-        else:
-            dtype = "i"
+        # "d", "f" and "i" are also the type codes of the array module
+        typecode = np.dtype(dtype).char
         for chunk in service:
-            arr.extend(array.array(dtype, chunk.array))
+            arr.extend(array.array(typecode, chunk.array))
             try:
                 if need_progress_bar:
                     bar.update(len(arr))
@@ -635,3 +881,193 @@ def _data_get_chunk_(dtype, service, np_array=True):
     except:
         pass
     return arr
+
+
+@instrumentation.traced
+def _data_get_chunk_to_file_(dtype, service, file, write_header=None, file_dtype=None):
+    """Write a streamed array in a file, one chunk at a time.
+
+    Parameters
+    ----------
+    dtype : numpy.dtype
+        Type of the values sent by the server.
+    service : grpc stream
+        Stream of chunks whose ``array`` attribute holds raw bytes.
+    file : file object
+        Binary file in which the values are written.
+    write_header : callable, optional
+        Called with the number of values sent by the server before the
+        first value is written. The default is ``None``.
+    file_dtype : numpy.dtype, optional
+        Type of the values written, to which each chunk is cast. The default
+        is ``None``, in which case the values are written with ``dtype``.
+
+    Returns
+    -------
+    int
+        Number of values written.
+    """
+    tupleMetaData = service.initial_metadata()
+    for iMeta in range(len(tupleMetaData)):
+        if tupleMetaData[iMeta].key == "size_tot":
+            size = int(tupleMetaData[iMeta].value)
+
+    dtype = np.dtype(dtype)
+    if file_dtype is not None and np.dtype(file_dtype) == dtype:
+        file_dtype = None
+    itemsize = dtype.itemsize
+    n_values = size // itemsize
+    if write_header is not None:
+        write_header(n_values)
+    need_progress_bar = n_values > 1e6
+    if need_progress_bar:
+        bar = _common_progress_bar(
+            "Receiving data...", unit=dtype.name + "s", tot_size=n_values
+        )
+        bar.start()
+
+    i = 0
+    # bytes of a value split between two chunks
+    remainder = b""
+    for chunk in service:
+        data = chunk.array
+        i += len(data)
+        if file_dtype is None:
+            file.write(data)
+        else:
+            if remainder:
+                data = remainder + data
+            n_bytes = len(data) - len(data) % itemsize
+            remainder = data[n_bytes:]
+            values = np.frombuffer(data, dtype, n_bytes // itemsize)
+            file.write(values.astype(file_dtype).tobytes())
+        try:
+            if need_progress_bar:
+                bar.update(i // itemsize)
+        except:
+            pass
+    try:
+        if need_progress_bar:
+            bar.finish()
+    except:
+        pass
+    return i // itemsize
+
+
+def _check_out_buffer(out, dtype, n_values):
+    """Return a flat view on the ``n_values`` first values of ``out``."""
+    if not isinstance(out, np.ndarray):
+        raise TypeError(f"out must be a numpy.ndarray, not {type(out).__name__}")
+    if out.dtype != np.dtype(dtype):
+        raise ValueError(
+            f"out has dtype {out.dtype} while {np.dtype(dtype)} is expected"
+        )
+    if not out.flags.c_contiguous or not out.flags.writeable:
+        raise ValueError("out must be a writeable C-contiguous array")
+    if out.size < n_values:
+        raise ValueError(
+            f"out can hold {out.size} values while {n_values} are received"
+        )
+    return out.reshape(-1)[:n_values]
+
+
+class _IdToIndexMap(Mapping):
+    """Read-only mapping from scoping IDs to their indices backed by numpy.
+
+    A dense lookup table is used when the IDs span a compact range,
+    otherwise the IDs are sorted once and searched with
+    ``numpy.searchsorted``. When an ID is duplicated, its last index wins.
+
+    Parameters
+    ----------
+    ids : numpy.ndarray
+        IDs of the scoping, in scoping order.
+    """
+
+    # ratio between the id range and the number of ids up to which a
+    # dense lookup table is preferred over a sorted search
+    _DENSE_RATIO = 4
+
+    def __init__(self, ids):
+        self._ids = np.asarray(ids, dtype=np.int32).reshape(-1)
+        self._table = None
+        self._sorted_ids = None
+        self._order = None
+        if self._ids.size == 0:
+            self._min = 0
+            self._table = np.empty(0, dtype=np.int32)
+            return
+        self._min = int(self._ids.min())
+        span = int(self._ids.max()) - self._min + 1
+        if span <= max(self._DENSE_RATIO * self._ids.size, 1024):
+            self._table = np.full(span, -1, dtype=np.int32)
+            self._table[self._ids - self._min] = np.arange(
+                self._ids.size, dtype=np.int32
+            )
+        else:
+            self._order = np.argsort(self._ids, kind="stable").astype(np.int32)
+            self._sorted_ids = self._ids[self._order]
+
+    def indices(self, ids):
+        """Vectorized lookup of the indices of ``ids``.
+
+        Parameters
+        ----------
+        ids : numpy.ndarray, list of int
+            IDs to look for.
+
+        Returns
+        -------
+        indices : numpy.ndarray
+            ``int32`` indices, ``-1`` where the ID is not in the scoping.
+        """
+        ids = np.asarray(ids, dtype=np.int64).reshape(-1)
+        out = np.full(ids.size, -1, dtype=np.int32)
+        if self._table is not None:
+            shifted = ids - self._min
+            found = (shifted >= 0) & (shifted < self._table.size)
+            out[found] = self._table[shifted[found]]
+        else:
+            pos = np.searchsorted(self._sorted_ids, ids, side="right") - 1
+            found = pos >= 0
+            found[found] = self._sorted_ids[pos[found]] == ids[found]
+            out[found] = self._order[pos[found]]
+        return out
+
+    def map(self, ids):
+        """Return the indices of the IDs found and the mask of found IDs.
+
+        Parameters
+        ----------
+        ids : numpy.ndarray, list of int
+            IDs to look for.
+
+        Returns
+        -------
+        indices : numpy.ndarray
+            ``int32`` indices of the IDs found.
+        mask : numpy.ndarray
+            Boolean mask, ``True`` where the ID was found.
+        """
+        ind = self.indices(ids)
+        mask = ind >= 0
+        return ind[mask], mask
+
+    def __getitem__(self, id):
+        index = int(self.indices([id])[0])
+        if index < 0:
+            raise KeyError(id)
+        return index
+
+    def __contains__(self, id):
+        return self.indices([id])[0] >= 0
+
+    def get(self, id, default=None):
+        index = int(self.indices([id])[0])
+        return default if index < 0 else index
+
+    def __iter__(self):
+        return iter(self._ids.tolist())
+
+    def __len__(self):
+        return self._ids.size
@@ -20,6 +20,7 @@ import copy
 from ansys import dpf
 from ansys.dpf.core.misc import find_ansys, is_ubuntu
 from ansys.dpf.core import errors
+from ansys.dpf.core import instrumentation
 
 from ansys.dpf.core._version import __ansys_version__
 
@@ -306,15 +307,16 @@ class DpfServer:
         if not isinstance(port, int):
             raise ValueError("Port must be an integer")
 
-        if os.name == "posix" and "ubuntu" in platform.platform().lower():
-            raise OSError("DPF does not support Ubuntu")
-        elif launch_server:
+        if launch_server:
+            # only launching a server is unsupported, remote servers can be reached
+            if os.name == "posix" and "ubuntu" in platform.platform().lower():
+                raise OSError("DPF does not support Ubuntu")
             launch_dpf(ansys_path, ip, port)
 
-        self.channel = grpc.insecure_channel("%s:%d" % (ip, port))
+        channel = grpc.insecure_channel("%s:%d" % (ip, port))
 
         if launch_server is False:
-            state = grpc.channel_ready_future(self.channel)
+            state = grpc.channel_ready_future(channel)
             # verify connection has matured
             tstart = time.time()
             while ((time.time() - tstart) < timeout) and not state._matured:
@@ -327,6 +329,9 @@ class DpfServer:
 
             LOG.debug("Established connection to DPF gRPC")
 
+        # the calls are recorded when profiling hooks are registered
+        self.channel = instrumentation.instrumented_channel(channel)
+
         # assign to global channel when requested
         if as_global:
             dpf.core.SERVER = self
@@ -342,16 +347,21 @@ class DpfServer:
 
     @property
     def _base_service(self):
-        if not hasattr(self, "__base_service"):
+        # the service is created once: its creation waits for the channel to be ready
+        base_service = getattr(self, "_base_service_instance", None)
+        if base_service is None:
             from ansys.dpf.core.core import BaseService
 
-            self.__base_service = BaseService(self, timeout=1)
-        return self.__base_service
+            base_service = BaseService(self, timeout=1)
+            self._base_service_instance = base_service
+        return base_service
 
     @property
     def info(self):
         """Server information.
 
+        The information is requested once per server and then cached.
+
         Returns
         -------
         info : dictionary
@@ -359,7 +369,32 @@ class DpfServer:
             ``"server_port"``, ``"server_process_id"``, and
             ``"server_version"`` keys.
         """
-        return self._base_service.server_info
+        return self.capabilities.info
+
+    @property
+    def capabilities(self):
+        """Capabilities of the server negotiated once per connection.
+
+        Version-gated code paths read this record instead of requesting the
+        server information on each call.
+
+        Returns
+        -------
+        capabilities : ServerCapabilities
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> server = dpf.start_local_server(as_global=False)
+        >>> server.capabilities.streaming
+        True
+
+        """
+        capabilities = getattr(self, "_capabilities", None)
+        if capabilities is None:
+            capabilities = ServerCapabilities(self._base_service.server_info)
+            self._capabilities = capabilities
+        return capabilities
 
     @property
     def ip(self):
@@ -370,7 +405,7 @@ class DpfServer:
         ip : str
         """
         try:
-            return self._base_service.server_info["server_ip"]
+            return self.info["server_ip"]
         except:
             return ""
 
@@ -383,7 +418,7 @@ class DpfServer:
         port : int
         """
         try:
-            return self._base_service.server_info["server_port"]
+            return self.info["server_port"]
         except:
             return 0
 
@@ -395,7 +430,7 @@ class DpfServer:
         -------
         version : str
         """
-        return self._base_service.server_info["server_version"]
+        return self.capabilities.version
 
     def __str__(self):
         return f"DPF Server: {self.info}"
@@ -403,7 +438,7 @@ class DpfServer:
     def shutdown(self):
         if self._own_process and self.live and self._base_service:
             self._base_service._prepare_shutdown()
-            p = psutil.Process(self._base_service.server_info["server_process_id"])
+            p = psutil.Process(self.info["server_process_id"])
             p.kill()
             time.sleep(0.1)
             self.live = False
@@ -461,6 +496,87 @@ class DpfServer:
         return server_meet_version_and_raise(required_version, self, msg)
 
 
+class ServerCapabilities:
+    """Capabilities of a DPF server, derived from its information.
+
+    Parameters
+    ----------
+    info : dict
+        Server information with at least a ``"server_version"`` key, as
+        returned by :func:`ansys.dpf.core.core.BaseService.server_info`.
+
+    Attributes
+    ----------
+    info : dict
+        Server information.
+    version : str
+        Server version, for example ``"2.1"``.
+    version_tuple : tuple
+        Major, minor, and patch versions of the server.
+    streaming : bool
+        Whether the server streams arrays (scoping IDs, field data, ...) in
+        chunks. Otherwise, arrays are sent in a single message.
+    float32 : bool
+        Whether the server can send and receive field data in single
+        precision.
+    max_message_size : int
+        Maximum size in bytes of an array sent in a single message.
+
+    Examples
+    --------
+    >>> from ansys.dpf.core.server import ServerCapabilities
+    >>> capabilities = ServerCapabilities({"server_version": "2.0"})
+    >>> capabilities.streaming
+    False
+    >>> capabilities.meets_version("1.3")
+    True
+
+    """
+
+    # size limit of the arrays sent in one message by servers not streaming them
+    MAX_MESSAGE_SIZE = int(8.0e6)
+
+    def __init__(self, info):
+        from ansys.dpf.core.check_version import version_tuple
+
+        self.info = info
+        self.version = info["server_version"]
+        self.version_tuple = version_tuple(self.version)
+        self._meets = {}
+        self.streaming = self.meets_version("2.1")
+        # the data type of the streamed field data is set by the
+        # "float_or_double" metadata
+        self.float32 = self.streaming
+        self.max_message_size = self.MAX_MESSAGE_SIZE
+
+    def meets_version(self, required_version):
+        """Check if the server version meets a required version.
+
+        Parameters
+        ----------
+        required_version : str
+            Required version to compare with the server version.
+
+        Returns
+        -------
+        bool
+            ``True`` if the server version meets the requirement.
+        """
+        meets = self._meets.get(required_version)
+        if meets is None:
+            from ansys.dpf.core.check_version import meets_version, version_tuple
+
+            meets = meets_version(self.version_tuple, version_tuple(required_version))
+            self._meets[required_version] = meets
+        return meets
+
+    def __repr__(self):
+        return (
+            f"ServerCapabilities(version={self.version!r}, streaming={self.streaming}, "
+            f"float32={self.float32}, max_message_size={self.max_message_size})"
+        )
+
+
 def launch_dpf(ansys_path, ip=LOCALHOST, port=DPF_DEFAULT_PORT, timeout=10):
     """Launch Ansys DPF.
 
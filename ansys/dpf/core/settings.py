@@ -5,6 +5,8 @@ settings
 Customize the behavior of the module.
 """
 
+import os
+
 from ansys.dpf.core.misc import module_exists
 from ansys.dpf.core import misc
 
@@ -31,6 +33,16 @@ def set_default_pyvista_config():
         pv.rcParams["cmap"] = "jet"
         pv.rcParams["font"]["family"] = "courier"
         pv.rcParams["title"] = "DPF"
+    misc.PYVISTA_CONFIGURED = True
+
+def _set_default_pyvista_config_once():
+    """Configure PyVista for dpf before the first plot.
+
+    Importing PyVista is slow, so it is not configured when ``ansys.dpf.core``
+    is imported.
+    """
+    if not misc.PYVISTA_CONFIGURED:
+        set_default_pyvista_config()
 
 def disable_interpreter_properties_evaluation() -> bool:
     """If ``jedi`` module is installed (autocompletion module for most of IDEs), disables the
@@ -50,7 +62,213 @@ def disable_interpreter_properties_evaluation() -> bool:
     return False
 
 def set_upload_chunk_size(num_bytes = misc.DEFAULT_FILE_CHUNK_SIZE) -> None:
-    misc.DEFAULT_FILE_CHUNK_SIZE = num_bytes
+    """Sets the initial size of the chunks of the arrays and files sent to the server.
+
+    Parameters
+    ----------
+    num_bytes : int
+        Size of the chunks in bytes.
+    """
+    set_chunk_sizes(arrays=num_bytes, files=num_bytes)
+
+def set_chunk_sizes(
+    arrays=None, files=None, min_size=None, max_size=None, adaptive=None
+) -> None:
+    """Sets the tunables of the chunks of the arrays and files sent to the server.
+
+    When the adaptive chunking is enabled, the chunk size starts from the
+    initial size and is doubled or halved after each large upload according
+    to its throughput, between ``min_size`` and ``max_size``. It never
+    exceeds the maximum message size of the server. Otherwise, the initial
+    size is used for all the uploads. The arguments left to ``None`` are not
+    modified.
+
+    Parameters
+    ----------
+    arrays : int, optional
+        Initial size in bytes of the chunks of the arrays (field data,
+        scoping IDs).
+    files : int, optional
+        Initial size in bytes of the chunks of the files.
+    min_size : int, optional
+        Minimum size in bytes of the adapted chunks.
+    max_size : int, optional
+        Maximum size in bytes of the adapted chunks.
+    adaptive :  bool, optional
+        With ''True'', the chunk size is adapted to the measured throughput.
+
+    Examples
+    --------
+
+    >>> from ansys.dpf import core as dpf
+    >>> dpf.settings.set_chunk_sizes(arrays=2**20, adaptive=False)
+    >>> dpf.settings.set_chunk_sizes(arrays=2**19, adaptive=True)
+
+    """
+    if arrays is not None:
+        misc.DEFAULT_ARRAY_CHUNK_SIZE = int(arrays)
+    if files is not None:
+        misc.DEFAULT_FILE_CHUNK_SIZE = int(files)
+    if min_size is not None:
+        misc.MIN_CHUNK_SIZE = int(min_size)
+    if max_size is not None:
+        misc.MAX_CHUNK_SIZE = int(max_size)
+    if adaptive is not None:
+        misc.ADAPTIVE_CHUNK_SIZE = bool(adaptive)
+
+def get_chunk_size_stats(server=None) -> dict:
+    """Returns the chunk sizes and the statistics of the uploads to a server.
+
+    Parameters
+    ----------
+    server : ansys.dpf.core.server, optional
+        Server with the channel connected to the remote or local instance.
+        The default is ``None``, in which case an attempt is made to use the
+        global server.
+
+    Returns
+    -------
+    dict
+        For ``"arrays"`` and ``"files"``, the current chunk size and its
+        bounds, the number of uploads, the bytes sent, their duration in
+        seconds, the throughput in bytes per second and the number of
+        adaptations of the chunk size.
+
+    Examples
+    --------
+
+    >>> from ansys.dpf import core as dpf
+    >>> stats = dpf.settings.get_chunk_size_stats()
+    >>> stats["arrays"]["chunk_size"]  # doctest: +SKIP
+    524288
+
+    """
+    from ansys.dpf.core import chunking
+    from ansys.dpf.core import server as serverlib
+
+    if server is None:
+        server = serverlib._global_server()
+    return {kind: chunking.policy(server, kind).stats() for kind in chunking.KINDS}
+
+def set_file_transfers(max_workers=None, read_ahead=None) -> None:
+    """Sets the concurrency of the files transfers with the server.
+
+    The files of a folder are uploaded concurrently, and the chunks of a file
+    are read from the disk, or written to it, while the previous or next ones
+    are exchanged with the server. The arguments left to ``None`` are not
+    modified.
+
+    Parameters
+    ----------
+    max_workers : int, optional
+        Maximum number of files of a folder uploaded at the same time.
+    read_ahead : int, optional
+        Number of chunks of a file read ahead of the upload, or waiting to be
+        written after a download.
+
+    Examples
+    --------
+
+    >>> from ansys.dpf import core as dpf
+    >>> dpf.settings.set_file_transfers(max_workers=8, read_ahead=2)
+    >>> dpf.settings.set_file_transfers(max_workers=4, read_ahead=4)
+
+    """
+    if max_workers is not None:
+        if int(max_workers) < 1:
+            raise ValueError("max_workers must be at least 1.")
+        misc.FILE_TRANSFER_WORKERS = int(max_workers)
+    if read_ahead is not None:
+        if int(read_ahead) < 1:
+            raise ValueError("read_ahead must be at least 1.")
+        misc.FILE_TRANSFER_READ_AHEAD = int(read_ahead)
+
+def set_upload_cache(value, sampling=None) -> None:
+    """Enables or disables the reuse of the files uploaded in the server's temporary folder.
+
+    When enabled, the content of the files uploaded with
+    :func:`ansys.dpf.core.core.upload_file_in_tmp_folder` is hashed, and a
+    file with the same content and name as a file already uploaded to the
+    running server is not uploaded again. Only the beginning of the server
+    file is downloaded to check that it is still there. The uploaded files
+    are forgotten when the server restarts, or when another file is uploaded
+    to the same server path. The cache is disabled by default.
+
+    Parameters
+    ----------
+    value :  bool
+        With ''True'', the unchanged files are not uploaded again.
+    sampling : int, optional
+        Size in bytes from which only evenly spaced blocks of the files are
+        hashed, along with their size. Sampling is faster, but it does not
+        detect every change of a file. The default is ``None``, in which case
+        the files are always hashed entirely.
+
+    Examples
+    --------
+
+    >>> from ansys.dpf import core as dpf
+    >>> dpf.settings.set_upload_cache(True, sampling=2**30)
+    >>> dpf.settings.set_upload_cache(False)
+
+    """
+    misc.UPLOAD_CACHE = bool(value)
+    misc.UPLOAD_CACHE_SAMPLING = None if sampling is None else int(sampling)
+
+def set_transfer_precision(precision="double") -> None:
+    """Sets the precision of the data of the fields exchanged with the server.
+
+    In single precision, the data of the fields of doubles is sent by the
+    server and to the server in half the bytes, and returned as
+    ``numpy.float32`` arrays. Most results are stored in single precision in
+    the result files. The precision of one call is set with the ``dtype``
+    argument of :func:`ansys.dpf.core.field.Field.get_data`, and
+    ``numpy.float32`` arrays are always sent in single precision.
+    Servers not supporting single precision exchange doubles.
+
+    Parameters
+    ----------
+    precision : numpy.dtype, str, optional
+        ``numpy.float64`` (``"double"``), which is the default, or
+        ``numpy.float32`` (``"float"``).
+
+    Examples
+    --------
+
+    >>> import numpy as np
+    >>> from ansys.dpf import core as dpf
+    >>> dpf.settings.set_transfer_precision(np.float32)
+    >>> dpf.settings.set_transfer_precision("double")
+
+    """
+    from ansys.dpf.core.field_base import _transfer_precision
+
+    misc.TRANSFER_PRECISION = _transfer_precision(precision)
+
+def set_deferred_connections(value) -> None:
+    """Enables or disables the deferred connection of the operators' inputs.
+
+    When enabled, connecting an input to an operator only records the
+    connection on the client. The connections of an operator and of all the
+    operators upstream of it are sent together, as concurrent requests,
+    before the operator or a workflow containing it is evaluated. Building a
+    chain of operators then costs about one round trip to the server instead
+    of one per connection.
+
+    Parameters
+    ----------
+    value :  bool
+        With ''True'', the connections are deferred until the evaluation.
+
+    Examples
+    --------
+
+    >>> from ansys.dpf import core as dpf
+    >>> dpf.settings.set_deferred_connections(True)
+    >>> dpf.settings.set_deferred_connections(False)
+
+    """
+    misc.DEFERRED_CONNECTIONS = value
 
 def set_dynamic_available_results_capability(value) -> None:
     """Disables the evaluation of the available results and
@@ -69,4 +287,41 @@ def set_dynamic_available_results_capability(value) -> None:
     >>> dpf.settings.set_dynamic_available_results_capability(True)
 
     """
-    misc.DYNAMIC_RESULTS = value
\ No newline at end of file
+    misc.DYNAMIC_RESULTS = value
+
+def set_mesh_topology_cache(value, path=None) -> None:
+    """Enables or disables the on-disk cache of the meshes' topology.
+
+    When enabled, the node and element IDs, the coordinates, the element
+    types and the connectivity of the meshes read by a ``Model`` are saved
+    in memory-mappable files on the first access, and read back from disk
+    when the same result files are opened again with the same server version.
+    The cache is only used for result files accessible from the client.
+
+    Parameters
+    ----------
+    value :  bool
+        With ''True'', the meshes' topology is cached on disk.
+    path : str, optional
+        Directory of the cache. The default is ``None``, in which case the
+        ``mesh_cache`` folder of ``USER_DATA_PATH`` is used.
+
+    Examples
+    --------
+
+    >>> from ansys.dpf import core as dpf
+    >>> dpf.settings.set_mesh_topology_cache(True)
+    >>> dpf.settings.set_mesh_topology_cache(False)
+
+    """
+    if not value:
+        misc.MESH_TOPOLOGY_CACHE_PATH = None
+        return
+    if path is None:
+        from ansys.dpf.core import USER_DATA_PATH
+
+        if USER_DATA_PATH is None:
+            raise ValueError("No user data path is available, a path is required.")
+        path = os.path.join(USER_DATA_PATH, "mesh_cache")
+    os.makedirs(path, exist_ok=True)
+    misc.MESH_TOPOLOGY_CACHE_PATH = path
\ No newline at end of file
@@ -0,0 +1,1626 @@
+"""
+.. _ref_stand_in_server:
+
+Stand-in Server
+===============
+Stand-in of a DPF server written in Python and backed by NumPy.
+
+It implements the subset of the gRPC services used by the fields, scopings,
+collections, meshed regions, field definitions, operator configurations, a
+few simple operators (``forward``, ``norm``, ``add``, ``scale`` and their
+fields container variants) and the file transfers of the base service. The
+other methods answer with the ``UNIMPLEMENTED`` status.
+
+An artificial latency and bandwidth can be applied to the calls, so that the
+performance of the client can be measured and regression-tested on any
+machine without a DPF installation.
+
+Examples
+--------
+>>> from ansys.dpf import core as dpf
+>>> from ansys.dpf.core.stand_in_server import StandInServer
+>>> with StandInServer(latency=0.001) as stand_in:
+...     server = stand_in.connect()
+...     field = dpf.fields_factory.create_scalar_field(2, server=server)
+...     field.data = [1.0, 2.0]
+...     print(field.data)
+[1. 2.]
+
+"""
+import atexit
+import functools
+import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+import time
+from concurrent import futures
+from typing import NamedTuple
+
+import grpc
+import numpy as np
+from google.protobuf.message import Message
+
+from ansys.dpf.core import misc
+from ansys.dpf.core import server as serverlib
+from ansys.grpc.dpf import (
+    base_pb2,
+    base_pb2_grpc,
+    collection_pb2,
+    collection_pb2_grpc,
+    field_definition_pb2,
+    field_definition_pb2_grpc,
+    field_pb2,
+    field_pb2_grpc,
+    meshed_region_pb2,
+    meshed_region_pb2_grpc,
+    operator_config_pb2,
+    operator_config_pb2_grpc,
+    operator_pb2,
+    operator_pb2_grpc,
+    scoping_pb2,
+    scoping_pb2_grpc,
+    support_pb2,
+)
+
+# number of components of the elementary data by nature
+_NATURE_SIZES = {"SCALAR": 1, "VECTOR": 3, "MATRIX": 9, "SYMMATRIX": 6}
+
+# Ansys element types by shape and number of nodes
+_ELEMENT_TYPES = {
+    ("SOLID", 4): 10,  # Tet4
+    ("SOLID", 10): 0,  # Tet10
+    ("SOLID", 8): 11,  # Hex8
+    ("SOLID", 20): 1,  # Hex20
+    ("SOLID", 6): 12,  # Wedge6
+    ("SOLID", 15): 2,  # Wedge15
+    ("SOLID", 5): 13,  # Pyramid5
+    ("SOLID", 13): 3,  # Pyramid13
+    ("SHELL", 3): 15,  # TriShell3
+    ("SHELL", 6): 5,  # TriShell6
+    ("SHELL", 4): 17,  # QuadShell4
+    ("SHELL", 8): 7,  # QuadShell8
+    ("BEAM", 2): 18,  # Line2
+    ("BEAM", 3): 8,  # Line3
+    ("UNKNOWN_SHAPE", 1): 9,  # Point1
+}
+_POINT1 = 9
+_UNKNOWN_ELEMENT_TYPE = 20
+
+
+def _get_id(message):
+    """Entity ID of a message, whether it is an integer or an ``EntityIdentifier``."""
+    if message.DESCRIPTOR.fields_by_name["id"].message_type is not None:
+        return message.id.id
+    return message.id
+
+
+def _set_id(message, entity_id):
+    if message.DESCRIPTOR.fields_by_name["id"].message_type is not None:
+        message.id.id = entity_id
+    else:
+        message.id = entity_id
+
+
+def _has_field(message, name):
+    return name in message.DESCRIPTOR.fields_by_name
+
+
+def _protos_version():
+    """Latest DPF version whose features the installed ``ansys-grpc-dpf`` messages support.
+
+    The arrays are streamed with their size from version 2.1, which older
+    messages, returning the scoping IDs in one ``Ids`` message, cannot do.
+    """
+    response_class = getattr(scoping_pb2, "ListResponse", None)
+    if response_class is not None and _has_field(response_class, "array"):
+        return "2.1"
+    return "2.0"
+
+
+def _client_metadata(context):
+    return {item.key: item.value for item in context.invocation_metadata()}
+
+
+def _received_dtype(metadata, default):
+    """Type of the values streamed by the client."""
+    if "size_int" in metadata:
+        return np.int32
+    if metadata.get("float_or_double") == "float":
+        return np.float32
+    return default
+
+
+class _Store:
+    """Entities of the stand-in server by ID.
+
+    An ID is never reused, and an entity still referenced by another one
+    (the scoping of a field, the entries of a collection) is registered again
+    with its ID when it is sent back to a client after its deletion.
+    """
+
+    def __init__(self):
+        self._entities = {}
+        self._next_id = 1
+        self._lock = threading.Lock()
+
+    def register(self, entity):
+        with self._lock:
+            if entity.id is None:
+                entity.id = self._next_id
+                self._next_id += 1
+            self._entities[entity.id] = entity
+        return entity.id
+
+    def get(self, entity_id, context, kind=None):
+        entity = self._entities.get(entity_id)
+        if entity is None or (kind is not None and not isinstance(entity, kind)):
+            context.abort(grpc.StatusCode.NOT_FOUND, f"No entity with id {entity_id}.")
+        return entity
+
+    def remove(self, entity_id):
+        with self._lock:
+            self._entities.pop(entity_id, None)
+
+    def __len__(self):
+        return len(self._entities)
+
+
+class _Entity:
+    id = None
+
+    def describe(self):
+        return f"DPF {type(self).__name__.strip('_')}"
+
+
+class _Scoping(_Entity):
+    def __init__(self, ids=(), location=""):
+        self.ids = np.array(ids, dtype=np.int32).reshape(-1)
+        self.location = location
+
+    def copy(self):
+        return _Scoping(self.ids, self.location)
+
+    def describe(self):
+        return f"DPF Scoping:\n  with {self.location} location and {self.ids.size} entities\n"
+
+
+class _FieldDefinition(_Entity):
+    def __init__(self, location="", nature="SCALAR", size=(), unit="", shell_layers=0):
+        self.location = location
+        self.nature = nature
+        self.size = list(size)
+        self.unit = unit
+        self.shell_layers = shell_layers
+
+    def copy(self):
+        return _FieldDefinition(
+            self.location, self.nature, self.size, self.unit, self.shell_layers
+        )
+
+    @property
+    def component_count(self):
+        if self.size:
+            return int(np.prod(self.size))
+        return _NATURE_SIZES[self.nature]
+
+
+class _Field(_Entity):
+    def __init__(self, definition, scoping, datatype="double", data=None, data_pointer=None):
+        self.definition = definition
+        self.scoping = scoping
+        self.datatype = datatype
+        self.dtype = np.int32 if datatype == "int" else np.float64
+        if data is None:
+            data = ()
+        self.data = np.array(data, dtype=self.dtype).reshape(-1)
+        self.data_pointer = data_pointer
+        self.supports = {}
+        self.name = ""
+
+    @property
+    def component_count(self):
+        return self.definition.component_count
+
+    @property
+    def elementary_data_count(self):
+        if self.data_pointer is not None:
+            return self.data_pointer.size
+        return self.data.size // max(self.component_count, 1)
+
+    def entity_data(self, index):
+        if self.data_pointer is not None:
+            start = self.data_pointer[index]
+            if index + 1 < self.data_pointer.size:
+                return self.data[start: self.data_pointer[index + 1]]
+            return self.data[start:]
+        ncomp = self.component_count
+        return self.data[index * ncomp: (index + 1) * ncomp]
+
+    def with_data(self, data, nature=None, size=None):
+        """New field with the same scoping and location holding other data."""
+        definition = self.definition.copy()
+        if nature is not None:
+            definition.nature = nature
+            definition.size = list(size or ())
+        return _Field(definition, self.scoping.copy(), self.datatype, data)
+
+    def describe(self):
+        return (
+            f"DPF {self.name} Field\n  Location: {self.definition.location}\n"
+            f"  Unit: {self.definition.unit}\n"
+            f"  {self.elementary_data_count} entities\n"
+            f"  Data:{self.component_count} components and {self.data.size} elementary data\n"
+        )
+
+
+class _Collection(_Entity):
+    def __init__(self, dpf_type, labels=()):
+        self.type = dpf_type
+        self.labels = list(labels)
+        # pairs of label space and entity
+        self.entries = []
+        self.supports = {}
+
+    def find(self, label_space):
+        for i, (entry_space, _) in enumerate(self.entries):
+            if entry_space == label_space:
+                return i
+        return None
+
+    def describe(self):
+        type_name = base_pb2.Type.Name(self.type).lower()
+        return (
+            f"DPF {type_name} collection with {len(self.entries)} entries on labels "
+            f"{self.labels}\n"
+        )
+
+
+class _MeshedRegion(_Entity):
+    def __init__(self):
+        self.node_ids = []
+        self.coordinates = []
+        self.element_ids = []
+        self.shapes = []
+        self.types = []
+        self.connectivity = []
+        self.unit = ""
+        self._node_index = None
+        self._element_index = None
+
+    def node_index(self, node_id):
+        if self._node_index is None:
+            self._node_index = {nid: i for i, nid in enumerate(self.node_ids)}
+        return self._node_index.get(node_id)
+
+    def element_index(self, element_id):
+        if self._element_index is None:
+            self._element_index = {eid: i for i, eid in enumerate(self.element_ids)}
+        return self._element_index.get(element_id)
+
+    def add(self, request):
+        for node in request.nodes:
+            self.node_ids.append(node.id)
+            self.coordinates.append(list(node.coordinates))
+        for element in request.elements:
+            shape = meshed_region_pb2.ElementShape.Name(element.shape)
+            connectivity = list(element.connectivity)
+            self.element_ids.append(element.id)
+            self.shapes.append(element.shape)
+            self.types.append(
+                _ELEMENT_TYPES.get((shape, len(connectivity)), _UNKNOWN_ELEMENT_TYPE)
+            )
+            self.connectivity.append(connectivity)
+        self._node_index = None
+        self._element_index = None
+
+    def describe(self):
+        return (
+            f"DPF  Meshed Region: \n  {len(self.node_ids)} nodes \n"
+            f"  {len(self.element_ids)} elements \n  Unit: {self.unit} \n"
+        )
+
+
+class _Config(_Entity):
+    def __init__(self, options=None):
+        self.options = dict(options or {})
+
+    def describe(self):
+        return f"DPF Operator Config with options {self.options}"
+
+
+class _Operator(_Entity):
+    def __init__(self, name, definition, config):
+        self.name = name
+        self.definition = definition
+        self.config = config
+        self.inputs = {}
+
+    def describe(self):
+        return f"DPF {self.name} Operator: \n  {self.definition.description} \n"
+
+
+class _OperatorInput(NamedTuple):
+    operator: _Operator
+    pin: int
+
+
+class _PinSpec(NamedTuple):
+    name: str
+    type_names: list
+    document: str
+    optional: bool = False
+
+
+class _OperatorDefinition(NamedTuple):
+    description: str
+    inputs: dict
+    outputs: dict
+    evaluate: object
+
+
+def _as_field(value, name):
+    if isinstance(value, _Collection) and len(value.entries) == 1:
+        value = value.entries[0][1]
+    if not isinstance(value, _Field):
+        raise TypeError(f"{name} must be a field.")
+    return value
+
+
+def _operand(value, name):
+    """Values of a field, or scalar, used as the operand of an operation."""
+    if isinstance(value, _Field):
+        return value.data.reshape(-1, max(value.component_count, 1))
+    if isinstance(value, (int, float, np.ndarray)):
+        return value
+    raise TypeError(f"{name} must be a field or a number.")
+
+
+def _forward(inputs):
+    return {0: inputs[0]}
+
+
+def _norm(inputs):
+    field = _as_field(inputs[0], "field")
+    data = field.data.reshape(-1, max(field.component_count, 1))
+    return {0: field.with_data(np.linalg.norm(data, axis=1), "SCALAR")}
+
+
+def _binary(operation):
+    def evaluate(inputs):
+        field = _as_field(inputs[0], "fieldA")
+        data = operation(_operand(field, "fieldA"), _operand(inputs[1], "fieldB"))
+        return {0: field.with_data(data)}
+
+    return evaluate
+
+
+def _on_fields_container(operation):
+    """Apply a field operation on each entry of a fields container.
+
+    The second operand, when it is a fields container, is matched by index.
+    """
+
+    def evaluate(inputs):
+        collection = inputs[0]
+        if not isinstance(collection, _Collection):
+            raise TypeError("fields_container must be a fields container.")
+        other = inputs.get(1)
+        out = _Collection(collection.type, collection.labels)
+        for i, (label_space, field) in enumerate(collection.entries):
+            field_inputs = {0: field}
+            if isinstance(other, _Collection):
+                field_inputs[1] = other.entries[i][1]
+            elif other is not None:
+                field_inputs[1] = other
+            out.entries.append((dict(label_space), operation(field_inputs)[0]))
+        return {0: out}
+
+    return evaluate
+
+
+def _pin(name, type_names, document, optional=False):
+    return _PinSpec(name, list(type_names), document, optional)
+
+
+_FIELD_OR_FC = ["field", "fields_container"]
+_OPERAND = ["field", "fields_container", "double", "vector<double>"]
+_FC_OPERAND = ["fields_container", "field", "double", "vector<double>"]
+
+_OPERATORS = {
+    "forward": _OperatorDefinition(
+        "Return all the inputs as outputs.",
+        {0: _pin("any", ["any"], "any type of input")},
+        {0: _pin("any", ["any"], "same as the input")},
+        _forward,
+    ),
+    "forward_fc": _OperatorDefinition(
+        "Return the input fields container.",
+        {0: _pin("fields_container", ["fields_container"], "")},
+        {0: _pin("fields_container", ["fields_container"], "")},
+        _forward,
+    ),
+    "norm": _OperatorDefinition(
+        "Compute the element-wise L2 norm of the field elementary data.",
+        {0: _pin("field", _FIELD_OR_FC, "field or fields container with only one field")},
+        {0: _pin("field", ["field"], "")},
+        _norm,
+    ),
+    "norm_fc": _OperatorDefinition(
+        "Compute the element-wise L2 norm of the fields elementary data.",
+        {0: _pin("fields_container", ["fields_container"], "")},
+        {0: _pin("fields_container", ["fields_container"], "")},
+        _on_fields_container(_norm),
+    ),
+    "add": _OperatorDefinition(
+        "Compute the sum of two fields, or of a field and a scalar.",
+        {
+            0: _pin("fieldA", _OPERAND, "field or fields container with only one field"),
+            1: _pin("fieldB", _OPERAND, "field or fields container with only one field"),
+        },
+        {0: _pin("field", ["field"], "")},
+        _binary(np.add),
+    ),
+    "add_fc": _OperatorDefinition(
+        "Select all fields having the same label space in the input fields "
+        "containers, and add those together.",
+        {
+            0: _pin("fields_container1", _FC_OPERAND, ""),
+            1: _pin("fields_container2", _FC_OPERAND, ""),
+        },
+        {0: _pin("fields_container", ["fields_container"], "")},
+        _on_fields_container(_binary(np.add)),
+    ),
+    "scale": _OperatorDefinition(
+        "Scale a field by a constant or a field.",
+        {
+            0: _pin("field", _FIELD_OR_FC, "field or fields container with only one field"),
+            1: _pin("ponderation", ["double", "field"], "double or field to multiply by"),
+        },
+        {0: _pin("field", ["field"], "")},
+        _binary(np.multiply),
+    ),
+    "scale_fc": _OperatorDefinition(
+        "Scale the fields of a fields container by a constant or a field.",
+        {
+            0: _pin("fields_container", ["fields_container"], ""),
+            1: _pin("ponderation", ["double", "field"], "double or field to multiply by"),
+        },
+        {0: _pin("fields_container", ["fields_container"], "")},
+        _on_fields_container(_binary(np.multiply)),
+    ),
+}
+
+
+def _fill_pin_specification(message, pin_spec):
+    message.name = pin_spec.name
+    message.type_names.extend(pin_spec.type_names)
+    message.document = pin_spec.document
+    message.optional = pin_spec.optional
+
+
+def _map_value(container, key):
+    """Value of a map field, also read as a list of entries by older runtimes."""
+    if hasattr(container, "add"):
+        return container.add(key=key).value
+    return container[key]
+
+
+def _fill_specification(message, definition):
+    message.description = definition.description
+    for pin, pin_spec in definition.inputs.items():
+        _fill_pin_specification(_map_value(message.map_input_pin_spec, pin), pin_spec)
+    for pin, pin_spec in definition.outputs.items():
+        _fill_pin_specification(_map_value(message.map_output_pin_spec, pin), pin_spec)
+
+
+class _Servicer:
+    """Access to the state shared by the services of a stand-in server."""
+
+    def __init__(self, stand_in):
+        self._stand_in = stand_in
+        self._store = stand_in._store
+
+    def _send_array(self, array, context, response_class):
+        """Stream the raw bytes of an array after their size in the metadata."""
+        raw = memoryview(np.ascontiguousarray(array)).cast("B")
+        context.send_initial_metadata((("size_tot", str(raw.nbytes)),))
+        chunk_size = self._stand_in.chunk_size
+        for start in range(0, raw.nbytes, chunk_size):
+            yield response_class(array=raw[start: start + chunk_size].tobytes())
+
+    def _receive_array(self, request_iterator, context, default_dtype):
+        """Gather a streamed array and the first request holding its target."""
+        first = None
+        chunks = []
+        for request in request_iterator:
+            if first is None:
+                first = request
+            chunks.append(request.array)
+        dtype = _received_dtype(_client_metadata(context), default_dtype)
+        return first, np.frombuffer(b"".join(chunks), dtype=dtype)
+
+    def _field_message(self, field):
+        message = field_pb2.Field(datatype=field.datatype)
+        _set_id(message, self._store.register(field))
+        return message
+
+    def _scoping_message(self, scoping):
+        message = scoping_pb2.Scoping()
+        _set_id(message, self._store.register(scoping))
+        return message
+
+    def _collection_message(self, collection):
+        message = collection_pb2.Collection(type=collection.type)
+        _set_id(message, self._store.register(collection))
+        return message
+
+    def _mesh_message(self, mesh):
+        message = meshed_region_pb2.MeshedRegion()
+        _set_id(message, self._store.register(mesh))
+        return message
+
+    def _entity_message(self, entity):
+        if isinstance(entity, _Field):
+            return self._field_message(entity)
+        if isinstance(entity, _Scoping):
+            return self._scoping_message(entity)
+        if isinstance(entity, _Collection):
+            return self._collection_message(entity)
+        return self._mesh_message(entity)
+
+    def _delete(self, request):
+        self._store.remove(_get_id(request))
+        return base_pb2.Empty()
+
+
+class _BaseServicer(_Servicer, base_pb2_grpc.BaseServiceServicer):
+    def GetServerInfo(self, request, context):
+        major, minor = self._stand_in.version.split(".")[:2]
+        return base_pb2.ServerInfoResponse(
+            majorVersion=int(major),
+            minorVersion=int(minor),
+            processId=os.getpid(),
+            ip=self._stand_in.ip,
+            port=self._stand_in.port,
+        )
+
+    def Load(self, request, context):
+        return base_pb2.Empty()
+
+    def Describe(self, request, context):
+        entity = self._store.get(request.dpf_type_id, context)
+        return base_pb2.DescribeResponse(description=entity.describe())
+
+    def CreateTmpDir(self, request, context):
+        return base_pb2.UploadFileResponse(server_file_path=self._stand_in.tmp_dir)
+
+    def DownloadFile(self, request, context):
+        path = request.server_file_path
+        if os.path.isdir(path):
+            paths = [
+                os.path.join(root, name)
+                for root, _, names in sorted(os.walk(path))
+                for name in sorted(names)
+            ]
+        elif os.path.isfile(path):
+            paths = [path]
+        else:
+            context.abort(grpc.StatusCode.NOT_FOUND, f"{path} does not exist.")
+        context.send_initial_metadata((("num_files", str(len(paths))),))
+        chunk_size = self._stand_in.chunk_size
+        for file_path in paths:
+            with open(file_path, "rb") as f:
+                data = f.read(chunk_size)
+                while True:
+                    response = base_pb2.DownloadFileResponse()
+                    response.data.data = data
+                    response.data.server_file_path = file_path
+                    yield response
+                    data = f.read(chunk_size)
+                    if not data:
+                        break
+
+    def UploadFile(self, request_iterator, context):
+        f = None
+        path = ""
+        try:
+            for request in request_iterator:
+                if f is None:
+                    path = request.server_file_path
+                    if request.use_temp_dir:
+                        path = os.path.join(self._stand_in.tmp_dir, path)
+                    folder = os.path.dirname(path)
+                    if folder:
+                        os.makedirs(folder, exist_ok=True)
+                    f = open(path, "wb")
+                f.write(request.data.data)
+        finally:
+            if f is not None:
+                f.close()
+        return base_pb2.UploadFileResponse(server_file_path=path)
+
+    def PrepareShutdown(self, request, context):
+        return base_pb2.Empty()
+
+
+class _FieldDefinitionServicer(
+    _Servicer, field_definition_pb2_grpc.FieldDefinitionServiceServicer
+):
+    def Create(self, request, context):
+        message = field_definition_pb2.FieldDefinition()
+        _set_id(message, self._store.register(_FieldDefinition()))
+        return message
+
+    def Update(self, request, context):
+        definition = self._store.get(
+            _get_id(request.field_definition), context, _FieldDefinition
+        )
+        unit_type = request.WhichOneof("unit_definition_type")
+        if unit_type == "unit_symbol":
+            definition.unit = request.unit_symbol.symbol
+        elif unit_type == "unit":
+            definition.unit = request.unit.symbol
+        if request.HasField("location"):
+            definition.location = request.location.location
+        if request.HasField("dimensionnality"):
+            definition.nature = base_pb2.Nature.Name(request.dimensionnality.nature)
+            definition.size = list(request.dimensionnality.size)
+        if request.shell_layers:
+            definition.shell_layers = request.shell_layers
+        return base_pb2.Empty()
+
+    def List(self, request, context):
+        definition = self._store.get(_get_id(request), context, _FieldDefinition)
+        response = field_definition_pb2.FieldDefinitionData()
+        response.unit.symbol = definition.unit
+        response.location.location = definition.location
+        response.dimensionnality.nature = base_pb2.Nature.Value(definition.nature)
+        response.dimensionnality.size.extend(
+            definition.size or [definition.component_count]
+        )
+        response.shell_layers = definition.shell_layers
+        return response
+
+    def Delete(self, request, context):
+        return self._delete(request)
+
+
+class _FieldServicer(_Servicer, field_pb2_grpc.FieldServiceServicer):
+    def _field(self, message, context):
+        return self._store.get(_get_id(message), context, _Field)
+
+    def Create(self, request, context):
+        location = request.location.location
+        size = ()
+        if request.HasField("dimensionality"):
+            size = request.dimensionality.size
+        definition = _FieldDefinition(location, base_pb2.Nature.Name(request.nature), size)
+        field = _Field(definition, _Scoping(location=location), request.datatype or "double")
+        return self._field_message(field)
+
+    def AddData(self, request, context):
+        field = self._field(request.field, context)
+        container = request.elemdata_containers
+        datatype = container.data.WhichOneof("datatypes")
+        if datatype == "dataint":
+            values = container.data.dataint.rep_int
+        elif datatype == "datafloat":
+            values = container.data.datafloat.rep_float
+        else:
+            values = container.data.datadouble.rep_double
+        values = np.array(values, dtype=field.dtype)
+        if field.data_pointer is None and values.size != field.component_count:
+            # the entities do not all have the same size anymore
+            field.data_pointer = np.arange(
+                0, field.data.size, max(field.component_count, 1), dtype=np.int32
+            )
+        if field.data_pointer is not None:
+            field.data_pointer = np.append(field.data_pointer, np.int32(field.data.size))
+        field.data = np.concatenate([field.data, values])
+        field.scoping.ids = np.append(field.scoping.ids, np.int32(container.scoping_id))
+        return base_pb2.Empty()
+
+    def UpdateData(self, request_iterator, context):
+        first, array = self._receive_array(request_iterator, context, np.float64)
+        field = self._field(first.field, context)
+        field.data = array.astype(field.dtype)
+        return base_pb2.Empty()
+
+    def UpdateDataPointer(self, request_iterator, context):
+        first, array = self._receive_array(request_iterator, context, np.int32)
+        field = self._field(first.field, context)
+        field.data_pointer = array.astype(np.int32)
+        return base_pb2.Empty()
+
+    def UpdateScoping(self, request, context):
+        field = self._field(request.field, context)
+        field.scoping = self._store.get(_get_id(request.scoping), context, _Scoping)
+        return base_pb2.Empty()
+
+    def UpdateSize(self, request, context):
+        # memory is not reserved by the stand-in
+        self._field(request.field, context)
+        return base_pb2.Empty()
+
+    def UpdateFieldDefinition(self, request, context):
+        field = self._field(request.field, context)
+        definition = self._store.get(_get_id(request.field_def), context, _FieldDefinition)
+        field.definition = definition.copy()
+        return base_pb2.Empty()
+
+    def List(self, request, context):
+        field = self._field(request.field, context)
+        data = field.data
+        if field.datatype != "int" and self._stand_in.float32:
+            data = data.astype(_received_dtype(_client_metadata(context), np.float64))
+        return self._send_array(data, context, field_pb2.ListResponse)
+
+    def ListDataPointer(self, request, context):
+        field = self._field(request.field, context)
+        data_pointer = field.data_pointer
+        if data_pointer is None:
+            data_pointer = np.arange(
+                0, field.data.size, max(field.component_count, 1), dtype=np.int32
+            )
+        return self._send_array(data_pointer, context, field_pb2.ListResponse)
+
+    def GetScoping(self, request, context):
+        field = self._field(request.field, context)
+        return field_pb2.GetScopingResponse(scoping=self._scoping_message(field.scoping))
+
+    def GetSupport(self, request, context):
+        field = self._field(request.field, context)
+        if request.type not in field.supports:
+            context.abort(grpc.StatusCode.NOT_FOUND, "The field has no such support.")
+        support = support_pb2.Support(type=request.type)
+        _set_id(support, field.supports[request.type])
+        return support
+
+    def SetSupport(self, request, context):
+        field = self._field(request.field, context)
+        field.supports[request.support.type] = _get_id(request.support)
+        return base_pb2.Empty()
+
+    def GetFieldDefinition(self, request, context):
+        field = self._field(request.field, context)
+        response = field_pb2.GetFieldDefinitionResponse(name=field.name)
+        _set_id(response.field_definition, self._store.register(field.definition))
+        return response
+
+    def GetElementaryData(self, request, context):
+        field = self._field(request.field, context)
+        if not 0 <= request.index < field.elementary_data_count:
+            context.abort(grpc.StatusCode.OUT_OF_RANGE, f"No entity at index {request.index}.")
+        response = field_pb2.GetElementaryDataResponse()
+        container = response.elemdata_containers
+        if request.index < field.scoping.ids.size:
+            container.scoping_id = int(field.scoping.ids[request.index])
+        values = field.entity_data(request.index).tolist()
+        if field.datatype == "int":
+            container.data.dataint.rep_int.extend(values)
+        elif _received_dtype(_client_metadata(context), np.float64) == np.float32:
+            container.data.datafloat.rep_float.extend(values)
+        else:
+            container.data.datadouble.rep_double.extend(values)
+        return response
+
+    def Count(self, request, context):
+        field = self._field(request.field, context)
+        if request.entity == base_pb2.NUM_COMPONENT:
+            count = field.component_count
+        elif request.entity == base_pb2.NUM_ELEMENTARY_DATA:
+            count = field.elementary_data_count
+        else:
+            count = 0
+        return base_pb2.CountResponse(count=count)
+
+    def Delete(self, request, context):
+        return self._delete(request)
+
+
+class _ScopingServicer(_Servicer, scoping_pb2_grpc.ScopingServiceServicer):
+    def _scoping(self, message, context):
+        return self._store.get(_get_id(message), context, _Scoping)
+
+    def Create(self, request, context):
+        return self._scoping_message(_Scoping())
+
+    def Update(self, request, context):
+        scoping = self._scoping(request.scoping, context)
+        if request.WhichOneof("update_request") == "location":
+            scoping.location = request.location.location
+        else:
+            index, entity_id = request.index_id.index, request.index_id.id
+            if index == scoping.ids.size:
+                scoping.ids = np.append(scoping.ids, np.int32(entity_id))
+            elif 0 <= index < scoping.ids.size:
+                scoping.ids[index] = entity_id
+            else:
+                context.abort(grpc.StatusCode.OUT_OF_RANGE, f"No entity at index {index}.")
+        return base_pb2.Empty()
+
+    def UpdateIds(self, request_iterator, context):
+        first, array = self._receive_array(request_iterator, context, np.int32)
+        scoping = self._scoping(first.scoping, context)
+        scoping.ids = array.astype(np.int32)
+        return base_pb2.Empty()
+
+    def List(self, request, context):
+        scoping = self._scoping(request, context)
+        response_class = getattr(scoping_pb2, "ListResponse", base_pb2.Ids)
+        if _has_field(response_class, "array"):
+            return self._send_array(scoping.ids, context, response_class)
+        response = response_class()
+        response.ids.rep_int.extend(scoping.ids.tolist())
+        return iter([response])
+
+    def Count(self, request, context):
+        scoping = self._scoping(request.scoping, context)
+        return base_pb2.CountResponse(count=scoping.ids.size)
+
+    def GetLocation(self, request, context):
+        scoping = self._scoping(request, context)
+        response = scoping_pb2.GetLocationResponse()
+        response.loc.location = scoping.location
+        return response
+
+    def Get(self, request, context):
+        scoping = self._scoping(request.scoping, context)
+        if request.WhichOneof("type_request") == "id":
+            indices = np.flatnonzero(scoping.ids == request.id)
+            index = int(indices[0]) if indices.size else -1
+            return scoping_pb2.GetResponse(index=index)
+        if not 0 <= request.index < scoping.ids.size:
+            context.abort(grpc.StatusCode.OUT_OF_RANGE, f"No entity at index {request.index}.")
+        return scoping_pb2.GetResponse(id=int(scoping.ids[request.index]))
+
+    def Delete(self, request, context):
+        return self._delete(request)
+
+
+class _CollectionServicer(_Servicer, collection_pb2_grpc.CollectionServiceServicer):
+    # message types of the entries by collection type
+    _ENTRY_MESSAGES = {
+        base_pb2.FIELD: field_pb2.Field,
+        base_pb2.SCOPING: scoping_pb2.Scoping,
+        base_pb2.MESHED_REGION: meshed_region_pb2.MeshedRegion,
+    }
+
+    def _collection(self, message, context):
+        return self._store.get(_get_id(message), context, _Collection)
+
+    def Create(self, request, context):
+        return self._collection_message(_Collection(request.type))
+
+    def UpdateLabels(self, request, context):
+        collection = self._collection(request.collection, context)
+        for new_label in request.labels:
+            if new_label.label in collection.labels:
+                continue
+            collection.labels.append(new_label.label)
+            if new_label.HasField("default_value"):
+                for label_space, _ in collection.entries:
+                    label_space[new_label.label] = new_label.default_value.default_value
+        return base_pb2.Empty()
+
+    def UpdateEntry(self, request, context):
+        collection = self._collection(request.collection, context)
+        message_class = self._ENTRY_MESSAGES.get(collection.type)
+        if message_class is None or not request.entry.HasField("dpf_type"):
+            context.abort(grpc.StatusCode.UNIMPLEMENTED, "Unsupported collection entry.")
+        message = message_class()
+        request.entry.dpf_type.Unpack(message)
+        entity = self._store.get(_get_id(message), context)
+        if request.WhichOneof("location") == "index":
+            index = request.index
+            if 0 <= index < len(collection.entries):
+                collection.entries[index] = (collection.entries[index][0], entity)
+            else:
+                collection.entries.append(({}, entity))
+            return base_pb2.Empty()
+        label_space = dict(request.label_space.label_space)
+        for label in label_space:
+            if label not in collection.labels:
+                collection.labels.append(label)
+        index = collection.find(label_space)
+        if index is None:
+            collection.entries.append((label_space, entity))
+        else:
+            collection.entries[index] = (label_space, entity)
+        return base_pb2.Empty()
+
+    def List(self, request, context):
+        collection = self._collection(request, context)
+        response = collection_pb2.ListResponse(count_entries=len(collection.entries))
+        response.labels.labels.extend(collection.labels)
+        return response
+
+    def GetEntries(self, request, context):
+        collection = self._collection(request.collection, context)
+        location = request.WhichOneof("location")
+        if location == "index":
+            if not 0 <= request.index < len(collection.entries):
+                context.abort(
+                    grpc.StatusCode.OUT_OF_RANGE, f"No entry at index {request.index}."
+                )
+            entries = [collection.entries[request.index]]
+        elif location == "label_space":
+            requested = dict(request.label_space.label_space).items()
+            entries = [
+                (label_space, entity)
+                for label_space, entity in collection.entries
+                if requested <= label_space.items()
+            ]
+        else:
+            entries = collection.entries
+        response = collection_pb2.GetEntriesResponse()
+        for label_space, entity in entries:
+            entry = response.entries.add()
+            entry.dpf_type.Pack(self._entity_message(entity))
+            for key, value in label_space.items():
+                entry.label_space.label_space[key] = value
+        return response
+
+    def GetSupport(self, request, context):
+        collection = self._collection(request.collection, context)
+        if not collection.supports:
+            context.abort(grpc.StatusCode.NOT_FOUND, "The collection has no support.")
+        support = support_pb2.Support(type=request.type)
+        _set_id(support, next(iter(collection.supports.values())))
+        return support
+
+    def GetLabelScoping(self, request, context):
+        collection = self._collection(request.collection, context)
+        ids = dict.fromkeys(
+            label_space[request.label]
+            for label_space, _ in collection.entries
+            if request.label in label_space
+        )
+        scoping = _Scoping(list(ids), request.label)
+        return collection_pb2.LabelScopingResponse(
+            label_scoping=self._scoping_message(scoping)
+        )
+
+    def UpdateSupport(self, request, context):
+        collection = self._collection(request.collection, context)
+        collection.supports[request.label] = _get_id(request.time_freq_support)
+        return base_pb2.Empty()
+
+    def Describe(self, request, context):
+        entity = self._store.get(request.dpf_type_id, context)
+        return base_pb2.DescribeResponse(description=entity.describe())
+
+    def Delete(self, request, context):
+        return self._delete(request)
+
+
+class _MeshedRegionServicer(_Servicer, meshed_region_pb2_grpc.MeshedRegionServiceServicer):
+    def _mesh(self, message, context):
+        return self._store.get(_get_id(message), context, _MeshedRegion)
+
+    def _index(self, mesh, request, context, find_index, count):
+        """Index of the node or element requested by index or ID."""
+        if request.WhichOneof("index_id") == "id":
+            index = find_index(request.id)
+            if index is None:
+                context.abort(grpc.StatusCode.NOT_FOUND, f"No entity with id {request.id}.")
+            return index
+        if not 0 <= request.index < count:
+            context.abort(grpc.StatusCode.OUT_OF_RANGE, f"No entity at index {request.index}.")
+        return request.index
+
+    def _node(self, mesh, index):
+        return meshed_region_pb2.Node(
+            id=mesh.node_ids[index], index=index, coordinates=mesh.coordinates[index]
+        )
+
+    def _property_field(
+        self, ids, location, values, data_pointer=None, datatype="int", nature="SCALAR"
+    ):
+        definition = _FieldDefinition(location, nature)
+        if data_pointer is not None:
+            data_pointer = np.array(data_pointer, dtype=np.int32)
+        field = _Field(definition, _Scoping(ids, location), datatype, values, data_pointer)
+        return self._field_message(field)
+
+    def Create(self, request, context):
+        return self._mesh_message(_MeshedRegion())
+
+    def Add(self, request, context):
+        self._mesh(request.mesh, context).add(request)
+        return base_pb2.Empty()
+
+    def GetScoping(self, request, context):
+        mesh = self._mesh(request.mesh, context)
+        if request.WhichOneof("scoping_type") == "named_selection":
+            context.abort(
+                grpc.StatusCode.NOT_FOUND,
+                f"No named selection {request.named_selection!r}.",
+            )
+        location = request.loc.location
+        if location == "Nodal":
+            ids = mesh.node_ids
+        elif location == "Elemental":
+            ids = mesh.element_ids
+        else:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, f"Unknown location {location!r}.")
+        return self._scoping_message(_Scoping(ids, location))
+
+    def GetElementalProperty(self, request, context):
+        mesh = self._mesh(request.mesh, context)
+        index = self._index(
+            mesh, request, context, mesh.element_index, len(mesh.element_ids)
+        )
+        if request.property == meshed_region_pb2.ELEMENT_TYPE:
+            prop = mesh.types[index]
+        elif request.property == meshed_region_pb2.ELEMENT_SHAPE:
+            prop = mesh.shapes[index]
+        elif request.property == meshed_region_pb2.MATERIAL:
+            prop = 0
+        else:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Unsupported elemental property.")
+        return meshed_region_pb2.ElementalPropertyResponse(prop=prop)
+
+    def UpdateRequest(self, request, context):
+        self._mesh(request.meshed_region, context).unit = request.unit
+        return base_pb2.Empty()
+
+    def ListProperty(self, request, context):
+        mesh = self._mesh(request.mesh, context)
+        n_elements = len(mesh.element_ids)
+        if request.WhichOneof("property_type") == "nodal_property":
+            if request.nodal_property == meshed_region_pb2.COORDINATES:
+                return self._property_field(
+                    mesh.node_ids, "Nodal", mesh.coordinates, datatype="double", nature="VECTOR"
+                )
+            # indices of the elements connected to each node
+            elements_of_nodes = [[] for _ in mesh.node_ids]
+            for element_index, connectivity in enumerate(mesh.connectivity):
+                for node_index in connectivity:
+                    elements_of_nodes[node_index].append(element_index)
+            sizes = [len(elements) for elements in elements_of_nodes]
+            return self._property_field(
+                mesh.node_ids,
+                "Nodal",
+                [index for elements in elements_of_nodes for index in elements],
+                np.cumsum([0] + sizes[:-1]) if sizes else [],
+            )
+        if request.elemental_property == meshed_region_pb2.ELEMENT_TYPE:
+            return self._property_field(mesh.element_ids, "Elemental", mesh.types)
+        if request.elemental_property == meshed_region_pb2.ELEMENT_SHAPE:
+            return self._property_field(mesh.element_ids, "Elemental", mesh.shapes)
+        if request.elemental_property == meshed_region_pb2.MATERIAL:
+            return self._property_field(mesh.element_ids, "Elemental", np.zeros(n_elements))
+        sizes = [len(connectivity) for connectivity in mesh.connectivity]
+        return self._property_field(
+            mesh.element_ids,
+            "Elemental",
+            [node for connectivity in mesh.connectivity for node in connectivity],
+            np.cumsum([0] + sizes[:-1]) if sizes else [],
+        )
+
+    def List(self, request, context):
+        mesh = self._mesh(request, context)
+        response = meshed_region_pb2.ListResponse(
+            unit=mesh.unit,
+            num_nodes=len(mesh.node_ids),
+            num_element=len(mesh.element_ids),
+        )
+        response.available_prop.extend(["coordinates", "connectivity", "eltype", "mat"])
+        shapes = set(mesh.shapes)
+        info = response.element_shape_info
+        info.has_shell_elements = meshed_region_pb2.SHELL in shapes
+        info.has_solid_elements = meshed_region_pb2.SOLID in shapes
+        info.has_beam_elements = meshed_region_pb2.BEAM in shapes
+        info.has_point_elements = _POINT1 in mesh.types
+        return response
+
+    def GetNode(self, request, context):
+        mesh = self._mesh(request.mesh, context)
+        index = self._index(mesh, request, context, mesh.node_index, len(mesh.node_ids))
+        return self._node(mesh, index)
+
+    def GetElement(self, request, context):
+        mesh = self._mesh(request.mesh, context)
+        index = self._index(
+            mesh, request, context, mesh.element_index, len(mesh.element_ids)
+        )
+        return meshed_region_pb2.Element(
+            id=mesh.element_ids[index],
+            index=index,
+            nodes=[self._node(mesh, node) for node in mesh.connectivity[index]],
+        )
+
+    def Delete(self, request, context):
+        return self._delete(request)
+
+
+class _OperatorConfigServicer(_Servicer, operator_config_pb2_grpc.OperatorConfigServiceServicer):
+    def Create(self, request, context):
+        message = operator_config_pb2.OperatorConfig()
+        _set_id(message, self._store.register(_Config()))
+        return message
+
+    def Update(self, request, context):
+        config = self._store.get(_get_id(request.config), context, _Config)
+        for option in request.options:
+            value = getattr(option, option.WhichOneof("option_value"))
+            config.options[option.option_name] = value
+        return base_pb2.Empty()
+
+    def List(self, request, context):
+        config = self._store.get(_get_id(request), context, _Config)
+        response = operator_config_pb2.ListResponse()
+        for name, value in config.options.items():
+            if isinstance(value, bool):
+                value = str(value).lower()
+            response.options.add(option_name=name, value_str=str(value))
+        return response
+
+    def Delete(self, request, context):
+        return self._delete(request)
+
+
+class _OperatorServicer(_Servicer, operator_pb2_grpc.OperatorServiceServicer):
+    # inputs holding an entity, by name of the field of the request
+    _ENTITY_INPUTS = {
+        "field": _Field,
+        "collection": _Collection,
+        "scoping": _Scoping,
+        "mesh": _MeshedRegion,
+    }
+
+    def _operator(self, message, context):
+        return self._store.get(_get_id(message), context, _Operator)
+
+    def _config(self, message, context):
+        if not _get_id(message):
+            return _Config()
+        return _Config(self._store.get(_get_id(message), context, _Config).options)
+
+    def Create(self, request, context):
+        definition = _OPERATORS.get(request.name)
+        if definition is None:
+            context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                f"The stand-in server has no operator named {request.name!r}.",
+            )
+        operator = _Operator(request.name, definition, self._config(request.config, context))
+        response = operator_pb2.Operator(name=request.name)
+        _set_id(response, self._store.register(operator))
+        _fill_specification(response.spec, definition)
+        return response
+
+    def Update(self, request, context):
+        operator = self._operator(request.op, context)
+        kind = request.WhichOneof("input")
+        if kind in self._ENTITY_INPUTS:
+            value = self._store.get(
+                _get_id(getattr(request, kind)), context, self._ENTITY_INPUTS[kind]
+            )
+        elif kind == "inputop":
+            value = _OperatorInput(
+                self._operator(request.inputop.inputop, context), request.inputop.pinOut
+            )
+        elif kind == "vint":
+            value = np.array(request.vint.rep_int, dtype=np.int32)
+        elif kind == "vdouble":
+            value = np.array(request.vdouble.rep_double, dtype=np.float64)
+        elif kind in ("str", "int", "double", "bool"):
+            value = getattr(request, kind)
+        else:
+            context.abort(grpc.StatusCode.UNIMPLEMENTED, f"Unsupported input {kind!r}.")
+        operator.inputs[request.pin] = value
+        return base_pb2.Empty()
+
+    def UpdateConfig(self, request, context):
+        operator = self._operator(request.op, context)
+        operator.config = self._config(request.config, context)
+        return base_pb2.Empty()
+
+    def _evaluate(self, operator, context):
+        inputs = {}
+        for pin, value in operator.inputs.items():
+            if isinstance(value, _OperatorInput):
+                value = self._evaluate(value.operator, context).get(value.pin)
+            inputs[pin] = value
+        missing = [
+            pin_spec.name
+            for pin, pin_spec in operator.definition.inputs.items()
+            if pin not in inputs and not pin_spec.optional
+        ]
+        if missing:
+            context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                f"{operator.name}: the pins {missing} are not connected.",
+            )
+        try:
+            return operator.definition.evaluate(inputs)
+        except (IndexError, TypeError, ValueError) as e:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, f"{operator.name}: {e}")
+
+    def Get(self, request, context):
+        operator = self._operator(request.op, context)
+        outputs = self._evaluate(operator, context)
+        response = operator_pb2.OperatorResponse()
+        if request.type == base_pb2.RUN:
+            return response
+        if request.pin not in outputs:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, f"No output on pin {request.pin}.")
+        value = outputs[request.pin]
+        if isinstance(value, _Field):
+            response.field.CopyFrom(self._field_message(value))
+        elif isinstance(value, _Collection):
+            response.collection.CopyFrom(self._collection_message(value))
+        elif isinstance(value, _Scoping):
+            response.scoping.CopyFrom(self._scoping_message(value))
+        elif isinstance(value, _MeshedRegion):
+            response.mesh.CopyFrom(self._mesh_message(value))
+        elif isinstance(value, bool):
+            response.bool = value
+        elif isinstance(value, int):
+            response.int = value
+        elif isinstance(value, float):
+            response.double = value
+        elif isinstance(value, str):
+            response.str = value
+        else:
+            context.abort(
+                grpc.StatusCode.UNIMPLEMENTED, f"Unsupported output {type(value).__name__}."
+            )
+        return response
+
+    def List(self, request, context):
+        operator = self._operator(request, context)
+        response = operator_pb2.ListResponse(op_name=operator.name)
+        _set_id(response.config, self._store.register(_Config(operator.config.options)))
+        if _has_field(response, "spec"):
+            _fill_specification(response.spec, operator.definition)
+        return response
+
+    def Delete(self, request, context):
+        return self._delete(request)
+
+
+# services implemented by the stand-in server
+_SERVICES = (
+    (base_pb2_grpc, "BaseService", _BaseServicer),
+    (field_definition_pb2_grpc, "FieldDefinitionService", _FieldDefinitionServicer),
+    (field_pb2_grpc, "FieldService", _FieldServicer),
+    (scoping_pb2_grpc, "ScopingService", _ScopingServicer),
+    (collection_pb2_grpc, "CollectionService", _CollectionServicer),
+    (meshed_region_pb2_grpc, "MeshedRegionService", _MeshedRegionServicer),
+    (operator_config_pb2_grpc, "OperatorConfigService", _OperatorConfigServicer),
+    (operator_pb2_grpc, "OperatorService", _OperatorServicer),
+)
+
+
+class _Runtime:
+    """State of a stand-in server shared by its services, in the server process."""
+
+    def __init__(self, options, latency, bandwidth):
+        self.ip = options["ip"]
+        self.port = options["port"]
+        self.version = options["version"]
+        self.chunk_size = options["chunk_size"]
+        self.float32 = options["float32"]
+        self.tmp_dir = options["tmp_dir"]
+        self._max_workers = options["max_workers"]
+        self._latency = latency
+        self._bandwidth = bandwidth
+        self._store = _Store()
+
+    @property
+    def latency(self):
+        return self._latency.value
+
+    @property
+    def bandwidth(self):
+        return self._bandwidth.value or None
+
+    def _throttled(self, method):
+        """Apply the artificial latency and bandwidth to a method of a service."""
+
+        def transfer(message):
+            bandwidth = self.bandwidth
+            if bandwidth:
+                time.sleep(message.ByteSize() / bandwidth)
+            return message
+
+        @functools.wraps(method)
+        def wrapper(request, context):
+            latency = self.latency
+            if latency:
+                time.sleep(latency)
+            if isinstance(request, Message):
+                transfer(request)
+            else:
+                request = map(transfer, request)
+            response = method(request, context)
+            if isinstance(response, Message):
+                return transfer(response)
+            return map(transfer, response)
+
+        return wrapper
+
+    def start(self):
+        """Start the gRPC server and return it."""
+        grpc_server = grpc.server(futures.ThreadPoolExecutor(max_workers=self._max_workers))
+        for module, service, servicer_class in _SERVICES:
+            servicer = servicer_class(self)
+            servicer_base = getattr(module, f"{service}Servicer")
+            for name, attribute in vars(servicer_base).items():
+                if callable(attribute) and not name.startswith("_"):
+                    setattr(servicer, name, self._throttled(getattr(servicer, name)))
+            getattr(module, f"add_{service}Servicer_to_server")(servicer, grpc_server)
+        self.port = grpc_server.add_insecure_port(f"{self.ip}:{self.port}")
+        grpc_server.start()
+        return grpc_server
+
+
+def _serve(options, latency, bandwidth, connection):
+    """Run a stand-in server until the process which started it asks it to stop."""
+    runtime = _Runtime(options, latency, bandwidth)
+    try:
+        grpc_server = runtime.start()
+    except Exception as e:
+        connection.send(e)
+        return
+    connection.send(runtime.port)
+    grace = None
+    while True:
+        try:
+            command, argument = connection.recv()
+        except EOFError:
+            # the client process ended
+            break
+        if command == "n_entities":
+            connection.send(len(runtime._store))
+        elif command == "stop":
+            grace = argument
+            break
+    grpc_server.stop(grace).wait()
+    try:
+        connection.send(None)
+    except OSError:
+        pass
+
+
+class StandInServer:
+    """Stand-in of a DPF server running in a child process.
+
+    The server listens on localhost, and clients connect to it with
+    :func:`connect` like to any remote DPF server. Running it in its own
+    process lets it serve the calls concurrently with the client, and keeps
+    the client objects deleted by the garbage collector from calling the
+    server from one of its own threads.
+
+    Parameters
+    ----------
+    latency : float, optional
+        Artificial delay added to each call, in seconds. The default is ``0.0``.
+    bandwidth : float, optional
+        Artificial bandwidth applied to each request and response, in bytes
+        per second. The default is ``None``, in which case the transfers are
+        not limited.
+    ip : str, optional
+        IP address to listen on. The default is the ``DPF_IP`` environment
+        variable or ``"127.0.0.1"``.
+    port : int, optional
+        Port to listen on. The default is ``0``, in which case a free port
+        is picked when the server starts.
+    version : str, optional
+        DPF version reported to the clients. The default is ``None``, in
+        which case the latest version supported by the installed
+        ``ansys-grpc-dpf`` messages is reported, ``"2.1"`` or ``"2.0"``.
+    max_workers : int, optional
+        Number of threads serving the calls. The default is ``10``.
+    chunk_size : int, optional
+        Size of the chunks of the streamed arrays and files, in bytes. The
+        default is ``misc.DEFAULT_FILE_CHUNK_SIZE``.
+    float32 : bool, optional
+        Whether the streamed field data is sent in single precision when the
+        client requests it. With ``False``, it is always sent in double
+        precision, like some servers do. The default is ``True``.
+
+    Attributes
+    ----------
+    latency : float
+        Artificial delay added to each call, which can be changed while the
+        server runs.
+    bandwidth : float
+        Artificial bandwidth, which can be changed while the server runs.
+
+    Notes
+    -----
+    The child process is spawned, so it imports the main module of the
+    client again. A script starting the server must protect its entry point
+    with ``if __name__ == "__main__":``, otherwise the child process runs the
+    script instead of the server and :func:`start` times out after 30
+    seconds.
+
+    Examples
+    --------
+    >>> from ansys.dpf import core as dpf
+    >>> from ansys.dpf.core.stand_in_server import StandInServer
+    >>> stand_in = StandInServer(bandwidth=100e6).start()
+    >>> server = stand_in.connect()
+    >>> scoping = dpf.Scoping(ids=[1, 2, 3], server=server)
+    >>> len(scoping)
+    3
+    >>> stand_in.stop()
+
+    """
+
+    def __init__(
+        self,
+        latency=0.0,
+        bandwidth=None,
+        ip=serverlib.LOCALHOST,
+        port=0,
+        version=None,
+        max_workers=10,
+        chunk_size=misc.DEFAULT_FILE_CHUNK_SIZE,
+        float32=True,
+    ):
+        self._latency = latency
+        self._bandwidth = bandwidth
+        self.ip = ip
+        self.port = port
+        self.version = _protos_version() if version is None else version
+        self.chunk_size = chunk_size
+        self.float32 = float32
+        self.tmp_dir = None
+        self._max_workers = max_workers
+        self._shared_latency = None
+        self._shared_bandwidth = None
+        self._process = None
+        self._connection = None
+        self._lock = threading.Lock()
+
+    @property
+    def latency(self):
+        return self._latency
+
+    @latency.setter
+    def latency(self, value):
+        self._latency = value
+        if self._shared_latency is not None:
+            self._shared_latency.value = value
+
+    @property
+    def bandwidth(self):
+        return self._bandwidth
+
+    @bandwidth.setter
+    def bandwidth(self, value):
+        self._bandwidth = value
+        if self._shared_bandwidth is not None:
+            self._shared_bandwidth.value = value or 0.0
+
+    def _request(self, command, argument=None):
+        with self._lock:
+            self._connection.send((command, argument))
+            return self._connection.recv()
+
+    @property
+    def n_entities(self):
+        """Number of entities held by the server."""
+        if self._process is None:
+            return 0
+        return self._request("n_entities")
+
+    def start(self, timeout=30):
+        """Start the server process and wait for it to listen to the clients.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum time to start, in seconds. The default is ``30``.
+
+        Returns
+        -------
+        StandInServer
+            This server, listening on :attr:`port`.
+        """
+        if self._process is not None:
+            return self
+        self.tmp_dir = tempfile.mkdtemp(prefix="dpf_stand_in_")
+        # a forked gRPC runtime is not usable, the process is spawned
+        context = multiprocessing.get_context("spawn")
+        self._shared_latency = context.Value("d", self._latency, lock=False)
+        self._shared_bandwidth = context.Value("d", self._bandwidth or 0.0, lock=False)
+        self._connection, child_connection = context.Pipe()
+        options = {
+            "ip": self.ip,
+            "port": self.port,
+            "version": self.version,
+            "chunk_size": self.chunk_size,
+            "float32": self.float32,
+            "tmp_dir": self.tmp_dir,
+            "max_workers": self._max_workers,
+        }
+        self._process = context.Process(
+            target=_serve,
+            args=(options, self._shared_latency, self._shared_bandwidth, child_connection),
+            name="dpf-stand-in-server",
+            daemon=True,
+        )
+        self._process.start()
+        child_connection.close()
+        atexit.register(self.stop)
+        port = None
+        if self._connection.poll(timeout):
+            try:
+                port = self._connection.recv()
+            except EOFError:
+                pass
+        if not isinstance(port, int):
+            self.stop()
+            if isinstance(port, Exception):
+                raise port
+            raise TimeoutError(
+                f"The stand-in server did not start in {timeout} seconds. The "
+                'script starting it must be protected by if __name__ == "__main__":.'
+            )
+        self.port = port
+        return self
+
+    def stop(self, grace=None):
+        """Stop the server and delete its temporary folder.
+
+        Parameters
+        ----------
+        grace : float, optional
+            Time given to the ongoing calls to end, in seconds. The default
+            is ``None``, in which case they are aborted.
+        """
+        if self._process is None:
+            return
+        atexit.unregister(self.stop)
+        try:
+            self._request("stop", grace)
+        except (EOFError, OSError):
+            pass
+        self._process.join(10 + (grace or 0))
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join()
+        self._connection.close()
+        self._process = None
+        self._connection = None
+        self._shared_latency = None
+        self._shared_bandwidth = None
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def connect(self, as_global=False, timeout=10):
+        """Connect a client to the server, which is started if needed.
+
+        Parameters
+        ----------
+        as_global : bool, optional
+            Whether to use the connection as the global server of the
+            client. The default is ``False``.
+        timeout : float, optional
+            Maximum time to connect, in seconds. The default is ``10``.
+
+        Returns
+        -------
+        server : server.DpfServer
+        """
+        self.start()
+        return serverlib.DpfServer(
+            ip=self.ip,
+            port=self.port,
+            timeout=timeout,
+            as_global=as_global,
+            launch_server=False,
+        )
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
@@ -14,8 +14,11 @@ from vtk import (
     VTK_QUADRATIC_TETRA,
     VTK_QUADRATIC_HEXAHEDRON,
     VTK_QUADRATIC_PYRAMID,
+    VTK_UNSIGNED_CHAR,
+    vtkCellArray,
     vtkVersion,
 )
+from vtk.util.numpy_support import numpy_to_vtk, numpy_to_vtkIdTypeArray
 import pyvista as pv
 
 VTK9 = vtkVersion().GetVTKMajorVersion() >= 9
@@ -139,10 +142,54 @@ VTK_LINEAR_MAPPING = np.array(
 )  # kAnsBeam4 = 31,
 
 
+# element types whose midside node indices are replaced by their corner
+# node indices when cells are mapped to linear cells, to work around a
+# visualization bug within VTK with quadratic surface cells
+# (element type, number of corner nodes)
+LINEAR_MIDSIDE_MAPPING = (
+    (6, 4),  # kAnsQuad8
+    (4, 3),  # kAnsTri6
+)
+
+
+def _cell_offsets(elem_size):
+    """Return the start of each cell in the connectivity, followed by its size."""
+    offsets = np.empty(elem_size.size + 1, dtype=np.int64)
+    offsets[0] = 0
+    np.cumsum(elem_size, out=offsets[1:])
+    return offsets
+
+
+def _copy_corner_to_midside_nodes(connectivity, offsets, etypes):
+    """Replace in place the midside nodes of quadratic surface cells."""
+    for etype, n_corner in LINEAR_MIDSIDE_MAPPING:
+        cell_start = offsets[:-1][etypes == etype]
+        if cell_start.size:
+            for i in range(n_corner):
+                connectivity[cell_start + n_corner + i] = connectivity[cell_start + i]
+
+
+def _legacy_cells(connectivity, offsets, elem_size):
+    """Return the cells in the legacy VTK format and the start of each cell.
+
+    Each cell is its number of nodes followed by its node indices.
+    """
+    n_cells = elem_size.size
+    cell_start = offsets[:-1] + np.arange(n_cells)
+    is_size = np.zeros(connectivity.size + n_cells, dtype=bool)
+    is_size[cell_start] = True
+    cells = np.empty(is_size.size, dtype=pv.ID_TYPE)
+    cells[is_size] = elem_size
+    cells[~is_size] = connectivity
+    return cells, cell_start
+
+
 def dpf_mesh_to_vtk(nodes, etypes, connectivity, as_linear=True):
     """Return a pyvista unstructured grid given DPF node and element
     definitions.
 
+    The input arrays are not modified.
+
     Parameters
     ----------
     nodes : np.ndarray
@@ -159,60 +206,46 @@ def dpf_mesh_to_vtk(nodes, etypes, connectivity, as_linear=True):
     grid : pyvista.UnstructuredGrid
         Unstructred grid of the DPF mesh.
     """
-    # could make this more efficient in C...
+    etypes = np.asarray(etypes).reshape(-1)
     elem_size = SIZE_MAPPING[etypes]
-    insert_ind = np.cumsum(elem_size)
-    insert_ind = np.hstack(([0], insert_ind))[:-1]
+    offsets = _cell_offsets(elem_size)
+
+    # single copy of the connectivity, modified in place below
+    connectivity = np.array(connectivity, dtype=pv.ID_TYPE).reshape(-1)
 
     # TODO: Investigate why connectivity can be -1
     nullmask = connectivity == -1
-    connectivity[nullmask] = 0
     if nullmask.any():
+        connectivity[nullmask] = 0
+        nodes = np.array(nodes, dtype=float)
         nodes[0] = np.nan
 
-    # partition cells in vtk format
-    cells = np.insert(connectivity, insert_ind, elem_size)
-
-    def compute_offset():
-        """Return the starting point of a cell in the cells array"""
-        return insert_ind + np.arange(insert_ind.size)
-
     # convert kAns to VTK cell type
-    offset = None
     if as_linear:
         vtk_cell_type = VTK_LINEAR_MAPPING[etypes]
-
-        # visualization bug within VTK with quadratic surf cells
-        ansquad8_mask = etypes == 6
-        if np.any(ansquad8_mask):  # kAnsQuad8
-
-            # simply copy the edge node indices to the midside points
-            offset = compute_offset()
-            cell_pos = offset[ansquad8_mask]
-            cells[cell_pos + 5] = cells[cell_pos + 1]
-            cells[cell_pos + 6] = cells[cell_pos + 2]
-            cells[cell_pos + 7] = cells[cell_pos + 3]
-            cells[cell_pos + 8] = cells[cell_pos + 4]
-
-        anstri6_mask = etypes == 4  # kAnsTri6 = 4
-        if np.any(anstri6_mask):
-            if offset is None:
-                offset = compute_offset()
-            cell_pos = offset[anstri6_mask]
-            cells[cell_pos + 4] = cells[cell_pos + 1]
-            cells[cell_pos + 5] = cells[cell_pos + 2]
-            cells[cell_pos + 6] = cells[cell_pos + 3]
-
+        _copy_corner_to_midside_nodes(connectivity, offsets, etypes)
     else:
         vtk_cell_type = VTK_MAPPING[etypes]
 
     # different treatment depending on the version of vtk
     if VTK9:
-        # compute offset array when < VTK v9
-        return pv.UnstructuredGrid(cells, vtk_cell_type, nodes)
-
-    # might be computed when checking for VTK quadratic bug
-    if offset is None:
-        offset = compute_offset()
-
-    return pv.UnstructuredGrid(offset, cells, vtk_cell_type, nodes)
+        # offsets and connectivity are given to VTK as they are
+        cell_array = vtkCellArray()
+        cell_array.SetData(
+            numpy_to_vtkIdTypeArray(offsets.astype(pv.ID_TYPE), deep=False),
+            numpy_to_vtkIdTypeArray(connectivity, deep=False),
+        )
+        grid = pv.UnstructuredGrid()
+        grid.points = nodes
+        grid.SetCells(
+            numpy_to_vtk(
+                vtk_cell_type.astype(np.uint8),
+                deep=False,
+                array_type=VTK_UNSIGNED_CHAR,
+            ),
+            cell_array,
+        )
+        return grid
+
+    cells, cell_start = _legacy_cells(connectivity, offsets, elem_size)
+    return pv.UnstructuredGrid(cell_start, cells, vtk_cell_type, nodes)
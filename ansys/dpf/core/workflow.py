@@ -6,7 +6,7 @@ Interface to underlying gRPC workflow.
 import logging
 
 from ansys import dpf
-from ansys.dpf.core import dpf_operator, inputs, outputs
+from ansys.dpf.core import dpf_operator, inputs, instrumentation, misc, outputs
 from ansys.dpf.core.errors import protect_grpc
 from ansys.grpc.dpf import base_pb2, workflow_pb2, workflow_pb2_grpc
 
@@ -60,6 +60,8 @@ class Workflow:
         self._stub = self._connect()
 
         self._message = workflow
+        # operators whose deferred connections are sent before an evaluation
+        self._deferred_operators = []
 
         if workflow is None:
             self.__send_init_request()
@@ -108,6 +110,9 @@ class Workflow:
         request.pin_name = pin_name
         dpf_operator._fillConnectionRequestMessage(request, inpt, pin_out)
         self._stub.UpdateConnection(request)
+        input_operator = dpf_operator._input_operator(inpt)
+        if misc.DEFERRED_CONNECTIONS and input_operator is not None:
+            self._deferred_operators.append(input_operator)
 
     @protect_grpc
     def get_output(self, pin_name, output_type):
@@ -122,20 +127,22 @@ class Workflow:
             Type of the requested output.
         """
 
-        request = workflow_pb2.WorkflowEvaluationRequest()
-        request.wf.CopyFrom(self._message)
-        request.pin_name = pin_name
-
-        if output_type is not None:
-            dpf_operator._write_output_type_to_proto_style(output_type, request)
-            out = self._stub.Get(request)
-            return dpf_operator._convertOutputMessageToPythonInstance(
-                out, output_type, self._server
-            )
-        else:
-            raise ValueError(
-                "please specify an output type to get the workflow's output"
-            )
+        with instrumentation.span("Workflow.get_output", pin_name=pin_name):
+            self._submit_pending_connections()
+            request = workflow_pb2.WorkflowEvaluationRequest()
+            request.wf.CopyFrom(self._message)
+            request.pin_name = pin_name
+
+            if output_type is not None:
+                dpf_operator._write_output_type_to_proto_style(output_type, request)
+                out = self._stub.Get(request)
+                return dpf_operator._convertOutputMessageToPythonInstance(
+                    out, output_type, self._server
+                )
+            else:
+                raise ValueError(
+                    "please specify an output type to get the workflow's output"
+                )
 
     def set_input_name(self, name, *args):
         """Set the name of the input pin of the workflow to expose it for future connection.
@@ -214,6 +221,10 @@ class Workflow:
                 output_request.operator.CopyFrom(arg._message)
             elif isinstance(arg, int):
                 output_request.pin = arg
+            if misc.DEFERRED_CONNECTIONS:
+                output_operator = dpf_operator._input_operator(arg)
+                if output_operator is not None:
+                    self._deferred_operators.append(output_operator)
         request.outputs_naming.extend([output_request])
         self._stub.UpdatePinNames(request)
 
@@ -237,16 +248,18 @@ class Workflow:
         """
         request = workflow_pb2.AddOperatorsRequest()
         request.wf.CopyFrom(self._message)
-        if isinstance(operators, list):
-            request.operators.extend([op._message for op in operators])
-        elif isinstance(operators, dpf_operator.Operator):
-            request.operators.extend([operators._message])
-        else:
+        if isinstance(operators, dpf_operator.Operator):
+            operators = [operators]
+        elif not isinstance(operators, list):
             raise TypeError(
                 "Operators to add to the workflow are expected to be of "
                 f"type {type(list).__name__} or {type(dpf_operator.Operator).__name__}"
             )
+        request.operators.extend([op._message for op in operators])
         self._stub.AddOperators(request)
+        if misc.DEFERRED_CONNECTIONS:
+            # connections are sent before the workflow is evaluated
+            self._deferred_operators.extend(operators)
 
     def add_operator(self, operator):
         """Add an operator to the list of operators of the workflow.
@@ -293,6 +306,8 @@ class Workflow:
         >>> workflow_copy = dpf.Workflow.get_recorded_workflow(id)
 
         """
+        # the recorded workflow holds the connections of its operators
+        self._submit_pending_connections()
         request = workflow_pb2.RecordInInternalRegistryRequest()
         request.wf.CopyFrom(self._message)
         if identifier:
@@ -424,6 +439,12 @@ class Workflow:
             request.input_to_output.output_name = input_output_names[0]
             request.input_to_output.input_name = input_output_names[1]
         self._stub.Chain(request)
+        self._deferred_operators.extend(workflow._deferred_operators)
+
+    def _submit_pending_connections(self):
+        """Send the deferred connections of the operators of the workflow."""
+        dpf_operator._submit_pending_connections(self._deferred_operators)
+        self._deferred_operators = []
 
     def _connect(self):
         """Connect to the gRPC service."""
@@ -0,0 +1,452 @@
+"""
+Benchmark suite of the DPF client.
+
+Measures the transfers and the client-side processing of the data exchanged
+with a DPF server, on inputs of increasing size, and stores the results in a
+JSON file. Two result files can then be compared to detect the regressions
+beyond a threshold.
+
+The benchmarks run against the in-process stand-in server by default, so
+that they can be run on any machine, or against a local or remote DPF
+server.
+
+Usage::
+
+    python benchmarks/bench_client.py list
+    python benchmarks/bench_client.py run --output baseline.json
+    python benchmarks/bench_client.py run --server local --output current.json
+    python benchmarks/bench_client.py run --filter field --max-size 100000000
+    python benchmarks/bench_client.py compare baseline.json current.json --threshold 0.2
+
+``compare`` exits with a non-zero status when at least one benchmark is
+slower than its baseline by more than the threshold.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, NamedTuple
+
+import numpy as np
+
+
+class Skip(Exception):
+    """Raised by the setup of a benchmark which cannot run on a server."""
+
+
+class Benchmark(NamedTuple):
+    name: str
+    setup: Callable
+    sizes: list
+    description: str
+
+
+BENCHMARKS = {}
+
+
+def benchmark(*sizes):
+    """Register a benchmark parameterized by the given sizes.
+
+    The decorated function receives the server and the size, and returns a
+    tuple of the function to time and the number of bytes it transfers, or
+    ``None``. The timed function can return its own duration in seconds,
+    which is used instead of its wall time.
+    """
+
+    def decorator(setup):
+        name = setup.__name__[len("bench_"):]
+        description = setup.__doc__.strip().splitlines()[0]
+        BENCHMARKS[name] = Benchmark(name, setup, [int(size) for size in sizes], description)
+        return setup
+
+    return decorator
+
+
+def _scalar_field(server, size, data=None):
+    from ansys.dpf import core as dpf
+
+    field = dpf.fields_factory.create_scalar_field(size, server=server)
+    if data is not None:
+        field.data = data
+    return field
+
+
+def _mesh(server, n_nodes, seed=0):
+    """Meshed region of tetrahedrons with random coordinates and connectivity."""
+    from ansys.dpf import core as dpf
+
+    rng = np.random.default_rng(seed)
+    n_elements = max(n_nodes // 4, 1)
+    return dpf.MeshedRegion.from_arrays(
+        node_ids=np.arange(1, n_nodes + 1),
+        coordinates=rng.random((n_nodes, 3)),
+        element_ids=np.arange(1, n_elements + 1),
+        element_types=np.full(n_elements, dpf.element_types.Tet4.value),
+        connectivity=rng.integers(0, n_nodes, 4 * n_elements, dtype=np.int32),
+        offsets=np.arange(0, 4 * n_elements + 1, 4),
+        server=server,
+    )
+
+
+@benchmark(1e5, 1e6, 1e7, 1e8)
+def bench_field_get_data(server, size):
+    """Download of the data of a scalar field of ``size`` doubles."""
+    field = _scalar_field(server, size, np.random.default_rng(0).random(size))
+    return field.get_data, size * 8
+
+
+@benchmark(1e5, 1e6, 1e7, 1e8)
+def bench_field_set_data(server, size):
+    """Upload of the data of a scalar field of ``size`` doubles."""
+    field = _scalar_field(server, size)
+    data = np.random.default_rng(0).random(size)
+
+    def set_data():
+        field.data = data
+
+    return set_data, size * 8
+
+
+@benchmark(1e5, 1e6, 1e7)
+def bench_scoping_set_ids(server, size):
+    """Upload of ``size`` ids of a scoping."""
+    from ansys.dpf import core as dpf
+
+    scoping = dpf.Scoping(server=server)
+    ids = np.arange(1, size + 1, dtype=np.int32)
+
+    def set_ids():
+        scoping.ids = ids
+
+    return set_ids, size * 4
+
+
+@benchmark(1e5, 1e6, 1e7)
+def bench_scoping_get_ids(server, size):
+    """Download of ``size`` ids of a scoping."""
+    from ansys.dpf import core as dpf
+
+    scoping = dpf.Scoping(server=server)
+    scoping.ids = np.arange(1, size + 1, dtype=np.int32)
+    return lambda: scoping._get_ids(np_array=True), size * 4
+
+
+@benchmark(1e4, 1e5, 1e6)
+def bench_map_scoping(server, size):
+    """``Nodes.map_scoping`` of a reversed scoping on a mesh of ``size`` nodes."""
+    from ansys.dpf import core as dpf
+    from ansys.dpf.core.nodes import Nodes
+
+    mesh = _mesh(server, size)
+    scoping = dpf.Scoping(location="Nodal", server=server)
+    scoping.ids = np.arange(size, 0, -1, dtype=np.int32)
+    # a new instance does not reuse the mapping built by the previous calls
+    return lambda: Nodes(mesh).map_scoping(scoping), None
+
+
+@benchmark(1e4, 1e5, 1e6)
+def bench_dpf_mesh_to_vtk(server, size):
+    """``vtk_helper.dpf_mesh_to_vtk`` of a mesh of ``size`` nodes."""
+    try:
+        from ansys.dpf.core.vtk_helper import dpf_mesh_to_vtk
+    except ModuleNotFoundError:
+        raise Skip("pyvista is not installed")
+
+    mesh = _mesh(server, size)
+    nodes = mesh.nodes.coordinates_field.data
+    etypes = mesh.elements.element_types_field.data
+    connectivity = mesh.elements.connectivities_field.data
+    return lambda: dpf_mesh_to_vtk(nodes, etypes, connectivity), None
+
+
+@benchmark(1e4, 1e5, 1e6)
+def bench_mesh_deep_copy(server, size):
+    """``MeshedRegion.deep_copy`` of a mesh of ``size`` nodes on the same server."""
+    mesh = _mesh(server, size)
+    return lambda: mesh.deep_copy(server=server), None
+
+
+@benchmark(10, 100, 1000)
+def bench_fields_container_iteration(server, size):
+    """Iteration on the data of a fields container of ``size`` fields."""
+    from ansys.dpf import core as dpf
+
+    fc = dpf.FieldsContainer(server=server)
+    fc.labels = ["time"]
+    for i in range(size):
+        fc.add_field({"time": i + 1}, _scalar_field(server, 100, np.full(100, float(i))))
+
+    def iterate():
+        for field in fc:
+            field.data
+
+    return iterate, None
+
+
+@benchmark(1)
+def bench_model_open(server, size, result_file=None):
+    """Creation of a ``Model`` and access to its mesh and result information."""
+    from ansys.dpf import core as dpf
+    from ansys.dpf.core import examples
+
+    if getattr(server, "_stand_in", None) is not None:
+        raise Skip("the stand-in server does not read result files")
+    result_file = result_file or examples.static_rst
+
+    def open_model():
+        model = dpf.Model(result_file, server=server)
+        model.metadata.result_info
+        model.metadata.meshed_region
+
+    return open_model, None
+
+
+@benchmark(1e6, 1e7, 1e8)
+def bench_file_upload(server, size):
+    """Upload of a file of ``size`` bytes in the temporary folder of the server."""
+    from ansys.dpf import core as dpf
+
+    base = dpf.BaseService(server)
+    path = _random_file(size)
+    return lambda: base.upload_file_in_tmp_folder(path), size
+
+
+@benchmark(1e6, 1e7, 1e8)
+def bench_file_download(server, size):
+    """Download of a file of ``size`` bytes from the server."""
+    from ansys.dpf import core as dpf
+
+    base = dpf.BaseService(server)
+    server_path = base.upload_file_in_tmp_folder(_random_file(size))
+    local_path = os.path.join(_tmp_dir(), "downloaded.bin")
+    return lambda: base.download_file(server_path, local_path), size
+
+
+@benchmark(1)
+def bench_import(server, size):
+    """Import time of ``ansys.dpf.core`` in a new interpreter."""
+    code = (
+        "import time; start = time.perf_counter(); import ansys.dpf.core; "
+        "print(time.perf_counter() - start)"
+    )
+
+    def import_time():
+        output = subprocess.check_output([sys.executable, "-c", code], text=True)
+        return float(output.split()[-1])
+
+    return import_time, None
+
+
+_TMP_DIR = None
+
+
+def _tmp_dir():
+    global _TMP_DIR
+    if _TMP_DIR is None:
+        _TMP_DIR = tempfile.TemporaryDirectory(prefix="dpf_benchmarks_")
+    return _TMP_DIR.name
+
+
+def _random_file(size):
+    path = os.path.join(_tmp_dir(), f"random_{size}.bin")
+    if not os.path.exists(path):
+        with open(path, "wb") as f:
+            for start in range(0, size, 1 << 24):
+                f.write(os.urandom(min(1 << 24, size - start)))
+    return path
+
+
+def measure(function, repeat):
+    """Durations in seconds of ``repeat`` calls of ``function`` after a warm-up call."""
+    function()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        duration = function()
+        end = time.perf_counter()
+        times.append(duration if isinstance(duration, float) else end - start)
+    return times
+
+
+def start_server(kind, ansys_path=None, latency=0.0, bandwidth=None):
+    """Start or connect to the server on which the benchmarks run.
+
+    ``kind`` is ``"stand-in"``, ``"local"`` or the ``IP:PORT`` address of a
+    running server.
+    """
+    from ansys.dpf import core as dpf
+
+    if kind == "stand-in":
+        from ansys.dpf.core.stand_in_server import StandInServer
+
+        stand_in = StandInServer(latency=latency, bandwidth=bandwidth)
+        stand_in.start()
+        server = stand_in.connect(as_global=False)
+        # keeps the stand-in alive as long as the server
+        server._stand_in = stand_in
+        return server
+    if kind == "local":
+        return dpf.start_local_server(as_global=False, ansys_path=ansys_path)
+    ip, port = kind.rsplit(":", 1)
+    return dpf.connect_to_server(ip, int(port), as_global=False)
+
+
+def run(args):
+    server = start_server(args.server, args.ansys_path, args.latency, args.bandwidth)
+    version = server.version
+    results = []
+    print(f"{'benchmark':<28} {'size':>10} {'min (s)':>10} {'median (s)':>11} {'MB/s':>9}")
+    for bench in BENCHMARKS.values():
+        if args.filter and not any(pattern in bench.name for pattern in args.filter):
+            continue
+        for size in bench.sizes:
+            if size > args.max_size:
+                continue
+            kwargs = {"result_file": args.result_file} if bench.name == "model_open" else {}
+            try:
+                function, n_bytes = bench.setup(server, size, **kwargs)
+            except Skip as e:
+                print(f"{bench.name:<28} {size:>10} skipped: {e}")
+                continue
+            times = measure(function, args.repeat)
+            result = {
+                "name": bench.name,
+                "size": size,
+                "times": times,
+                "min": min(times),
+                "median": statistics.median(times),
+            }
+            throughput = ""
+            if n_bytes:
+                result["bytes_per_second"] = n_bytes / result["min"]
+                throughput = f"{result['bytes_per_second'] / 1e6:>9.1f}"
+            results.append(result)
+            print(
+                f"{bench.name:<28} {size:>10} {result['min']:>10.4f} "
+                f"{result['median']:>11.4f} {throughput:>9}"
+            )
+
+    from ansys.dpf.core import __version__, settings
+
+    report = {
+        "metadata": {
+            "date": datetime.datetime.now().isoformat(timespec="seconds"),
+            "machine": platform.node(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "ansys-dpf-core": __version__,
+            "server": args.server,
+            "server_version": version,
+            "latency": args.latency,
+            "bandwidth": args.bandwidth,
+            "repeat": args.repeat,
+            "chunk_sizes": settings.get_chunk_size_stats(server),
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"results written in {args.output}")
+    return 0
+
+
+def list_benchmarks(args):
+    for bench in BENCHMARKS.values():
+        sizes = ", ".join(f"{size:g}" for size in bench.sizes)
+        print(f"{bench.name:<28} {sizes:<24} {bench.description}")
+    return 0
+
+
+def compare(args):
+    with open(args.baseline) as f:
+        baseline = {(r["name"], r["size"]): r for r in json.load(f)["results"]}
+    with open(args.current) as f:
+        current = {(r["name"], r["size"]): r for r in json.load(f)["results"]}
+
+    regressions = []
+    print(
+        f"{'benchmark':<28} {'size':>10} {'baseline (s)':>13} {'current (s)':>12} "
+        f"{'ratio':>7}"
+    )
+    for key in sorted(baseline.keys() & current.keys()):
+        before = baseline[key][args.statistic]
+        after = current[key][args.statistic]
+        ratio = after / before if before else float("inf")
+        regressed = ratio > 1.0 + args.threshold
+        if regressed:
+            regressions.append(key)
+        print(
+            f"{key[0]:<28} {key[1]:>10} {before:>13.4f} {after:>12.4f} "
+            f"{ratio:>6.2f}x{'  REGRESSION' if regressed else ''}"
+        )
+    for key in sorted(baseline.keys() ^ current.keys()):
+        where = "baseline" if key in baseline else "current results"
+        print(f"{key[0]:<28} {key[1]:>10} only in the {where}")
+
+    if regressions:
+        print(
+            f"{len(regressions)} benchmark(s) slower than the baseline by more than "
+            f"{args.threshold:.0%}"
+        )
+        return 1
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument(
+        "--server",
+        default="stand-in",
+        help='"stand-in" (default), "local" or the IP:PORT address of a running server',
+    )
+    run_parser.add_argument("--ansys-path", help="Ansys installation of a local server")
+    run_parser.add_argument(
+        "--latency", type=float, default=0.0, help="latency of the stand-in server (s)"
+    )
+    run_parser.add_argument(
+        "--bandwidth", type=float, help="bandwidth of the stand-in server (bytes/s)"
+    )
+    run_parser.add_argument(
+        "--filter", nargs="+", help="run the benchmarks whose name contains one of these"
+    )
+    run_parser.add_argument(
+        "--max-size", type=float, default=1e7, help="skip the larger sizes (default 1e7)"
+    )
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument("--result-file", help="result file opened by model_open")
+    run_parser.add_argument("--output", help="JSON file of the results")
+    run_parser.set_defaults(function=run)
+
+    list_parser = subparsers.add_parser("list", help="list the benchmarks")
+    list_parser.set_defaults(function=list_benchmarks)
+
+    compare_parser = subparsers.add_parser(
+        "compare", help="compare results and fail on regressions"
+    )
+    compare_parser.add_argument("baseline", help="JSON file of the reference results")
+    compare_parser.add_argument("current", help="JSON file of the new results")
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="tolerated relative slowdown (default 0.1)",
+    )
+    compare_parser.add_argument("--statistic", choices=["min", "median"], default="min")
+    compare_parser.set_defaults(function=compare)
+
+    args = parser.parse_args(argv)
+    return args.function(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
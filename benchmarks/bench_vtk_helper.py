@@ -0,0 +1,122 @@
+"""
+Benchmark of ``vtk_helper.dpf_mesh_to_vtk``.
+
+Compares the current conversion of DPF meshes to VTK grids with the
+previous one, based on ``np.insert``, on synthetic meshes of increasing
+size mixing linear and quadratic elements.
+
+Usage::
+
+    python benchmarks/bench_vtk_helper.py --n-elements 10000 100000 1000000
+"""
+import argparse
+import time
+
+import numpy as np
+import pyvista as pv
+
+from ansys.dpf.core import vtk_helper
+from ansys.dpf.core.vtk_helper import (
+    SIZE_MAPPING,
+    VTK9,
+    VTK_LINEAR_MAPPING,
+    VTK_MAPPING,
+)
+
+# kAnsTet10, kAnsHex20, kAnsTri6, kAnsQuad8, kAnsTet4, kAnsHex8, kAnsQuad4
+ELEMENT_TYPES = np.array([0, 1, 4, 6, 10, 11, 16])
+
+
+def legacy_dpf_mesh_to_vtk(nodes, etypes, connectivity, as_linear=True):
+    """Previous implementation of ``dpf_mesh_to_vtk``."""
+    elem_size = SIZE_MAPPING[etypes]
+    insert_ind = np.cumsum(elem_size)
+    insert_ind = np.hstack(([0], insert_ind))[:-1]
+
+    nullmask = connectivity == -1
+    connectivity[nullmask] = 0
+    if nullmask.any():
+        nodes[0] = np.nan
+
+    cells = np.insert(connectivity, insert_ind, elem_size)
+
+    def compute_offset():
+        return insert_ind + np.arange(insert_ind.size)
+
+    offset = None
+    if as_linear:
+        vtk_cell_type = VTK_LINEAR_MAPPING[etypes]
+        ansquad8_mask = etypes == 6
+        if np.any(ansquad8_mask):
+            offset = compute_offset()
+            cell_pos = offset[ansquad8_mask]
+            cells[cell_pos + 5] = cells[cell_pos + 1]
+            cells[cell_pos + 6] = cells[cell_pos + 2]
+            cells[cell_pos + 7] = cells[cell_pos + 3]
+            cells[cell_pos + 8] = cells[cell_pos + 4]
+
+        anstri6_mask = etypes == 4
+        if np.any(anstri6_mask):
+            if offset is None:
+                offset = compute_offset()
+            cell_pos = offset[anstri6_mask]
+            cells[cell_pos + 4] = cells[cell_pos + 1]
+            cells[cell_pos + 5] = cells[cell_pos + 2]
+            cells[cell_pos + 6] = cells[cell_pos + 3]
+    else:
+        vtk_cell_type = VTK_MAPPING[etypes]
+
+    if VTK9:
+        return pv.UnstructuredGrid(cells, vtk_cell_type, nodes)
+    if offset is None:
+        offset = compute_offset()
+    return pv.UnstructuredGrid(offset, cells, vtk_cell_type, nodes)
+
+
+def synthetic_mesh(n_elements, seed=0):
+    """Random nodes, element types and connectivity of a mesh."""
+    rng = np.random.default_rng(seed)
+    etypes = rng.choice(ELEMENT_TYPES, n_elements).astype(np.int32)
+    n_nodes = max(n_elements, 8)
+    connectivity = rng.integers(
+        0, n_nodes, SIZE_MAPPING[etypes].sum(), dtype=np.int32
+    )
+    nodes = rng.random((n_nodes, 3))
+    return nodes, etypes, connectivity
+
+
+def best_time(function, mesh, as_linear, repeat):
+    """Best wall time of ``repeat`` conversions of ``mesh``."""
+    times = []
+    for _ in range(repeat):
+        # the legacy implementation modifies its inputs
+        args = [array.copy() for array in mesh]
+        start = time.perf_counter()
+        function(*args, as_linear=as_linear)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument(
+        "--n-elements", type=int, nargs="+", default=[10000, 100000, 1000000]
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--quadratic", action="store_true", help="keep quadratic cells")
+    args = parser.parse_args()
+
+    as_linear = not args.quadratic
+    print(f"{'elements':>10} {'legacy (s)':>12} {'current (s)':>12} {'speedup':>8}")
+    for n_elements in args.n_elements:
+        mesh = synthetic_mesh(n_elements)
+        legacy = best_time(legacy_dpf_mesh_to_vtk, mesh, as_linear, args.repeat)
+        current = best_time(vtk_helper.dpf_mesh_to_vtk, mesh, as_linear, args.repeat)
+        print(
+            f"{n_elements:>10} {legacy:>12.4f} {current:>12.4f} "
+            f"{legacy / current:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
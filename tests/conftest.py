@@ -8,6 +8,8 @@ import os
 import pytest
 from ansys.dpf import core
 from ansys.dpf.core import examples
+from ansys.dpf.core.stand_in_server import StandInServer, _protos_version
+from ansys.grpc.dpf import meshed_region_pb2, operator_pb2
 
 core.settings.disable_off_screen_rendering()
 
@@ -153,7 +155,75 @@ def engineering_data_sources():
     return ds
 
 
-local_server = core.start_local_server(as_global=False)
+# message of the error raised when no Ansys installation is found
+NO_ANSYS_INSTALLATION = "Unable to automatically locate the Ansys path"
+
+try:
+    local_server = core.start_local_server(as_global=False)
+except ValueError as e:
+    if NO_ANSYS_INSTALLATION not in str(e):
+        raise
+    # without a DPF installation, only the tests on the stand-in server can run
+    local_server = None
+
+
+def _requires_ansys(error):
+    return local_server is None and NO_ANSYS_INSTALLATION in str(error)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_make_collect_report(collector):
+    """Skip the test modules starting a DPF server without a DPF installation."""
+    outcome = yield
+    report = outcome.get_result()
+    if report.failed and _requires_ansys(report.longrepr):
+        report.outcome = "skipped"
+        report.longrepr = (str(collector.path), None, "Skipped: requires a DPF installation")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Skip the tests starting a DPF server without a DPF installation."""
+    outcome = yield
+    report = outcome.get_result()
+    if call.excinfo is not None and _requires_ansys(call.excinfo.value):
+        report.outcome = "skipped"
+        path, line = item.reportinfo()[:2]
+        report.longrepr = (str(path), line + 1, "Skipped: requires a DPF installation")
+
+
+def _has_field(message, name):
+    return name in message.DESCRIPTOR.fields_by_name
+
+
+# features of the DPF messages used by the client, missing from some versions
+# of ansys-grpc-dpf
+requires_operator_spec = pytest.mark.skipif(
+    not _has_field(operator_pb2.Operator, "spec"),
+    reason="The installed ansys-grpc-dpf has no operator specification.",
+)
+requires_element_properties = pytest.mark.skipif(
+    not hasattr(meshed_region_pb2, "ELEMENT_TYPE"),
+    reason="The installed ansys-grpc-dpf has no element property types.",
+)
+requires_streaming = pytest.mark.skipif(
+    _protos_version() == "2.0",
+    reason="The installed ansys-grpc-dpf does not stream the arrays.",
+)
+
+
+@pytest.fixture(scope="session")
+def stand_in():
+    """Start a stand-in DPF server for the session."""
+    server = StandInServer().start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture(scope="session")
+def stand_in_server(stand_in):
+    """Connect a client, which is not the global server, to the stand-in server."""
+    return stand_in.connect(as_global=False)
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -1,3 +1,4 @@
+import numpy as np
 from ansys.dpf import core as dpf
 
 def test_unit_mesh_cache(simple_bar):
@@ -53,4 +54,29 @@ def test_physics_type_cache(simple_bar):
     res_info.unit_system
     assert len(res_info._cache.cached) == 1
     res_info.physics_type
-    assert len(res_info._cache.cached) == 1
\ No newline at end of file
+    assert len(res_info._cache.cached) == 1
+
+def test_field_metadata_cache():
+    field = dpf.fields_factory.create_3d_vector_field(2)
+    field.data = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+    assert field.shape == (2, 3)
+    misses = field._cache.misses
+    assert field.shape == (2, 3)
+    assert field.size == 6
+    assert field._cache.misses == misses
+    assert field._cache.hits > 0
+    field.append([7.0, 8.0, 9.0], 3)
+    assert field.shape == (3, 3)
+    field.data = [1.0, 2.0, 3.0]
+    assert field.shape == (1, 3)
+    field.data = np.ones((4, 3))
+    assert field.shape == (4, 3)
+
+
+def test_field_metadata_cache_local_field():
+    field = dpf.fields_factory.create_3d_vector_field(2)
+    field.data = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+    assert field.elementary_data_count == 2
+    with field.as_local_field() as f:
+        f.append([7.0, 8.0, 9.0], 3)
+    assert field.elementary_data_count == 3
@@ -88,3 +88,25 @@ def test_meets_version():
     assert not check_version.meets_version("1.31.1", "1.32.1")
     assert not check_version.meets_version("1.31", "1.32")
     assert not check_version.meets_version("1.31.0", "1.31.1")
+
+
+def test_server_capabilities_cached(multishells):
+    model = Model(multishells)
+    server = model._server
+    capabilities = server.capabilities
+    assert server.capabilities is capabilities
+    assert server._base_service is server._base_service
+    assert capabilities.version == check_version.get_server_version(server)
+    assert server.info is capabilities.info
+    assert check_version.server_meet_version(capabilities.version, server)
+
+
+def test_server_capabilities():
+    from ansys.dpf.core.server import ServerCapabilities
+
+    capabilities = ServerCapabilities({"server_version": "2.0"})
+    assert capabilities.version_tuple == (2, 0, 0)
+    assert not capabilities.streaming
+    assert capabilities.meets_version("1.3")
+    assert not capabilities.meets_version("2.1")
+    assert ServerCapabilities({"server_version": "3.0"}).streaming
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from ansys import dpf
+from ansys.dpf.core import chunking, misc
+
+
+@pytest.fixture()
+def chunk_settings():
+    saved = (
+        misc.DEFAULT_ARRAY_CHUNK_SIZE,
+        misc.DEFAULT_FILE_CHUNK_SIZE,
+        misc.MIN_CHUNK_SIZE,
+        misc.MAX_CHUNK_SIZE,
+        misc.ADAPTIVE_CHUNK_SIZE,
+    )
+    yield
+    dpf.core.settings.set_chunk_sizes(*saved)
+
+
+def test_chunk_size_policy_grows_while_throughput_improves(chunk_settings):
+    dpf.core.settings.set_chunk_sizes(arrays=2**16, min_size=2**14, max_size=2**18)
+    policy = chunking.ChunkSizePolicy("arrays")
+    assert policy.chunk_size() == 2**16
+    assert policy.n_items(8) == 2**13
+    policy.record(2**20, 1.0)
+    assert policy.chunk_size() == 2**17
+    policy.record(2**20, 0.5)
+    assert policy.chunk_size() == 2**18
+    # bounded by the maximum
+    policy.record(2**20, 0.25)
+    assert policy.chunk_size() == 2**18
+    # turns back when the throughput drops
+    policy.record(2**20, 1.0)
+    assert policy.chunk_size() == 2**17
+    stats = policy.stats()
+    assert stats["transfers"] == 4
+    assert stats["bytes"] == 2**22
+    assert stats["adaptations"] == 3
+
+
+def test_chunk_size_policy_small_uploads_and_fixed_size(chunk_settings):
+    dpf.core.settings.set_chunk_sizes(arrays=2**16, adaptive=False)
+    policy = chunking.ChunkSizePolicy("arrays", max_message_size=2**15)
+    # bounded by the message size of the server
+    assert policy.chunk_size() == 2**15
+    policy.record(2**20, 1.0)
+    assert policy.chunk_size() == 2**15
+    dpf.core.settings.set_chunk_sizes(arrays=2**12, adaptive=True)
+    assert policy.chunk_size() == 2**12
+    # too few chunks to measure the throughput
+    policy.record(2**13, 1.0)
+    assert policy.chunk_size() == 2**12
+    with pytest.raises(ValueError):
+        chunking.ChunkSizePolicy("meshes")
+
+
+def test_chunk_size_stats_uploads(stand_in_server, chunk_settings, tmpdir):
+    dpf.core.settings.set_chunk_sizes(arrays=2**16, files=2**16, min_size=2**16)
+    before = dpf.core.settings.get_chunk_size_stats(stand_in_server)
+    field = dpf.core.fields_factory.create_scalar_field(2**16, server=stand_in_server)
+    data = np.random.random(2**16)
+    field.data = data
+    assert np.allclose(field.data, data)
+    path = str(tmpdir.join("file.bin"))
+    with open(path, "wb") as f:
+        f.write(bytes(2**19))
+    dpf.core.BaseService(stand_in_server).upload_file_in_tmp_folder(path)
+    stats = dpf.core.settings.get_chunk_size_stats(stand_in_server)
+    assert stats["arrays"]["transfers"] == before["arrays"]["transfers"] + 1
+    assert stats["arrays"]["bytes"] == before["arrays"]["bytes"] + data.nbytes
+    assert stats["arrays"]["chunk_size"] == 2**17
+    assert stats["files"]["bytes"] == before["files"]["bytes"] + 2**19
+    assert stats["files"]["chunk_size"] == 2**17
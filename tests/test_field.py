@@ -80,6 +80,52 @@ def test_set_get_data_array_field():
     assert np.allclose(field.data, data)
 
 
+def test_get_data_in_buffer_field():
+    data = np.random.random((20, 3))
+    field = dpf.core.field_from_array(data)
+    buffer = np.empty(80)
+    out = field.get_data(out=buffer)
+    assert out.shape == (20, 3)
+    assert np.shares_memory(out, buffer)
+    assert np.allclose(out, data)
+    out = field.get_data(read_only=True)
+    assert not out.flags.writeable
+    with pytest.raises(ValueError):
+        field.get_data(out=np.empty(10))
+
+
+def test_get_set_data_float32_field():
+    data = np.random.random((20, 3))
+    field = dpf.core.field_from_array(data)
+    out = field.get_data(dtype=np.float32)
+    assert out.dtype == np.float32
+    assert out.shape == (20, 3)
+    assert np.allclose(out, data, rtol=1e-6)
+    assert np.allclose(field.get_entity_data(2, dtype="float"), data[2], rtol=1e-6)
+    buffer = np.empty(60, dtype=np.float32)
+    assert np.shares_memory(field.get_data(out=buffer, dtype=np.float32), buffer)
+    assert field.get_data().dtype == np.float64
+    field.data = data.astype(np.float32)
+    assert np.allclose(field.data, data, rtol=1e-6)
+    with pytest.raises(ValueError):
+        field.get_data(dtype=np.int64)
+
+
+def test_transfer_precision_field():
+    data = np.random.random((20, 3))
+    field = dpf.core.field_from_array(data)
+    dpf.core.settings.set_transfer_precision(np.float32)
+    try:
+        assert field.data.dtype == np.float32
+        assert np.allclose(field.data, data, rtol=1e-6)
+        assert field.get_data(dtype=np.float64).dtype == np.float64
+        field.data = data
+        assert np.allclose(field.data, data, rtol=1e-6)
+    finally:
+        dpf.core.settings.set_transfer_precision("double")
+    assert field.data.dtype == np.float64
+
+
 def test_append_data_field():
     field = dpf.core.Field(nentities=20, nature=dpf.core.natures.vector)
     for i in range(0, 20):
@@ -576,6 +622,59 @@ def test_local_elemental_nodal_array_field_append():
     assert len(field_to_local._data_pointer) == num_entities
 
 
+def test_local_field_append_many():
+    num_entities = 100
+    field_to_local = dpf.core.fields_factory.create_3d_vector_field(
+        num_entities, location=dpf.core.locations.elemental_nodal
+    )
+    ids = np.arange(1, num_entities + 1)
+    data = np.repeat(ids[:, None] * [0.1, 0.2, 0.3], 2, axis=0)
+    with field_to_local.as_local_field() as f:
+        f.append_many(ids[:50], data[:100])
+        f.append_many(ids[50:], data[100:], offsets=np.arange(51) * 2)
+        assert np.allclose(f.get_entity_data(60), data[120:122])
+    assert np.allclose(field_to_local.data, data)
+    assert np.allclose(field_to_local.scoping.ids, ids)
+    assert np.allclose(field_to_local._data_pointer[:3], [0, 6, 12])
+    assert np.allclose(field_to_local._data_pointer[50:52], [300, 306])
+
+    field_to_local = dpf.core.fields_factory.create_3d_vector_field(num_entities)
+    with field_to_local.as_local_field() as f:
+        f.append_many(ids, data[::2])
+        with pytest.raises(ValueError):
+            f.append_many([1, 2], np.ones(5))
+    assert np.allclose(field_to_local.data, data[::2])
+    assert len(field_to_local._data_pointer) == 0
+
+
+def test_get_entities_data_field(allkindofcomplexity):
+    model = dpf.core.Model(allkindofcomplexity)
+    stress = model.results.stress()
+    f = stress.outputs.fields_container()[0]
+    indices = [5, 0, 12]
+    values, offsets = f.get_entities_data(indices)
+    assert offsets.size == len(indices) + 1
+    for i, index in enumerate(indices):
+        assert np.allclose(
+            values[offsets[i]: offsets[i + 1]], f.get_entity_data(index)
+        )
+    ids = [f.scoping.id(index) for index in indices]
+    values_by_id, offsets_by_id = f.get_entities_data(ids=ids)
+    assert np.allclose(values_by_id, values)
+    assert np.allclose(offsets_by_id, offsets)
+    with f.as_local_field() as local:
+        local_values, local_offsets = local.get_entities_data(indices)
+        assert np.allclose(local_values, values)
+        assert np.allclose(local_offsets, offsets)
+
+    disp = model.results.displacement().outputs.fields_container()[0]
+    data = disp.get_entities_data([3, 1])
+    assert data.shape == (2, 3)
+    assert np.allclose(data[0], disp.get_entity_data(3))
+    with pytest.raises(ValueError):
+        disp.get_entities_data(ids=[-1])
+
+
 def test_local_get_entity_data():
     num_entities = 100
     field_to_local = dpf.core.fields_factory.create_3d_vector_field(
@@ -0,0 +1,45 @@
+import json
+import subprocess
+import sys
+
+from ansys.dpf import core
+
+
+IMPORT_SCRIPT = """
+import json
+import sys
+import time
+
+tstart = time.perf_counter()
+import ansys.dpf.core
+duration = time.perf_counter() - tstart
+print(json.dumps({
+    "duration": duration,
+    "modules": [name for name in ("pyvista", "vtk", "ansys.dpf.core.operators",
+                                  "ansys.dpf.core.examples") if name in sys.modules],
+}))
+"""
+
+
+def _import_in_new_process():
+    output = subprocess.check_output([sys.executable, "-c", IMPORT_SCRIPT])
+    return json.loads(output.decode().strip().splitlines()[-1])
+
+
+def test_import_time():
+    # the best of several runs is used to smooth the file system cache effects
+    results = [_import_in_new_process() for _ in range(3)]
+    duration = min(result["duration"] for result in results)
+    print(f"import ansys.dpf.core: {duration:.3f} s")
+    assert results[0]["modules"] == []
+    assert duration < 2.0
+
+
+def test_lazy_operators_namespace():
+    assert "math" in dir(core.operators)
+    assert core.operators.math.add.__name__ == "add"
+    from ansys.dpf.core.operators import result
+
+    assert result is core.operators.result
+    assert "examples" in dir(core)
+    assert core.examples.simple_bar
@@ -0,0 +1,107 @@
+import json
+
+import grpc
+import numpy as np
+import pytest
+
+from ansys import dpf
+from ansys.dpf.core import instrumentation
+from conftest import requires_operator_spec
+
+
+def test_profiling_records_calls(stand_in_server):
+    data = np.random.random((100_000, 3))
+    with dpf.core.profiling() as prof:
+        field = dpf.core.Field(
+            nentities=100_000, nature=dpf.core.natures.vector, server=stand_in_server
+        )
+        field.data = data
+        assert np.array_equal(field.get_data(dtype=np.float64), data)
+    assert prof.calls > 0
+    assert prof.total_time > 0
+    services = {service for service, _ in prof.stats}
+    assert "FieldService" in services
+    streamed = [
+        stats for (_, method), stats in prof.stats.items() if stats.response_chunks > 1
+    ]
+    assert sum(stats.response_bytes for stats in streamed) >= data.nbytes
+    assert sum(stats.request_bytes for stats in prof.stats.values()) >= data.nbytes
+    for stats in prof.stats.values():
+        assert sum(stats.histogram) == stats.calls
+    report = prof.report()
+    assert "FieldService" in report
+    assert "total" in report.splitlines()[-1]
+    # nothing is recorded outside of the context
+    calls = prof.calls
+    field.data
+    assert prof.calls == calls
+
+
+def test_instrumentation_hooks(stand_in_server):
+    calls = []
+    instrumentation.add_hook(calls.append)
+    try:
+        field = dpf.core.Field(nature=dpf.core.natures.scalar, server=stand_in_server)
+        field.data = [1.0, 2.0, 3.0]
+        assert len(field.data) == 3
+    finally:
+        instrumentation.remove_hook(calls.append)
+    assert len(calls) > 0
+    assert all(isinstance(call, instrumentation.RpcCall) for call in calls)
+    assert all(call.code == grpc.StatusCode.OK for call in calls)
+    assert any(call.request_bytes > 0 for call in calls)
+    count = len(calls)
+    dpf.core.Field(server=stand_in_server)
+    assert len(calls) == count
+
+
+def test_instrumentation_records_errors(stand_in_server):
+    calls = []
+    instrumentation.add_hook(calls.append)
+    try:
+        scoping = dpf.core.Scoping(ids=[1, 2], server=stand_in_server)
+        with pytest.raises(grpc.RpcError):
+            scoping.id(5)
+    finally:
+        instrumentation.remove_hook(calls.append)
+    assert any(call.code == grpc.StatusCode.OUT_OF_RANGE for call in calls)
+
+
+@requires_operator_spec
+def test_trace_timeline(stand_in_server, tmpdir):
+    field = dpf.core.Field(nentities=2, nature=dpf.core.natures.vector, server=stand_in_server)
+    field.data = [3.0, 4.0, 0.0, 6.0, 8.0, 0.0]
+    fc = dpf.core.FieldsContainer(server=stand_in_server)
+    fc.labels = ["time"]
+    fc.add_field({"time": 1}, field)
+    path = str(tmpdir.join("trace.json"))
+    with dpf.core.trace(path) as timeline:
+        norm_fc = dpf.core.Operator("norm_fc", server=stand_in_server)
+        norm_fc.connect(0, fc)
+        out = norm_fc.eval()
+        out[0].data
+    with open(path) as f:
+        events = json.load(f)["traceEvents"]
+    spans = [event for event in events if event["ph"] == "X"]
+    assert len(spans) == len(timeline.events)
+    names = {event["name"] for event in spans}
+    assert "Operator.eval" in names
+    assert "Operator.get_output" in names
+    assert "_data_get_chunk_" in names
+    # the evaluation calls are nested in the evaluation span
+    evaluation = next(event for event in spans if event["name"] == "Operator.eval")
+    assert evaluation["args"]["operator"] == norm_fc.name
+    nested = [
+        event
+        for event in spans
+        if event["cat"] == "rpc"
+        and event["tid"] == evaluation["tid"]
+        and evaluation["ts"] <= event["ts"]
+        and event["ts"] + event["dur"] <= evaluation["ts"] + evaluation["dur"]
+    ]
+    assert any(event["name"] == "OperatorService.Get" for event in nested)
+    assert any(event["ph"] == "M" for event in events)
+    count = len(timeline.events)
+    with instrumentation.span("outside"):
+        out[0].data
+    assert len(timeline.events) == count
@@ -35,6 +35,24 @@ def test_vtk_grid_from_model(simple_bar_model):
     assert all(grid.celltypes == vtk.VTK_HEXAHEDRON)
 
 
+def test_vtk_grid_mixed_elements():
+    from ansys.dpf.core.vtk_helper import dpf_mesh_to_vtk
+
+    nodes = np.random.random((10, 3))
+    # kAnsQuad8, kAnsTri3, kAnsLine2
+    etypes = np.array([6, 14, 18])
+    connectivity = np.array([0, 1, 2, 3, 4, 5, 6, 7, 1, 2, 8, 9, -1])
+    ref_connectivity = connectivity.copy()
+    grid = dpf_mesh_to_vtk(nodes, etypes, connectivity, as_linear=True)
+    assert np.allclose(connectivity, ref_connectivity)
+    assert list(grid.celltypes) == [vtk.VTK_QUAD, vtk.VTK_TRIANGLE, vtk.VTK_LINE]
+    cells = grid.cells
+    assert np.allclose(cells[:9], [8, 0, 1, 2, 3, 0, 1, 2, 3])
+    assert np.allclose(cells[9:], [3, 1, 2, 8, 2, 9, 0])
+    assert np.isnan(grid.points[0]).all()
+    assert not np.isnan(nodes).any()
+
+
 def test_get_element_type_meshedregion(simple_bar_model):
     mesh = simple_bar_model.metadata.meshed_region
     assert mesh.elements.element_by_index(1).type.value == 11
@@ -216,6 +234,29 @@ def test_id_indeces_mapping_on_elements_2(allkindofcomplexity):
     assert mapping[4520] == 2011
 
 
+def test_map_scoping_nodes_elements(allkindofcomplexity):
+    model = dpf.core.Model(allkindofcomplexity)
+    mesh = model.metadata.meshed_region
+    for entities, location in [
+        (mesh.nodes, dpf.core.locations.nodal),
+        (mesh.elements, dpf.core.locations.elemental),
+    ]:
+        ids = entities.scoping.ids
+        scop = dpf.core.Scoping(ids=[ids[5], -1, ids[2], 10 ** 8], location=location)
+        ind, mask = entities.map_scoping(scop)
+        assert ind.dtype == np.int32
+        assert np.allclose(ind, [5, 2])
+        assert np.allclose(mask, [True, False, True, False])
+        mapping = entities.mapping_id_to_index
+        assert mapping[ids[5]] == 5
+        assert -1 not in mapping
+        with pytest.raises(KeyError):
+            mapping[-1]
+    node_ids = mesh.nodes.scoping.ids
+    assert mesh.nodes.node_by_id(node_ids[3]).index == 3
+    assert mesh.elements.element_by_id(ids[3]).index == 3
+
+
 def test_named_selection_mesh(allkindofcomplexity):
     model = dpf.core.Model(allkindofcomplexity)
     mesh = model.metadata.meshed_region
@@ -488,3 +529,62 @@ def test_mesh_deep_copy2(simple_bar_model):
         copy.elements.connectivities_field.scoping.ids,
         mesh.elements.connectivities_field.scoping.ids,
     )
+
+
+def test_create_meshed_region_from_arrays():
+    ref_mesh = test_create_all_shaped_meshed_region()
+    connectivity = ref_mesh.elements.connectivities_field
+    mesh = dpf.core.MeshedRegion.from_arrays(
+        node_ids=ref_mesh.nodes.scoping.ids,
+        coordinates=ref_mesh.nodes.coordinates_field.data,
+        element_ids=ref_mesh.elements.scoping.ids,
+        element_types=ref_mesh.elements.element_types_field.data,
+        connectivity=connectivity.data,
+        offsets=connectivity._data_pointer,
+    )
+    assert mesh.nodes.n_nodes == 11
+    assert mesh.elements.n_elements == 4
+    assert np.allclose(
+        mesh.nodes.coordinates_field.data, ref_mesh.nodes.coordinates_field.data
+    )
+    assert np.allclose(mesh.elements.connectivities_field.data, connectivity.data)
+    assert mesh.elements.element_by_id(4).shape == "solid"
+    assert mesh.elements.element_by_id(3).shape == "beam"
+
+
+def test_deep_copy_meshed_region(simple_bar):
+    model = dpf.core.Model(simple_bar)
+    mesh = model.metadata.meshed_region
+    copy = mesh.deep_copy()
+    assert copy.nodes.scoping.ids == mesh.nodes.scoping.ids
+    assert copy.elements.scoping.ids == mesh.elements.scoping.ids
+    assert np.allclose(
+        copy.nodes.coordinates_field.data, mesh.nodes.coordinates_field.data
+    )
+    assert np.allclose(
+        copy.elements.connectivities_field.data,
+        mesh.elements.connectivities_field.data,
+    )
+    assert np.allclose(
+        copy.elements.element_types_field.data,
+        mesh.elements.element_types_field.data,
+    )
+    assert copy.unit == mesh.unit
+
+
+def test_mesh_topology_cache(simple_bar, tmpdir):
+    dpf.core.settings.set_mesh_topology_cache(True, path=str(tmpdir))
+    try:
+        mesh = dpf.core.Model(simple_bar).metadata.meshed_region
+        grid = mesh.grid
+        ind, mask = mesh.nodes.map_scoping(mesh.nodes.scoping)
+        cached_mesh = dpf.core.Model(simple_bar).metadata.meshed_region
+        cached_ids = cached_mesh.nodes._get_ids()
+        assert isinstance(cached_ids, np.memmap)
+        assert np.allclose(cached_ids, mesh.nodes.scoping.ids)
+        assert np.allclose(cached_mesh.grid.points, grid.points)
+        cached_ind, cached_mask = cached_mesh.nodes.map_scoping(mesh.nodes.scoping)
+        assert np.allclose(cached_ind, ind)
+        assert np.allclose(cached_mask, mask)
+    finally:
+        dpf.core.settings.set_mesh_topology_cache(False)
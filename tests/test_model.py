@@ -184,6 +184,51 @@ def test_result_time_scoping(plate_msup):
     )
 
 
+def test_result_operators_created_lazily(plate_msup):
+    model = dpf.core.Model(plate_msup)
+    disp = model.results.displacement
+    assert disp._result_operator is None
+    assert len(disp.eval()) == 1
+    assert disp._result_operator is not None
+    doc = type(model.results).displacement.__doc__
+    assert "displacement" in doc.lower()
+    key = (model._server.version, disp._result_info.operator_name)
+    assert dpf.core.results._OPERATOR_DOCS[key] == doc
+    assert disp.__doc__ == doc
+    assert isinstance(dpf.core.results.Result.__doc__, str)
+    assert "Result" in dpf.core.results.Result.__doc__
+    results = list(model.results)
+    assert len(results) == len(model.results)
+    assert model.results[len(results) - 1]._result_info == results[-1]._result_info
+
+
+def test_result_time_history(plate_msup):
+    model = dpf.core.Model(plate_msup)
+    disp = model.results.displacement
+    history = disp.time_history([1, 2, 3])
+    assert history.shape == (20, 3, 3)
+    fc = disp.on_all_time_freqs.on_mesh_scoping([1, 2, 3]).eval()
+    for i in range(len(fc)):
+        field = fc.get_field_by_time_id(i + 1)
+        for j, node_id in enumerate([1, 2, 3]):
+            assert np.allclose(history[i, j], field.get_entity_data_by_id(node_id))
+    x = disp.on_time_scoping([2, 5]).time_history(np.array([3, 1]), component=0)
+    assert x.shape == (2, 2, 1)
+    assert np.allclose(x[:, :, 0], history[[1, 4]][:, [2, 0], 0])
+    stress = model.results.stress.on_all_time_freqs
+    with pytest.raises(ValueError):
+        stress.time_history([1, 2])
+    stress_nodal = stress.on_location(dpf.core.locations.nodal).time_history([1, 2])
+    assert stress_nodal.shape == (20, 2, 6)
+    dpf.core.settings.set_transfer_precision("float")
+    try:
+        history_float = disp.time_history([1, 2, 3])
+    finally:
+        dpf.core.settings.set_transfer_precision("double")
+    assert history_float.dtype == np.float32
+    assert np.allclose(history_float, history, rtol=1e-6)
+
+
 def test_result_splitted_subset(allkindofcomplexity):
     model = dpf.core.Model(allkindofcomplexity)
     vol = model.results.elemental_volume
@@ -1061,3 +1061,42 @@ def test_delete_auto_operator():
     del op
     gc.collect()
     assert op_ref() is None
+
+
+def test_operator_specification_shared():
+    from ansys.dpf.core import operator_specification
+
+    op1 = dpf.core.Operator("norm_fc")
+    op2 = dpf.core.Operator("norm_fc")
+    assert op1._specification is op2._specification
+    assert op1.inputs.fields_container.__class__ is op2.inputs.fields_container.__class__
+    assert op1.outputs._get_given_output(["FieldsContainer"]) == [0]
+    assert op1.outputs._get_given_output(["Field"]) == []
+    op2.inputs.fields_container.connect(op1)
+    assert operator_specification.get_specification("norm_fc", op1._server) is (
+        op1._specification
+    )
+    spec = operator_specification.get_specification("min_max_fc", op1._server)
+    assert dpf.core.Operator("min_max_fc")._specification is spec
+    with pytest.raises(errors.DPFServerException):
+        operator_specification.get_specification("not-an-operator", op1._server)
+
+
+def test_operator_output_cache(plate_msup):
+    model = dpf.core.Model(plate_msup)
+    disp = model.results.displacement()
+    norm = dpf.core.operators.math.norm_fc(disp)
+    assert norm.output_cache is None
+    norm.enable_output_cache()
+    fc = norm.outputs.fields_container()
+    assert norm.outputs.fields_container() is fc
+    assert norm.output_cache.hits == 1
+    assert norm.output_cache.misses == 1
+    # a new connection upstream invalidates the cached output
+    disp.inputs.time_scoping.connect([1, 2])
+    fc2 = norm.outputs.fields_container()
+    assert fc2 is not fc
+    assert len(fc2) == 2
+    assert norm.output_cache.misses == 2
+    norm.enable_output_cache(False)
+    assert norm.outputs.fields_container() is not norm.outputs.fields_container()
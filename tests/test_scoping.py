@@ -234,3 +234,31 @@ def test_auto_delete_scoping_local():
     del s
     with scop.as_local_scoping() as s:
         assert s[0] == 1
+
+
+def test_batch_index_id_scoping():
+    scop = Scoping(ids=[4, 8, 2, 9])
+    assert np.allclose(scop.index([2, 4, 5]), [2, 0, -1])
+    assert np.allclose(scop.id([3, 1]), [9, 8])
+    with scop.as_local_scoping() as loc:
+        loc.append(12)
+        ind = loc.index(np.array([12, 9, 1]))
+        assert ind.dtype == np.int32
+        assert np.allclose(ind, [4, 3, -1])
+        assert np.allclose(loc.id(np.array([4, 0])), [12, 4])
+        loc.set_id(0, 5)
+        assert loc.index(4) == -1
+        assert loc.index(5) == 0
+    assert scop.ids == [5, 8, 2, 9, 12]
+
+
+def test_set_operations_scoping():
+    scop = Scoping(ids=[1, 2, 3, 4], location=dpf.core.locations.elemental)
+    other = Scoping(ids=[4, 2, 7])
+    inter = scop.intersection(other)
+    assert inter.ids == [2, 4]
+    assert inter.location == dpf.core.locations.elemental
+    assert scop.union(other).ids == [1, 2, 3, 4, 7]
+    assert scop.difference([4, 2, 7]).ids == [1, 3]
+    with scop.as_local_scoping() as loc:
+        assert loc.union(np.array([5, 5, 1])).ids == [1, 2, 3, 4, 5]
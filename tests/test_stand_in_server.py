@@ -0,0 +1,352 @@
+import gc
+import os
+import time
+
+import numpy as np
+import pytest
+
+from ansys import dpf
+from ansys.dpf.core import errors
+from conftest import requires_element_properties, requires_operator_spec, requires_streaming
+
+
+def test_stand_in_field(stand_in_server):
+    field = dpf.core.Field(nentities=3, nature=dpf.core.natures.vector, server=stand_in_server)
+    data = np.arange(9.0).reshape(3, 3)
+    field.data = data
+    field.scoping = dpf.core.Scoping(ids=[4, 5, 6], location="Nodal", server=stand_in_server)
+    field.unit = "m"
+    assert np.allclose(field.data, data)
+    assert field.shape == (3, 3)
+    assert field.unit == "m"
+    assert field.scoping.ids == [4, 5, 6]
+    assert np.allclose(field.get_entity_data_by_id(5), data[1])
+    out = np.empty(9)
+    assert np.allclose(field.get_data(out=out), data)
+
+
+def test_stand_in_field_float32(stand_in_server):
+    field = dpf.core.Field(nentities=3, nature=dpf.core.natures.vector, server=stand_in_server)
+    data = np.arange(9.0).reshape(3, 3) / 7.0
+    field.data = data.astype(np.float32)
+    assert np.allclose(field.data, data, rtol=1e-6)
+    out = field.get_data(dtype=np.float32)
+    assert out.dtype == np.float32
+    assert np.array_equal(out, data.astype(np.float32))
+    assert field.get_entity_data(1, dtype=np.float32).dtype == np.float32
+    assert field.data_as_list[1] == pytest.approx(data.flat[1], rel=1e-6)
+    dpf.core.settings.set_transfer_precision("float")
+    try:
+        assert field.data_as_list[1] == pytest.approx(data.flat[1], rel=1e-6)
+    finally:
+        dpf.core.settings.set_transfer_precision("double")
+
+
+def test_stand_in_transfer_precision_internal_copies(stand_in_server):
+    data = np.random.random((4, 3))
+    field = dpf.core.Field(nentities=4, nature=dpf.core.natures.vector, server=stand_in_server)
+    field.data = data
+    field.scoping = dpf.core.Scoping(ids=[1, 2, 3, 4], location="Nodal", server=stand_in_server)
+    dpf.core.settings.set_transfer_precision("float")
+    try:
+        with field.as_local_field() as local:
+            assert local.data.dtype == np.float64
+            assert local.get_entity_data(1, dtype=np.float32).dtype == np.float32
+        # the local scoping is released again when it is collected
+        del local
+        gc.collect()
+        assert np.array_equal(field.get_data(dtype=np.float64), data)
+        out = np.empty(field.size)
+        assert np.array_equal(field.get_data(out=out), data)
+        copy = field.deep_copy(server=stand_in_server)
+        assert np.array_equal(copy.get_data(dtype=np.float64), data)
+        assert field.data.dtype == np.float32
+    finally:
+        dpf.core.settings.set_transfer_precision("double")
+
+
+@requires_streaming
+def test_stand_in_float32_not_honoured():
+    from ansys.dpf.core.stand_in_server import StandInServer
+
+    with StandInServer(float32=False) as stand_in:
+        server = stand_in.connect(as_global=False)
+        field = dpf.core.Field(nentities=3, nature=dpf.core.natures.scalar, server=server)
+        data = np.array([1.0, 2.0, 3.0]) / 7.0
+        field.data = data
+        assert server.capabilities.float32
+        field_data = field.get_data(dtype=np.float32)
+        assert field_data.dtype == np.float32
+        assert np.allclose(field_data, data, rtol=1e-6)
+        assert not server.capabilities.float32
+        del field
+
+
+def test_stand_in_field_to_from_file(stand_in_server, tmpdir):
+    data = np.random.random((50_000, 3))
+    field = dpf.core.Field(
+        nentities=50_000, nature=dpf.core.natures.vector, server=stand_in_server
+    )
+    field.data = data
+    path = os.path.join(tmpdir, "field.npy")
+    dpf.core.settings.set_chunk_sizes(arrays=2**16)
+    try:
+        field.to_file(path)
+        assert np.array_equal(np.load(path), data)
+        field.to_file(path, dtype=np.float32)
+        assert np.array_equal(np.load(path), data.astype(np.float32))
+    finally:
+        dpf.core.settings.set_chunk_sizes(arrays=524288)
+    with pytest.raises(ValueError):
+        field.to_file(path, format="csv")
+    np.save(path, data)
+    copy = dpf.core.Field.from_file(path, server=stand_in_server)
+    assert copy.shape == (50_000, 3)
+    assert copy.scoping.ids[-1] == 50_000
+    assert np.array_equal(copy.data, data)
+    # the memory-mapped data is cast while it is sent
+    mapped = np.load(path, mmap_mode="r")
+    dpf.core.settings.set_transfer_precision("float")
+    try:
+        copy.data = mapped
+    finally:
+        dpf.core.settings.set_transfer_precision("double")
+    assert np.allclose(copy.data, data, rtol=1e-6)
+
+
+def test_stand_in_entities_data_cached(stand_in_server):
+    field = dpf.core.Field(nentities=3, nature=dpf.core.natures.vector, server=stand_in_server)
+    field.data = np.arange(9.0)
+    field.scoping = dpf.core.Scoping(ids=[1, 2, 3], location="Nodal", server=stand_in_server)
+
+    def values(*args, **kwargs):
+        # the offsets are returned with the values when the field has a data pointer
+        entities_data = field.get_entities_data(*args, **kwargs)
+        return entities_data[0] if isinstance(entities_data, tuple) else entities_data
+
+    with dpf.core.profiling() as prof:
+        assert np.array_equal(values([2, 0]), [[6, 7, 8], [0, 1, 2]])
+        assert np.array_equal(values(ids=[2]), [[3, 4, 5]])
+    # the data is only downloaded once
+    assert prof.stats[("FieldService", "List")].calls == 1
+    field.data = np.arange(9.0) + 1.0
+    assert np.array_equal(values([0]), [[1, 2, 3]])
+    dpf.core.settings.set_transfer_precision("float")
+    try:
+        assert values([0]).dtype == np.float32
+    finally:
+        dpf.core.settings.set_transfer_precision("double")
+    assert values([0]).dtype == np.float64
+
+
+def test_stand_in_property_field(stand_in_server):
+    field = dpf.core.PropertyField(server=stand_in_server)
+    field.append([1, 2], 10)
+    field.append([3], 20)
+    assert field.elementary_data_count == 2
+    assert np.array_equal(field.data, [1, 2, 3])
+    assert np.array_equal(field.get_entity_data(1), [3])
+
+
+@requires_operator_spec
+def test_stand_in_operators(stand_in_server):
+    field = dpf.core.Field(nentities=2, nature=dpf.core.natures.vector, server=stand_in_server)
+    field.data = [3.0, 4.0, 0.0, 6.0, 8.0, 0.0]
+    norm = dpf.core.Operator("norm", server=stand_in_server)
+    norm.connect(0, field)
+    add = dpf.core.Operator("add", server=stand_in_server)
+    add.connect(0, norm, 0)
+    add.connect(1, 1.0)
+    assert np.allclose(add.get_output(0, dpf.core.types.field).data, [6.0, 11.0])
+
+    fc = dpf.core.FieldsContainer(server=stand_in_server)
+    fc.labels = ["time"]
+    fc.add_field({"time": 1}, field)
+    fc.add_field({"time": 2}, field)
+    norm_fc = dpf.core.Operator("norm_fc", server=stand_in_server)
+    norm_fc.connect(0, fc)
+    out = norm_fc.outputs.fields_container()
+    assert len(out) == 2
+    assert out.get_label_space(1) == {"time": 2}
+    assert np.allclose(out[1].data, [5.0, 10.0])
+
+    with pytest.raises(errors.DPFServerException):
+        dpf.core.Operator("stress", server=stand_in_server)
+
+
+@requires_operator_spec
+def test_stand_in_operator_docs(stand_in_server):
+    from ansys.dpf.core import results
+
+    doc = results._operator_doc("norm", stand_in_server)
+    assert doc
+    assert results._OPERATOR_DOCS[(stand_in_server.version, "norm")] == doc
+    # a missing operator is not cached, it could be loaded later
+    assert results._operator_doc("not-an-operator", stand_in_server) == ""
+    assert (stand_in_server.version, "not-an-operator") not in results._OPERATOR_DOCS
+
+
+@requires_operator_spec
+def test_stand_in_deferred_connection_keeps_input(stand_in_server):
+    def make_field():
+        field = dpf.core.Field(nentities=2, nature=dpf.core.natures.scalar, server=stand_in_server)
+        field.data = [3.0, 4.0]
+        return field
+
+    dpf.core.settings.set_deferred_connections(True)
+    try:
+        op = dpf.core.Operator("forward", server=stand_in_server)
+        op.connect(0, make_field())
+        gc.collect()
+        assert np.allclose(op.get_output(0, dpf.core.types.field).data, [3.0, 4.0])
+    finally:
+        dpf.core.settings.set_deferred_connections(False)
+
+
+@requires_element_properties
+def test_stand_in_meshed_region(stand_in_server):
+    mesh = dpf.core.MeshedRegion(num_nodes=4, num_elements=1, server=stand_in_server)
+    coordinates = [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [1.0, 1.0, 0.0], [0.0, 1.0, 0.0]]
+    mesh.nodes.add_nodes_from_arrays([1, 2, 3, 4], coordinates)
+    mesh.elements.add_elements_from_arrays(
+        [1], [dpf.core.element_types.QuadShell4], [0, 1, 2, 3], [0]
+    )
+    assert mesh.nodes.n_nodes == 4
+    assert mesh.elements.element_by_id(1).type == dpf.core.element_types.QuadShell4
+    assert mesh.elements.has_shell_elements
+    assert np.allclose(mesh.nodes.coordinates_field.data, coordinates)
+    assert np.array_equal(mesh.elements.connectivities_field.get_entity_data(0), [0, 1, 2, 3])
+
+
+def test_stand_in_file_transfer(stand_in_server, tmpdir):
+    base = dpf.core.BaseService(stand_in_server)
+    path = os.path.join(tmpdir, "file.bin")
+    content = os.urandom(1_500_000)
+    with open(path, "wb") as f:
+        f.write(content)
+    server_path = base.upload_file_in_tmp_folder(path)
+    downloaded = os.path.join(tmpdir, "downloaded.bin")
+    base.download_file(server_path, downloaded)
+    with open(downloaded, "rb") as f:
+        assert f.read() == content
+
+
+def test_stand_in_folder_transfer(stand_in_server, tmpdir):
+    base = dpf.core.BaseService(stand_in_server)
+    folder = os.path.join(tmpdir, "folder")
+    os.makedirs(os.path.join(folder, "subdir"))
+    contents = {}
+    for i, name in enumerate(["a.rst", "b.bin", "c.rst", os.path.join("subdir", "d.rst")]):
+        contents[name] = os.urandom(100_000 * (i + 1))
+        with open(os.path.join(folder, name), "wb") as f:
+            f.write(contents[name])
+    server_folder = os.path.join(tmpdir, "server")
+    dpf.core.settings.set_file_transfers(max_workers=3, read_ahead=2)
+    try:
+        server_paths = base.upload_files_in_folder(server_folder, folder)
+    finally:
+        dpf.core.settings.set_file_transfers(max_workers=4, read_ahead=4)
+    assert sorted(server_paths) == sorted(
+        os.path.join(server_folder, name) for name in contents
+    )
+    downloaded = os.path.join(tmpdir, "downloaded")
+    os.makedirs(downloaded)
+    client_paths = base.download_files_in_folder(server_folder, downloaded, "rst")
+    assert len(client_paths) == 3
+    for name, content in contents.items():
+        path = os.path.join(downloaded, name)
+        if name.endswith(".rst"):
+            with open(path, "rb") as f:
+                assert f.read() == content
+        else:
+            assert not os.path.exists(path)
+
+
+def test_stand_in_upload_cache(stand_in_server, tmpdir):
+    base = dpf.core.BaseService(stand_in_server)
+
+    def uploads():
+        return dpf.core.settings.get_chunk_size_stats(stand_in_server)["files"]["transfers"]
+
+    path = os.path.join(tmpdir, "file.rst")
+    content = os.urandom(1_200_000)
+    with open(path, "wb") as f:
+        f.write(content)
+    # the cache is disabled by default
+    before = uploads()
+    server_path = base.upload_file_in_tmp_folder(path)
+    assert base.upload_file_in_tmp_folder(path) == server_path
+    assert uploads() == before + 2
+    dpf.core.settings.set_upload_cache(True)
+    try:
+        before = uploads()
+        assert base.upload_file_in_tmp_folder(path) == server_path
+        assert base.upload_file_in_tmp_folder(path) == server_path
+        assert uploads() == before + 1
+        # another name is uploaded
+        other_path = base.upload_file_in_tmp_folder(path, "other.rst")
+        assert other_path != server_path
+        assert uploads() == before + 2
+        # a modified file is uploaded again, and replaces the previous one
+        other_content = content[:-10] + os.urandom(10)
+        with open(path, "wb") as f:
+            f.write(other_content)
+        assert base.upload_file_in_tmp_folder(path) == server_path
+        assert uploads() == before + 3
+        with open(path, "wb") as f:
+            f.write(content)
+        assert base.upload_file_in_tmp_folder(path) == server_path
+        assert uploads() == before + 4
+        # a server file changed from its first chunk is uploaded again
+        with open(server_path, "r+b") as f:
+            f.write(bytes([content[0] ^ 1]))
+        assert base.upload_file_in_tmp_folder(path) == server_path
+        assert uploads() == before + 5
+        # a file removed from the server is uploaded again
+        os.remove(server_path)
+        assert base.upload_file_in_tmp_folder(path) == server_path
+        assert uploads() == before + 6
+        with open(server_path, "rb") as f:
+            assert f.read() == content
+    finally:
+        dpf.core.settings.set_upload_cache(False)
+
+
+def test_file_digest_sampling(tmpdir):
+    from ansys.dpf.core import core
+
+    path = os.path.join(tmpdir, "file.bin")
+    content = bytearray(os.urandom(3 * core._N_SAMPLES * core._SAMPLE_SIZE // 2))
+    with open(path, "wb") as f:
+        f.write(content)
+    digest = core._file_digest(path)
+    dpf.core.settings.set_upload_cache(True, sampling=2**20)
+    try:
+        sampled = core._file_digest(path)
+        assert sampled != digest
+        # a change between the samples is not detected
+        content[core._SAMPLE_SIZE + 1] ^= 1
+        with open(path, "wb") as f:
+            f.write(content)
+        assert core._file_digest(path) == sampled
+    finally:
+        dpf.core.settings.set_upload_cache(False)
+    assert core._file_digest(path) != digest
+
+
+def test_stand_in_latency_and_bandwidth(stand_in, stand_in_server):
+    scoping = dpf.core.Scoping(server=stand_in_server)
+    stand_in.latency = 0.05
+    try:
+        tstart = time.perf_counter()
+        scoping.location
+        assert time.perf_counter() - tstart >= 0.05
+    finally:
+        stand_in.latency = 0.0
+    stand_in.bandwidth = 4e6
+    try:
+        tstart = time.perf_counter()
+        scoping.ids = np.arange(100_000)
+        assert time.perf_counter() - tstart >= 0.1
+    finally:
+        stand_in.bandwidth = None
@@ -521,3 +521,51 @@ def main():
 
 if __name__ == "__main__":
     main()
+
+
+def test_deferred_connections_workflow():
+    dpf.core.settings.set_deferred_connections(True)
+    try:
+        field = dpf.core.fields_factory.field_from_array(
+            np.array([[1.0, 2.0, 2.0], [0.0, 3.0, 4.0]])
+        )
+        norm = dpf.core.operators.math.norm(field)
+        scale = dpf.core.operators.math.scale(norm, 2.0)
+        assert norm._pending_connections
+        assert np.allclose(scale.outputs.field().data, [6.0, 10.0])
+        assert not norm._pending_connections and not scale._pending_connections
+
+        # reconnecting a pin only keeps the last connection
+        scale.inputs.ponderation.connect(3.0)
+        scale.inputs.ponderation.connect(4.0)
+        wf = dpf.core.Workflow()
+        wf.add_operators([norm, scale])
+        wf.set_output_name("out", scale.outputs.field)
+        assert np.allclose(
+            wf.get_output("out", dpf.core.types.field).data, [12.0, 20.0]
+        )
+    finally:
+        dpf.core.settings.set_deferred_connections(False)
+
+
+def test_deferred_connections_record_workflow():
+    dpf.core.settings.set_deferred_connections(True)
+    try:
+        field = dpf.core.fields_factory.field_from_array(
+            np.array([[1.0, 2.0, 2.0], [0.0, 3.0, 4.0]])
+        )
+        norm = dpf.core.operators.math.norm(field)
+        scale = dpf.core.operators.math.scale(norm, 2.0)
+        wf = dpf.core.Workflow()
+        wf.add_operators([norm, scale])
+        wf.set_output_name("out", scale.outputs.field)
+        assert wf._deferred_operators
+        wf_id = wf.record()
+        assert not wf._deferred_operators
+        assert not norm._pending_connections and not scale._pending_connections
+        recorded = dpf.core.Workflow.get_recorded_workflow(wf_id)
+        assert np.allclose(
+            recorded.get_output("out", dpf.core.types.field).data, [6.0, 10.0]
+        )
+    finally:
+        dpf.core.settings.set_deferred_connections(False)